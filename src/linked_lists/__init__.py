@@ -0,0 +1,70 @@
+"""
+Every list, stack and queue in this collection, importable from one place:
+
+    from src.linked_lists import DoublyLinkedList, DequeQueue, ListStack
+
+Importing this package doesn't import any of the backends. Each name is looked up
+in _LAZY_ATTRIBUTES the first time it is used (PEP 562 module __getattr__), and only
+then is its module imported, so a program only pays for the backends it touches.
+"""
+import importlib
+
+# public name -> (module inside this package, attribute in that module)
+_LAZY_ATTRIBUTES = {
+    # lists
+    "LinkedList": ("singly_linked_list.singly_linked_list", "LinkedList"),
+    "DoublyLinkedList": ("doubly_linked_list.doubly_linked_list", "DoublyLinkedList"),
+    "SentinelDoublyLinkedList": ("doubly_linked_list.sentinel_doubly_linked_list", "SentinelDoublyLinkedList"),
+    "LazyDoublyLinkedList": ("doubly_linked_list.lazy_doubly_linked_list", "LazyDoublyLinkedList"),
+    "SnapshotDoublyLinkedList": ("doubly_linked_list.snapshot_doubly_linked_list", "SnapshotDoublyLinkedList"),
+
+    # structures built on DoublyLinkedList
+    "LFUCache": ("doubly_linked_list.lfu_cache", "LFUCache"),
+    "TTLCache": ("doubly_linked_list.ttl_cache", "TTLCache"),
+    "TimerWheel": ("doubly_linked_list.timer_wheel", "TimerWheel"),
+    "parallel_map_reduce": ("doubly_linked_list.parallel_reduce", "parallel_map_reduce"),
+    "parallel_max": ("doubly_linked_list.parallel_reduce", "parallel_max"),
+    "parallel_min": ("doubly_linked_list.parallel_reduce", "parallel_min"),
+    "parallel_sum": ("doubly_linked_list.parallel_reduce", "parallel_sum"),
+    "parallel_count_if": ("doubly_linked_list.parallel_reduce", "parallel_count_if"),
+
+    # stacks (every backend's class is called Stack, so each gets its own name here)
+    "DequeStack": ("stack.stack_deque", "Stack"),
+    "ListStack": ("stack.stack_list", "Stack"),
+    "SinglyLinkedStack": ("stack.stack_linked_singly", "Stack"),
+    "DoublyLinkedStack": ("stack.stack_linked_doubly", "Stack"),
+    "WorkStealingDeque": ("stack.stack_work_stealing", "WorkStealingDeque"),
+    "WorkStealingExecutor": ("stack.stack_work_stealing", "WorkStealingExecutor"),
+
+    # queues (same story, every backend's class is called Queue)
+    "DequeQueue": ("queue.queue_deque", "Queue"),
+    "ListQueue": ("queue.queue_list", "Queue"),
+    "SinglyLinkedQueue": ("queue.queue_linked_singly", "Queue"),
+    "DoublyLinkedQueue": ("queue.queue_linked_doubly", "Queue"),
+    "PersistentQueue": ("queue.queue_persistent", "Queue"),
+    "SpillQueue": ("queue.queue_spill", "Queue"),
+    "SlidingWindow": ("queue.queue_sliding_window", "SlidingWindow"),
+    "MultiLevelQueue": ("queue.queue_multilevel", "MultiLevelQueue"),
+    "DelayQueue": ("queue.queue_delay", "DelayQueue"),
+    "BoundedQueue": ("queue.queue_pipeline", "BoundedQueue"),
+    "Pipeline": ("queue.queue_pipeline", "Pipeline"),
+    "Stage": ("queue.queue_pipeline", "Stage"),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), attribute)
+
+    # cache it on the package so __getattr__ isn't called for this name again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
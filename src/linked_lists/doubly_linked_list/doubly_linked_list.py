@@ -1,3 +1,4 @@
+import copy
 from typing import Optional
 
 
@@ -32,6 +33,26 @@ class Node:
         return f"Node({self.value})"
 
 
+def seen_before():
+    """
+    Returns a predicate that is True for a value it has already been called with
+
+    Passing it to remove_if keeps the first occurrence of every value and removes
+    the rest, which is how every list in this collection implements dedupe.
+    Values must be hashable.
+    """
+
+    seen = set()
+
+    def is_duplicate(value):
+        if value in seen:
+            return True
+        seen.add(value)
+        return False
+
+    return is_duplicate
+
+
 class DoublyLinkedList:
     """
     A class implementation of a Doubly-Linked-List
@@ -76,6 +97,53 @@ class DoublyLinkedList:
 
         return self.size
 
+    def __iter__(self):
+        """yields each new_value in the list, from head to tail"""
+
+        current_node = self.head
+        while current_node is not None:
+            yield current_node.value
+            current_node = current_node.next
+
+    def __reduce__(self):
+        """
+        Tells pickle (and copy) to store this list as a flat list of values
+
+        The default would pickle Node by Node, following .next and .prev
+        recursively, which blows past the recursion limit on long lists.
+        """
+
+        return self.__class__, (list(self),)
+
+    def __deepcopy__(self, memo):
+        """copies the list one node at a time, instead of recursing through the nodes"""
+
+        copied = self.__class__()
+        memo[id(self)] = copied
+
+        for value in self:
+            copied.add_to_tail(copy.deepcopy(value, memo))
+
+        return copied
+
+    def clear(self):
+        """
+        Removes every node from the list
+
+        Each node's prev and next point at each other, so a dropped list is a big
+        reference cycle that only the cyclic garbage collector can free. Cutting every
+        node's links here means each node is freed as soon as we move past it.
+        """
+
+        current_node = self.head
+        self.head = self.tail = None
+        self.size = 0
+
+        while current_node is not None:
+            next_node = current_node.next
+            current_node.prev = current_node.next = None  # _remove any ties to list
+            current_node = next_node
+
     def add_to_head(self, value):
         """inserts a Node with the given new_value as the new head of the list"""
 
@@ -178,6 +246,139 @@ class DoublyLinkedList:
         self.size -= 1  # decrease size (deleting el)
         return tail_to_remove.value  # return new_value of removed tail
 
+    def add_many_to_head(self, values):
+        """
+        Adds each of the given values to the head of the list, in order
+
+        Ends up the same as calling add_to_head once per value (so the last value
+        becomes the head), but the new nodes are chained together first and then
+        spliced onto the list in one go.
+        """
+
+        first = last = None
+        count = 0
+
+        for value in values:
+            # each new node goes in front of the one before it
+            new_node = Node(value, None, first)
+            if first is None:
+                last = new_node
+            else:
+                first.prev = new_node
+            first = new_node
+            count += 1
+
+        if count == 0:  # nothing to add
+            return
+
+        if self.size == 0:
+            self.tail = last
+        else:
+            last.next = self.head
+            self.head.prev = last
+
+        self.head = first
+        self.size += count
+
+    def add_many_to_tail(self, values):
+        """
+        Adds each of the given values to the tail of the list, in order
+
+        Ends up the same as calling add_to_tail once per value, but the new nodes
+        are chained together first and then spliced onto the list in one go.
+        """
+
+        first = last = None
+        count = 0
+
+        for value in values:
+            new_node = Node(value, last)
+            if last is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+            count += 1
+
+        if count == 0:  # nothing to add
+            return
+
+        if self.size == 0:
+            self.head = first
+        else:
+            self.tail.next = first
+            first.prev = self.tail
+
+        self.tail = last
+        self.size += count
+
+    def remove_many_from_head(self, n):
+        """
+        Removes up to n nodes from the head of the list
+
+        Returns the removed values as a list, in the order they were removed.
+        """
+
+        values = []
+        current_node = self.head
+
+        while current_node is not None and len(values) < n:
+            values.append(current_node.value)
+            next_node = current_node.next
+            current_node.prev = current_node.next = None  # _remove any ties to list
+            current_node = next_node
+
+        # current_node is the first node we kept (or None if we removed everything)
+        self.head = current_node
+        if current_node is None:
+            self.tail = None
+        else:
+            current_node.prev = None
+
+        self.size -= len(values)
+        return values
+
+    def remove_many_from_tail(self, n):
+        """
+        Removes up to n nodes from the tail of the list
+
+        Returns the removed values as a list, in the order they were removed.
+        """
+
+        values = []
+        current_node = self.tail
+
+        while current_node is not None and len(values) < n:
+            values.append(current_node.value)
+            prev_node = current_node.prev
+            current_node.prev = current_node.next = None  # _remove any ties to list
+            current_node = prev_node
+
+        # current_node is the last node we kept (or None if we removed everything)
+        self.tail = current_node
+        if current_node is None:
+            self.head = None
+        else:
+            current_node.next = None
+
+        self.size -= len(values)
+        return values
+
+    def insert_after(self, node, value):
+        """wraps the given new_value in a Node and inserts it directly after the given node"""
+
+        # if node is the tail, this is the same as adding to tail
+        if node is self.tail:
+            self.add_to_tail(value)
+            return
+
+        # else, node has a next node, and new_node goes between the two of them
+        new_node = Node(value, node, node.next)
+        node.next.prev = new_node  # next node now comes after new_node
+        node.next = new_node  # and node now comes before new_node
+
+        self.size += 1  # increase size of list
+
     def move_to_front(self, node):
         """Relocates given node from its size location to front of list"""
 
@@ -323,12 +524,14 @@ class DoublyLinkedList:
                 # then we need to update our head pointer
                 # b/c we're deleting size head!
                 self.head = node.next  # shift head right
+                self.head.prev = None  # nothing comes before the new head
 
             # else if node to delete is tail
             elif self.tail is node:
                 # then we need to update our tail pointer
                 # b/c we're about to delete the size tail
                 self.tail = node.prev  # reassign tail to be element before tail
+                self.tail.next = None  # nothing comes after the new tail
 
             # else, node is neither head nor tail
             # meaning node must be in the middle!
@@ -337,9 +540,95 @@ class DoublyLinkedList:
                 node.prev.next = node.next
                 node.next.prev = node.prev
 
+        node.prev = node.next = None  # _remove any ties to list
         self.size -= 1  # reduce size by 1 (we're deleting)
         return removed_value
 
+    def reverse(self):
+        """Reverses the order of the list in place, without creating any new nodes"""
+
+        current_node = self.head
+
+        # every node just swaps its prev and next pointers
+        while current_node is not None:
+            current_node.prev, current_node.next = current_node.next, current_node.prev
+            # the old next is now stored in .prev
+            current_node = current_node.prev
+
+        # and the ends trade places
+        self.head, self.tail = self.tail, self.head
+
+    def rotate(self, k=1):
+        """
+        Rotates the list k steps to the right in place (like collections.deque.rotate)
+
+        rotate(1) on [1, 2, 3] gives [3, 1, 2]. A negative k rotates to the left.
+        Finding the node to split at takes at most size / 2 steps; the rotation itself
+        is just a few pointer swaps.
+        """
+
+        # a list of 0 or 1 nodes looks the same however you rotate it
+        if self.size < 2:
+            return
+
+        k %= self.size
+        if k == 0:
+            return
+
+        # the node that will become the new head is k nodes from the end,
+        # so walk to it from whichever end is closer
+        if k <= self.size // 2:
+            new_head = self.tail
+            for _ in range(k - 1):
+                new_head = new_head.prev
+        else:
+            new_head = self.head
+            for _ in range(self.size - k):
+                new_head = new_head.next
+
+        new_tail = new_head.prev
+
+        # join the old ends together, making the list a loop...
+        self.tail.next = self.head
+        self.head.prev = self.tail
+
+        # ...then cut the loop open right before new_head
+        new_tail.next = None
+        new_head.prev = None
+        self.head = new_head
+        self.tail = new_tail
+
+    def remove_if(self, predicate):
+        """
+        Deletes every node whose value makes predicate(value) truthy, in one pass
+
+        :return: the number of nodes removed
+        """
+
+        removed = 0
+        current_node = self.head
+
+        while current_node is not None:
+            # grab next before delete() clears it
+            next_node = current_node.next
+            if predicate(current_node.value):
+                self.delete(current_node)
+                removed += 1
+            current_node = next_node
+
+        return removed
+
+    def dedupe(self):
+        """
+        Deletes every node whose value already appeared earlier in the list, in one pass
+
+        Values must be hashable.
+
+        :return: the number of nodes removed
+        """
+
+        return self.remove_if(seen_before())
+
     def get_max(self):
         """finds and returns the maximum new_value of all the nodes in the list."""
 
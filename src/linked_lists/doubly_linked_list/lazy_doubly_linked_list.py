@@ -0,0 +1,262 @@
+import copy
+from typing import Optional
+
+from src.linked_lists.doubly_linked_list.doubly_linked_list import DoublyLinkedList
+
+
+class LazyDoublyLinkedList(DoublyLinkedList):
+    """
+    A DoublyLinkedList that can delete nodes lazily, by marking them as dead "tombstones"
+
+    mark_deleted(node) just sets node.dead = True, which is O(1) and doesn't touch
+    any pointers, so code walking the list over that node isn't affected. Dead nodes
+    are skipped by iteration, len(), remove_head/remove_tail and get_max.
+
+    Dead nodes are actually unlinked by compact(), which can be limited to a fixed
+    number of nodes per call and picks up where the last call stopped. Whenever more
+    than compact_threshold of the nodes are dead, each mark_deleted also runs one
+    compact step.
+
+    Unlinked tombstones keep their .next pointer, so an iterator standing on one
+    when it is compacted can still continue into the list.
+
+    Note that .size counts every node still linked (dead or alive); len() counts
+    only live nodes.
+    """
+
+    def __init__(self, node_list: Optional[list] = None, compact_threshold=0.5, compact_step=64):
+        """
+        Constructs an instance of LazyDoublyLinkedList class.
+
+        :param node_list: an optional list of values to initialize the list with
+        :param compact_threshold: fraction of dead nodes above which mark_deleted compacts
+        :param compact_step: the most nodes a compact step triggered by mark_deleted looks at
+        """
+        self.dead = 0  # number of dead nodes still linked into list
+        self.compact_threshold = compact_threshold
+        self.compact_step = compact_step
+        self.compact_cursor = None  # where the next compact() call starts
+
+        super().__init__(node_list)
+
+    def __repr__(self):
+        """Returns a string representation of the live nodes in this LazyDoublyLinkedList"""
+
+        live_nodes = []
+        current_node = self.head
+        while current_node is not None:
+            if not getattr(current_node, "dead", False):
+                live_nodes.append(repr(current_node))
+            current_node = current_node.next
+
+        return f"DLL=[{' -> '.join(live_nodes)}]"
+
+    def __len__(self):
+        """returns the number of live nodes in list"""
+
+        return self.size - self.dead
+
+    def __iter__(self):
+        """yields each live new_value in the list, from head to tail"""
+
+        current_node = self.head
+        while current_node is not None:
+            if not getattr(current_node, "dead", False):
+                yield current_node.value
+            current_node = current_node.next
+
+    def __reduce__(self):
+        """pickles the live values together with the compaction settings"""
+
+        return self.__class__, (list(self), self.compact_threshold, self.compact_step)
+
+    def __deepcopy__(self, memo):
+        """copies the live values one node at a time, keeping the compaction settings"""
+
+        copied = self.__class__(compact_threshold=self.compact_threshold, compact_step=self.compact_step)
+        memo[id(self)] = copied
+
+        for value in self:
+            copied.add_to_tail(copy.deepcopy(value, memo))
+
+        return copied
+
+    def mark_deleted(self, node):
+        """
+        Marks the given node as deleted without unlinking it
+
+        :return: the node's value, or None if it was already deleted
+        """
+
+        # already dead, or not part of any list
+        if node is None or getattr(node, "dead", False):
+            return None
+        if node.next is None and node.prev is None and node is not self.head:
+            return None
+
+        node.dead = True
+        self.dead += 1
+
+        if self.dead > self.compact_threshold * self.size:
+            self.compact(self.compact_step)
+
+        return node.value
+
+    def compact(self, max_nodes=None):
+        """
+        Unlinks dead nodes, looking at no more than max_nodes nodes
+
+        Call it repeatedly (or with no limit) to clean up the whole list.
+
+        :return: the number of dead nodes unlinked
+        """
+
+        current_node = self.compact_cursor
+
+        # an unlimited call has to see every node, so it always starts from the head;
+        # so does a call without a cursor, or whose cursor node was removed from list
+        if (max_nodes is None or current_node is None
+                or (current_node.prev is None and current_node is not self.head)):
+            current_node = self.head
+
+        removed = 0
+        looked_at = 0
+
+        while current_node is not None and (max_nodes is None or looked_at < max_nodes):
+            next_node = current_node.next
+            if getattr(current_node, "dead", False):
+                self._unlink_tombstone(current_node)
+                removed += 1
+            current_node = next_node
+            looked_at += 1
+
+        # None means we reached the end, so the next call starts again at head
+        self.compact_cursor = current_node
+        return removed
+
+    def remove_head(self):
+        """Removes the first live node (and any tombstones before it) and returns its value"""
+
+        while self.head is not None and getattr(self.head, "dead", False):
+            self._unlink_tombstone(self.head)
+
+        return super().remove_head()
+
+    def remove_tail(self):
+        """Removes the last live node (and any tombstones after it) and returns its value"""
+
+        while self.tail is not None and getattr(self.tail, "dead", False):
+            self._unlink_tombstone(self.tail)
+
+        return super().remove_tail()
+
+    def remove_many_from_head(self, n):
+        """Removes up to n live nodes from the head of the list and returns their values"""
+
+        return [self.remove_head() for _ in range(min(n, len(self)))]
+
+    def remove_many_from_tail(self, n):
+        """Removes up to n live nodes from the tail of the list and returns their values"""
+
+        return [self.remove_tail() for _ in range(min(n, len(self)))]
+
+    def remove_if(self, predicate):
+        """Deletes every live node whose value makes predicate(value) truthy, in one pass"""
+
+        removed = 0
+        current_node = self.head
+
+        while current_node is not None:
+            next_node = current_node.next
+            if not getattr(current_node, "dead", False) and predicate(current_node.value):
+                super().delete(current_node)
+                removed += 1
+            current_node = next_node
+
+        return removed
+
+    def delete(self, node):
+        """Deletes the given node right away (tombstones are already deleted, so they are ignored)"""
+
+        if getattr(node, "dead", False):
+            return None
+
+        return super().delete(node)
+
+    def move_to_front(self, node):
+        if getattr(node, "dead", False):
+            return
+
+        super().move_to_front(node)
+
+    def move_to_end(self, node):
+        if getattr(node, "dead", False):
+            return
+
+        super().move_to_end(node)
+
+    def insert_after(self, node, value):
+        """
+        Inserts value directly after the given live node
+
+        A tombstone is already deleted (and once compacted, no node in list points
+        back at it), so inserting after one raises ValueError instead of losing value.
+        """
+
+        if getattr(node, "dead", False):
+            raise ValueError("cannot insert after a deleted node")
+        if node.next is None and node.prev is None and node is not self.head:
+            raise ValueError("cannot insert after a node that is not in list")
+
+        super().insert_after(node, value)
+
+    def reverse(self):
+        """Reverses the live nodes in place (tombstones are compacted away first)"""
+
+        self.compact()
+        super().reverse()
+
+    def rotate(self, k=1):
+        """
+        Rotates the list k live nodes to the right in place
+
+        Tombstones are compacted away first, so k counts live nodes only.
+        """
+
+        self.compact()
+        super().rotate(k)
+
+    def get_max(self):
+        """finds and returns the maximum value of all the live nodes in the list."""
+
+        return max(self)
+
+    def clear(self):
+        super().clear()
+        self.dead = 0
+        self.compact_cursor = None
+
+    def _unlink_tombstone(self, node):
+        """
+        Unlinks a dead node, leaving its .next pointer alone
+
+        Keeping .next means an iterator standing on node can still reach the rest of the list.
+        Its .prev is cleared so no reference cycle is left behind.
+        """
+
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+        if self.compact_cursor is node:
+            self.compact_cursor = node.next
+
+        node.prev = None
+        self.size -= 1
+        self.dead -= 1
@@ -0,0 +1,217 @@
+"""
+A Least-Frequently-Used cache evicts the key that has been read the fewest times.
+
+The classic O(1) design is a DoublyLinkedList of DoublyLinkedLists:
+
+    buckets: [freq 1] <-> [freq 2] <-> [freq 5]
+                |            |            |
+               keys         keys         keys
+
+The outer list holds one FrequencyBucket per access count, kept in increasing
+order. Each bucket holds the keys with that count, most recently used at the head.
+So the key to evict is always at the tail of the first bucket, and bumping a key's
+count only ever moves it into the bucket right after its current one.
+"""
+from typing import Optional
+
+from src.linked_lists.doubly_linked_list.doubly_linked_list import DoublyLinkedList
+
+
+class FrequencyBucket:
+    """Holds every key that has been accessed exactly `frequency` times"""
+
+    def __init__(self, frequency):
+        self.frequency = frequency
+        self.keys = DoublyLinkedList()  # most recently used key at head
+
+    def __repr__(self):
+        return f"FrequencyBucket({self.frequency}, {self.keys})"
+
+
+class CacheEntry:
+    """What the cache stores for each key: its value and where it lives in the buckets"""
+
+    def __init__(self, value, key_node, bucket_node):
+        self.value = value
+        self.key_node = key_node  # the node holding the key in bucket.keys
+        self.bucket_node = bucket_node  # the node holding the bucket in cache.buckets
+
+
+class LFUCache:
+    def __init__(self, capacity: int, aging_interval: Optional[int] = None):
+        """
+        Constructs an empty LFUCache
+
+        :param capacity: the maximum number of keys to hold
+        :param aging_interval: optional number of get/put calls after which every
+        frequency is halved, so keys that were hot a long time ago can be evicted
+        """
+        self.capacity = capacity
+        self.aging_interval = aging_interval
+        self.storage = {}  # key -> CacheEntry
+        self.buckets = DoublyLinkedList()  # FrequencyBuckets in increasing frequency
+
+        self.operations = 0  # get/put calls since last aging
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.storage)
+
+    def __contains__(self, key):
+        return key in self.storage
+
+    def get(self, key):
+        """returns the value stored for key (or None), counting it as an access"""
+
+        self._tick()
+
+        entry = self.storage.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._increment(key, entry)
+        return entry.value
+
+    def put(self, key, value):
+        """stores value under key, evicting the least frequently used key if cache is full"""
+
+        self._tick()
+
+        if self.capacity <= 0:
+            return
+
+        entry = self.storage.get(key)
+
+        # if key is already cached, update it and count the access
+        if entry is not None:
+            entry.value = value
+            self._increment(key, entry)
+            return
+
+        if len(self.storage) >= self.capacity:
+            self.evict()
+
+        self.storage[key] = self._insert(key, value, 1)
+
+    def evict(self):
+        """removes the least frequently used key and returns it"""
+
+        if len(self.storage) == 0:
+            return None  # nothing to _remove, nothing to return
+
+        # the first bucket has the lowest frequency,
+        # and its tail is the least recently used key in it
+        bucket_node = self.buckets.head
+        key = bucket_node.value.keys.remove_tail()
+
+        if len(bucket_node.value.keys) == 0:
+            self.buckets.delete(bucket_node)
+
+        del self.storage[key]
+        self.evictions += 1
+        return key
+
+    def frequency(self, key):
+        """returns the access count for key (or None if it isn't cached)"""
+
+        entry = self.storage.get(key)
+        if entry is None:
+            return None
+
+        return entry.bucket_node.value.frequency
+
+    def hit_ratio(self):
+        """returns the fraction of get calls that found their key"""
+
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+
+        return self.hits / lookups
+
+    def age(self):
+        """
+        Halves the frequency of every key (never going below 1)
+
+        Unlike the other operations this is O(n), which is why it only runs
+        once every aging_interval calls.
+        """
+
+        # walk from lowest to highest frequency, and from least to most recently used
+        # within each bucket, so re-adding keys to the heads keeps their order
+        ordered = []
+        bucket_node = self.buckets.head
+        while bucket_node is not None:
+            new_frequency = max(1, bucket_node.value.frequency // 2)
+            key_node = bucket_node.value.keys.tail
+            while key_node is not None:
+                ordered.append((key_node.value, new_frequency))
+                key_node = key_node.prev
+            bucket_node = bucket_node.next
+
+        self.buckets = DoublyLinkedList()
+        for key, new_frequency in ordered:
+            entry = self.storage[key]
+            self.storage[key] = self._insert(key, entry.value, new_frequency)
+
+    def _tick(self):
+        """counts a get/put call, aging the cache every aging_interval calls"""
+
+        if self.aging_interval is None:
+            return
+
+        self.operations += 1
+        if self.operations >= self.aging_interval:
+            self.operations = 0
+            self.age()
+
+    def _insert(self, key, value, frequency):
+        """
+        Adds key to the bucket for the given frequency and returns its CacheEntry
+
+        New keys (frequency 1) always belong at the start of the bucket list, and age()
+        re-adds keys in increasing frequency, so they always belong at the end of it.
+        Either way, finding the bucket is O(1).
+        """
+
+        if frequency == 1:
+            bucket_node = self.buckets.head
+            if bucket_node is not None and bucket_node.value.frequency != 1:
+                bucket_node = None
+        else:
+            bucket_node = self.buckets.tail
+
+        if bucket_node is None:
+            self.buckets.add_to_head(FrequencyBucket(frequency))
+            bucket_node = self.buckets.head
+        elif bucket_node.value.frequency != frequency:
+            self.buckets.insert_after(bucket_node, FrequencyBucket(frequency))
+            bucket_node = bucket_node.next
+
+        bucket_node.value.keys.add_to_head(key)
+        return CacheEntry(value, bucket_node.value.keys.head, bucket_node)
+
+    def _increment(self, key, entry):
+        """moves key from its bucket into the bucket with one more access"""
+
+        bucket_node = entry.bucket_node
+        bucket = bucket_node.value
+        next_frequency = bucket.frequency + 1
+        next_bucket_node = bucket_node.next
+
+        # make sure the bucket right after this one is for next_frequency
+        if next_bucket_node is None or next_bucket_node.value.frequency != next_frequency:
+            self.buckets.insert_after(bucket_node, FrequencyBucket(next_frequency))
+            next_bucket_node = bucket_node.next
+
+        bucket.keys.delete(entry.key_node)
+        if len(bucket.keys) == 0:
+            self.buckets.delete(bucket_node)
+
+        next_bucket_node.value.keys.add_to_head(key)
+        entry.key_node = next_bucket_node.value.keys.head
+        entry.bucket_node = next_bucket_node
@@ -0,0 +1,101 @@
+"""
+Parallel map/reduce over a DoublyLinkedList using a pool of processes.
+
+A walk like DoublyLinkedList.get_max runs on one core. Here the list is cut into
+contiguous chunks, each chunk is copied into a plain Python list (which pickles
+as one compact object instead of node by node), and a worker process runs
+map_fn on it. The partial results are then combined with reduce_fn.
+
+Walking the nodes still happens in this process, but the pool starts working on
+the first chunks while the later ones are still being collected.
+
+map_fn, reduce_fn and predicates are sent to other processes, so they must be
+picklable: builtins or functions defined at the top level of a module, not lambdas.
+"""
+import functools
+import operator
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def iter_chunks(dll, chunk_size=DEFAULT_CHUNK_SIZE):
+    """yields the values of dll, head to tail, as lists of at most chunk_size values"""
+
+    chunk = []
+    current_node = dll.head
+
+    while current_node is not None:
+        chunk.append(current_node.value)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+        current_node = current_node.next
+
+    if chunk:
+        yield chunk
+
+
+def parallel_map_reduce(dll, map_fn, reduce_fn, processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Runs map_fn on each chunk of dll and combines the results with reduce_fn
+
+    :param dll: the DoublyLinkedList to reduce
+    :param map_fn: takes a list of values and returns a partial result
+    :param reduce_fn: takes two partial results and returns one
+    :param processes: number of worker processes (defaults to os.cpu_count()).
+    With 1 process, everything runs in this process without a pool.
+    :param chunk_size: number of values sent to a worker at a time
+    :return: the combined result, or None if dll is empty
+    """
+
+    if len(dll) == 0:
+        return None
+
+    processes = processes or os.cpu_count() or 1
+    chunks = iter_chunks(dll, chunk_size)
+
+    if processes == 1:
+        partials = map(map_fn, chunks)
+        return functools.reduce(reduce_fn, partials)
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        partials = pool.map(map_fn, chunks)
+        return functools.reduce(reduce_fn, partials)
+
+
+def parallel_max(dll, processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """returns the maximum value in dll"""
+
+    return parallel_map_reduce(dll, max, max, processes, chunk_size)
+
+
+def parallel_min(dll, processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """returns the minimum value in dll"""
+
+    return parallel_map_reduce(dll, min, min, processes, chunk_size)
+
+
+def parallel_sum(dll, processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """returns the sum of the values in dll (0 if dll is empty)"""
+
+    if len(dll) == 0:
+        return 0
+
+    return parallel_map_reduce(dll, sum, operator.add, processes, chunk_size)
+
+
+def parallel_count_if(dll, predicate, processes=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """returns the number of values in dll for which predicate(value) is truthy"""
+
+    if len(dll) == 0:
+        return 0
+
+    map_fn = functools.partial(_count_if, predicate)
+    return parallel_map_reduce(dll, map_fn, operator.add, processes, chunk_size)
+
+
+def _count_if(predicate, chunk):
+    # module-level (rather than a lambda) so it can be pickled to worker processes
+    return sum(1 for value in chunk if predicate(value))
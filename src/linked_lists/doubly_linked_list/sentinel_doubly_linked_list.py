@@ -0,0 +1,307 @@
+import copy
+from typing import Optional
+
+from src.linked_lists.doubly_linked_list.doubly_linked_list import Node, seen_before
+
+
+class SentinelDoublyLinkedList:
+    """
+    A Doubly-Linked-List with the same methods as DoublyLinkedList, built around a sentinel node
+
+    The sentinel is a Node that holds no value and is always in the list. The list is
+    circular through it: sentinel.next is the head and sentinel.prev is the tail, so
+    an empty list is just the sentinel pointing at itself.
+
+    Because every real node always has a node on both sides (even if that node is the
+    sentinel), adding, removing and moving nodes never has to special-case an empty
+    list, a single-element list, or whether a node is the head or the tail. It's always
+    the same two pointer rewirings: _link_after and _unlink.
+
+    It is not a drop-in replacement for code that walks the nodes itself: tail.next
+    and head.prev are the sentinel, not None, so a loop like
+    `while node is not None: node = node.next` never ends. Iterate over the list
+    instead, or stop at the sentinel.
+    """
+
+    def __init__(self, node_list: Optional[list] = None):
+        """
+        Constructs an instance of SentinelDoublyLinkedList class.
+
+        :param node_list: an optional list of values to to initialize the list with.
+        If no list is given, our list will start as empty
+        """
+        self.sentinel = Node(None)
+        self.sentinel.prev = self.sentinel.next = self.sentinel  # empty list points at itself
+        self.size = 0  # number of items stored in list
+
+        if node_list is not None:
+            for value in node_list:
+                self.add_to_tail(value)
+
+    @property
+    def head(self):
+        """the first node in list, or None if list is empty"""
+
+        return self.sentinel.next if self.size else None
+
+    @property
+    def tail(self):
+        """the last node in list, or None if list is empty"""
+
+        return self.sentinel.prev if self.size else None
+
+    def __repr__(self):
+        """Returns a string representation of this list (same format as DoublyLinkedList)"""
+
+        nodes = []
+        current_node = self.sentinel.next
+
+        while current_node is not self.sentinel:
+            nodes.append(repr(current_node))
+            current_node = current_node.next
+
+        return f"DLL=[{' -> '.join(nodes)}]"
+
+    def __len__(self):
+        """returns the number of nodes stored in list"""
+
+        return self.size
+
+    def __iter__(self):
+        """yields each new_value in the list, from head to tail"""
+
+        current_node = self.sentinel.next
+        while current_node is not self.sentinel:
+            yield current_node.value
+            current_node = current_node.next
+
+    def __reduce__(self):
+        """Tells pickle (and copy) to store this list as a flat list of values"""
+
+        return self.__class__, (list(self),)
+
+    def __deepcopy__(self, memo):
+        """copies the list one node at a time, instead of recursing through the nodes"""
+
+        copied = self.__class__()
+        memo[id(self)] = copied
+
+        for value in self:
+            copied.add_to_tail(copy.deepcopy(value, memo))
+
+        return copied
+
+    def clear(self):
+        """Removes every node from the list, cutting each node's links so it is freed right away"""
+
+        current_node = self.sentinel.next
+        self.sentinel.prev = self.sentinel.next = self.sentinel
+        self.size = 0
+
+        while current_node is not self.sentinel:
+            next_node = current_node.next
+            current_node.prev = current_node.next = None  # _remove any ties to list
+            current_node = next_node
+
+    def add_to_head(self, value):
+        """inserts a Node with the given new_value as the new head of the list"""
+
+        self._link_after(self.sentinel, Node(value))
+
+    def remove_head(self):
+        """Removes the node at the head of the list and returns its value"""
+
+        if self.size == 0:
+            return None  # nothing to _remove (and nothing to return)
+
+        node = self.sentinel.next
+        self._unlink(node)
+        return node.value
+
+    def add_to_tail(self, value):
+        """wraps the given new_value in a Node and inserts it as the new tail of the list"""
+
+        self._link_after(self.sentinel.prev, Node(value))
+
+    def remove_tail(self):
+        """Removes the node at the tail of the list and returns its value"""
+
+        if self.size == 0:
+            return None  # nothing to _remove (and nothing to return)
+
+        node = self.sentinel.prev
+        self._unlink(node)
+        return node.value
+
+    def add_many_to_head(self, values):
+        """Adds each of the given values to the head of the list, in order (last value ends up as head)"""
+
+        for value in values:
+            self._link_after(self.sentinel, Node(value))
+
+    def add_many_to_tail(self, values):
+        """Adds each of the given values to the tail of the list, in order"""
+
+        for value in values:
+            self._link_after(self.sentinel.prev, Node(value))
+
+    def remove_many_from_head(self, n):
+        """Removes up to n nodes from the head of the list and returns their values in removal order"""
+
+        values = []
+        while self.size and len(values) < n:
+            node = self.sentinel.next
+            self._unlink(node)
+            values.append(node.value)
+
+        return values
+
+    def remove_many_from_tail(self, n):
+        """Removes up to n nodes from the tail of the list and returns their values in removal order"""
+
+        values = []
+        while self.size and len(values) < n:
+            node = self.sentinel.prev
+            self._unlink(node)
+            values.append(node.value)
+
+        return values
+
+    def insert_after(self, node, value):
+        """wraps the given new_value in a Node and inserts it directly after the given node"""
+
+        self._link_after(node, Node(value))
+
+    def move_to_front(self, node):
+        """Relocates given node from its current location to front of list"""
+
+        # a node that isn't in any list has no links
+        if node is None or node.next is None:
+            return
+
+        self._unlink(node)
+        self._link_after(self.sentinel, node)
+
+    def move_to_end(self, node):
+        """Relocates given node from its current location to end of list"""
+
+        if node is None or node.next is None:
+            return
+
+        self._unlink(node)
+        self._link_after(self.sentinel.prev, node)
+
+    def delete(self, node):
+        """Deletes the given node from the list, preserving the order of the other elements of the List."""
+
+        if node is None or node.next is None:
+            return
+
+        self._unlink(node)
+        return node.value
+
+    def reverse(self):
+        """Reverses the order of the list in place, without creating any new nodes"""
+
+        # swapping prev and next on every node (sentinel included) reverses the loop
+        current_node = self.sentinel
+        while True:
+            current_node.prev, current_node.next = current_node.next, current_node.prev
+            current_node = current_node.prev  # the old next
+            if current_node is self.sentinel:
+                break
+
+    def rotate(self, k=1):
+        """
+        Rotates the list k steps to the right in place (like collections.deque.rotate)
+
+        The list is already a loop, so rotating is just moving the sentinel so that
+        it sits right before the new head.
+        """
+
+        if self.size < 2:
+            return
+
+        k %= self.size
+        if k == 0:
+            return
+
+        if k <= self.size // 2:
+            new_head = self.sentinel.prev
+            for _ in range(k - 1):
+                new_head = new_head.prev
+        else:
+            new_head = self.sentinel.next
+            for _ in range(self.size - k):
+                new_head = new_head.next
+
+        # take the sentinel out of the loop...
+        self.sentinel.prev.next = self.sentinel.next
+        self.sentinel.next.prev = self.sentinel.prev
+
+        # ...and put it back in right before new_head
+        self.sentinel.prev = new_head.prev
+        self.sentinel.next = new_head
+        new_head.prev.next = self.sentinel
+        new_head.prev = self.sentinel
+
+    def remove_if(self, predicate):
+        """
+        Deletes every node whose value makes predicate(value) truthy, in one pass
+
+        :return: the number of nodes removed
+        """
+
+        removed = 0
+        current_node = self.sentinel.next
+
+        while current_node is not self.sentinel:
+            next_node = current_node.next
+            if predicate(current_node.value):
+                self._unlink(current_node)
+                removed += 1
+            current_node = next_node
+
+        return removed
+
+    def dedupe(self):
+        """
+        Deletes every node whose value already appeared earlier in the list, in one pass
+
+        Values must be hashable.
+
+        :return: the number of nodes removed
+        """
+
+        return self.remove_if(seen_before())
+
+    def get_max(self):
+        """finds and returns the maximum new_value of all the nodes in the list."""
+
+        # like DoublyLinkedList, an empty list has no head to start from (and raises)
+        max_value = self.head.value
+        current_node = self.head.next
+
+        while current_node is not self.sentinel:
+            if max_value < current_node.value:
+                max_value = current_node.value
+            current_node = current_node.next
+
+        return max_value
+
+    def _link_after(self, node, new_node):
+        """places new_node between node and node.next"""
+
+        new_node.prev = node
+        new_node.next = node.next
+        node.next.prev = new_node
+        node.next = new_node
+        self.size += 1
+
+    def _unlink(self, node):
+        """sews node.prev and node.next together, cutting node out of the list"""
+
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = None  # _remove any ties to list
+        self.size -= 1
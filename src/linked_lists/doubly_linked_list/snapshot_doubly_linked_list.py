@@ -0,0 +1,210 @@
+"""
+A DoublyLinkedList that many threads can read while other threads change it.
+
+Writers take a lock, one at a time. Readers never wait on that lock: each reader
+iterates a snapshot, the list as it was at one version, no matter what writers do
+while it is iterating.
+
+This works with versioned nodes. Besides its normal .next pointer, every node
+keeps a short history of (version, next_node) pairs, and the list keeps the same
+history for its head. A writer never overwrites history; it adds a new entry at
+the next version and then publishes that version. A reader at version v follows,
+for each node, the newest entry that is not newer than v.
+
+History entries that no active reader can still need are dropped the next time a
+writer touches that node, so the history stays short.
+"""
+import threading
+from typing import Optional
+
+from src.linked_lists.doubly_linked_list.doubly_linked_list import DoublyLinkedList
+
+
+def _at_version(history, version):
+    """returns the target of the newest entry in history that is not newer than version"""
+
+    for entry_version, target in reversed(history):
+        if entry_version <= version:
+            return target
+
+    return None
+
+
+class Snapshot:
+    """
+    The list's values as they were at one version
+
+    Iterate it as many times as needed, then close() it (or use it in a `with` block)
+    so writers can drop history it was holding on to.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.version = source._register_reader()
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iter__(self):
+        if self.closed:
+            raise ValueError("snapshot is closed")
+
+        node = _at_version(self.source.head_versions, self.version)
+        while node is not None:
+            yield node.value
+            node = _at_version(node.next_versions, self.version)
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.source._unregister_reader(self.version)
+
+
+class SnapshotDoublyLinkedList:
+    """
+    Wraps a DoublyLinkedList so that readers get snapshot isolation
+
+    Writes (add_to_head, add_to_tail, remove_head, remove_tail, move_to_front,
+    move_to_end, delete) go through the wrapped list under a lock. Reads go
+    through snapshot() or plain iteration and never take that lock.
+    """
+
+    def __init__(self, node_list: Optional[list] = None):
+        self.storage = DoublyLinkedList()
+        self.write_lock = threading.Lock()
+        self.readers_lock = threading.Lock()  # only guards active_readers, held very briefly
+        self.active_readers = {}  # version -> number of open snapshots at that version
+        self.version = 0
+        self.head_versions = [(0, None)]
+
+        if node_list is not None:
+            for value in node_list:
+                self.add_to_tail(value)
+
+    def __len__(self):
+        return len(self.storage)
+
+    def __iter__(self):
+        """iterates a snapshot of the list taken when iteration starts"""
+
+        with self.snapshot() as snapshot:
+            yield from snapshot
+
+    @property
+    def head(self):
+        return self.storage.head
+
+    @property
+    def tail(self):
+        return self.storage.tail
+
+    def snapshot(self):
+        """returns a Snapshot of the list as it is right now"""
+
+        return Snapshot(self)
+
+    def add_to_head(self, value):
+        with self.write_lock:
+            self._write(self.storage.add_to_head, value)
+
+    def add_to_tail(self, value):
+        with self.write_lock:
+            self._write(self.storage.add_to_tail, value)
+
+    def remove_head(self):
+        with self.write_lock:
+            return self._write(self.storage.remove_head)
+
+    def remove_tail(self):
+        with self.write_lock:
+            return self._write(self.storage.remove_tail)
+
+    def move_to_front(self, node):
+        with self.write_lock:
+            self._write(self.storage.move_to_front, node, node=node)
+
+    def move_to_end(self, node):
+        with self.write_lock:
+            self._write(self.storage.move_to_end, node, node=node)
+
+    def delete(self, node):
+        with self.write_lock:
+            return self._write(self.storage.delete, node, node=node)
+
+    def _write(self, operation, *args, node=None):
+        """
+        Runs operation(*args) on the wrapped list and publishes the result as a new version
+
+        Only the ends of the list, and the given node and the one before it, can have
+        their .next changed by an operation, so only they are checked.
+        """
+
+        touched = [self.storage.head, self.storage.tail]
+        if node is not None:
+            touched += [node, node.prev]
+
+        result = operation(*args)
+
+        touched += [self.storage.head, self.storage.tail]
+        self._publish(touched)
+        return result
+
+    def _publish(self, touched):
+        """records the new .next of every touched node (and the new head) at the next version"""
+
+        new_version = self.version + 1
+        oldest = self._oldest_reader()
+
+        for node in touched:
+            if node is None:
+                continue
+            history = getattr(node, "next_versions", None)
+            if history is None:
+                node.next_versions = [(new_version, node.next)]
+            elif history[-1][1] is not node.next:
+                node.next_versions = self._pruned(history, oldest) + [(new_version, node.next)]
+
+        if self.head_versions[-1][1] is not self.storage.head:
+            self.head_versions = self._pruned(self.head_versions, oldest) + [(new_version, self.storage.head)]
+
+        # readers that start from now on see the new version
+        self.version = new_version
+
+    @staticmethod
+    def _pruned(history, oldest):
+        """
+        Returns a copy of history without the entries no reader can need anymore
+
+        A reader at version `oldest` (or newer) only needs the newest entry that is not newer
+        than `oldest`, plus everything after it. Readers may be walking the old list, so a new
+        list is returned instead of changing history in place.
+        """
+
+        keep_from = 0
+        for index, (entry_version, _) in enumerate(history):
+            if entry_version <= oldest:
+                keep_from = index
+
+        return history[keep_from:]
+
+    def _oldest_reader(self):
+        with self.readers_lock:
+            if self.active_readers:
+                return min(self.active_readers)
+            return self.version
+
+    def _register_reader(self):
+        with self.readers_lock:
+            version = self.version
+            self.active_readers[version] = self.active_readers.get(version, 0) + 1
+            return version
+
+    def _unregister_reader(self, version):
+        with self.readers_lock:
+            self.active_readers[version] -= 1
+            if self.active_readers[version] == 0:
+                del self.active_readers[version]
@@ -0,0 +1,402 @@
+import copy
+import gc
+import pickle
+import unittest
+import weakref
+from src.linked_lists.doubly_linked_list.doubly_linked_list import DoublyLinkedList, Node
+
+
+class DoublyLinkedListTests(unittest.TestCase):
+    list_class = DoublyLinkedList
+
+    def setUp(self):
+        self.dll = self.list_class([1])
+
+    def test_set_up(self):
+        self.assertEqual(self.dll.head.value, 1)
+        self.assertEqual(self.dll.tail.value, 1)
+        self.assertEqual(self.dll.size, 1)
+
+    def test_empty_list_construction(self):
+        new_dll = self.list_class([])
+        self.assertIsNone(new_dll.head)
+        self.assertIsNone(new_dll.tail)
+        self.assertEqual(len(new_dll), 0)
+
+    def test_repr(self):
+        empty_dll = self.list_class()
+        self.assertEqual(empty_dll.__repr__(), "DLL=[]")
+        one_el_dll = self.list_class([1])
+        self.assertEqual(one_el_dll.__repr__(), "DLL=[Node(1)]")
+        long_dll = self.list_class([1, 2, 3, 4, 5, 6, 7])
+        long_repr = "DLL=[Node(1) -> Node(2) -> Node(3) -> Node(4) -> Node(5) -> Node(6) -> Node(7)]"
+        self.assertEqual(long_dll.__repr__(), long_repr)
+
+    def test_default_construction(self):
+        new_dll = self.list_class()
+        self.assertIsNone(new_dll.head)
+        self.assertIsNone(new_dll.tail)
+        self.assertEqual(new_dll.size, 0)
+
+    def test_list_construction(self):
+        new_dll = self.list_class([1, 2, 3, 4, 5, 6])
+        self.assertEqual(new_dll.head.value, 1)
+        self.assertEqual(new_dll.tail.value, 6)
+        self.assertEqual(new_dll.size, 6)
+
+    def test_list_remove_from_tail(self):
+        # test when list is empty
+        empty_dll = self.list_class()
+        self.assertIsNone(empty_dll.remove_tail())
+
+        long_dll = self.list_class([1, 2, 3, 4])
+        self.assertEqual(long_dll.remove_tail(), 4)
+        self.assertEqual(len(long_dll), 3)
+
+        self.dll.remove_tail()
+        self.assertIsNone(self.dll.head)
+        self.assertIsNone(self.dll.tail)
+        self.assertEqual(len(self.dll), 0)
+
+        self.dll.add_to_tail(33)
+        self.assertEqual(self.dll.head.value, 33)
+        self.assertEqual(self.dll.tail.value, 33)
+        self.assertEqual(len(self.dll), 1)
+        self.assertEqual(self.dll.remove_tail(), 33)
+        self.assertEqual(len(self.dll), 0)
+
+        self.dll.add_to_tail(68)
+        self.assertEqual(len(self.dll), 1)
+        self.assertEqual(self.dll.remove_tail(), 68)
+        self.assertEqual(len(self.dll), 0)
+
+    def test_list_remove_from_head(self):
+        empty_dll = self.list_class()
+        self.assertIsNone(empty_dll.remove_head())
+
+        new_dll = self.list_class([1, 2, 3, 4])
+        self.assertEqual(new_dll.remove_head(), 1)
+
+        self.dll.remove_head()
+        self.assertIsNone(self.dll.head)
+        self.assertIsNone(self.dll.tail)
+        self.assertEqual(len(self.dll), 0)
+
+        self.dll.add_to_head(2)
+        self.assertEqual(self.dll.head.value, 2)
+        self.assertEqual(self.dll.tail.value, 2)
+        self.assertEqual(len(self.dll), 1)
+        self.assertEqual(self.dll.remove_head(), 2)
+        self.assertEqual(len(self.dll), 0)
+
+        self.dll.add_to_head(55)
+        self.assertEqual(len(self.dll), 1)
+        self.assertEqual(self.dll.remove_head(), 55)
+        self.assertEqual(len(self.dll), 0)
+
+    def test_list_add_to_tail(self):
+        self.assertEqual(self.dll.tail.value, 1)
+        self.assertEqual(len(self.dll), 1)
+
+        self.dll.add_to_tail(30)
+        self.assertEqual(self.dll.tail.prev.value, 1)
+        self.assertEqual(self.dll.tail.value, 30)
+        self.assertEqual(len(self.dll), 2)
+
+        self.dll.add_to_tail(20)
+        self.assertEqual(self.dll.tail.prev.value, 30)
+        self.assertEqual(self.dll.tail.value, 20)
+        self.assertEqual(len(self.dll), 3)
+
+    def test_list_add_to_head(self):
+        self.assertEqual(self.dll.head.value, 1)
+
+        self.dll.add_to_head(10)
+        self.assertEqual(self.dll.head.value, 10)
+        self.assertEqual(self.dll.head.next.value, 1)
+        self.assertEqual(len(self.dll), 2)
+
+    def test_list_move_to_end(self):
+        self.dll.add_to_head(40)
+        self.assertEqual(self.dll.tail.value, 1)
+        self.assertEqual(self.dll.head.value, 40)
+
+        self.assertIsNone(self.dll.move_to_end(None))
+        self.dll.move_to_end(self.dll.head)
+        self.assertEqual(self.dll.tail.value, 40)
+        self.assertEqual(self.dll.tail.prev.value, 1)
+        self.assertEqual(len(self.dll), 2)
+
+        self.dll.add_to_tail(4)
+        self.dll.move_to_end(self.dll.head.next)
+        self.assertEqual(self.dll.tail.value, 40)
+        self.assertEqual(self.dll.tail.prev.value, 4)
+        self.assertEqual(len(self.dll), 3)
+        # test when node is tail
+        self.assertIsNone(self.dll.move_to_end(self.dll.tail))
+        # test when list is empty
+        new_node = Node(10)
+        new_dll = self.list_class()
+        self.assertIsNone(new_dll.move_to_end(new_node))
+        # test when node is not in list
+        self.assertIsNone(self.dll.move_to_end(new_node))
+
+    def test_list_move_to_front(self):
+        unattached_node = Node(5)
+        # test when list is empty
+        empty_dll = self.list_class()
+        self.assertIsNone(empty_dll.move_to_front(unattached_node))
+
+        # test when Node is not in list
+        long_dll = self.list_class([1, 2, 3, 4, 5, 6])
+        # test when node is None
+        self.assertIsNone(long_dll.move_to_front(None))
+        # test when node is not in list
+        self.assertIsNone(long_dll.move_to_front(unattached_node))
+        # test when given node is head of list
+        self.assertIsNone(long_dll.move_to_front(long_dll.head))
+
+        self.dll.add_to_tail(3)
+        self.assertEqual(self.dll.head.value, 1)
+        self.assertEqual(self.dll.tail.value, 3)
+
+        self.dll.move_to_front(self.dll.tail)
+        self.assertEqual(self.dll.head.value, 3)
+        self.assertEqual(self.dll.head.next.value, 1)
+        self.assertEqual(len(self.dll), 2)
+
+        self.dll.add_to_head(29)
+        self.dll.move_to_front(self.dll.head.next)
+        self.assertEqual(self.dll.head.value, 3)
+        self.assertEqual(self.dll.head.next.value, 29)
+        self.assertEqual(len(self.dll), 3)
+
+    def test_list_delete(self):
+        # test delete when list is empty
+        unattached_node = Node(5)
+        empty_dll = self.list_class()
+        self.assertIsNone(empty_dll.delete(unattached_node))
+
+        long_dll = self.list_class([1, 2, 3, 4, 5, 6, 7])
+        self.assertIsNone(long_dll.delete(unattached_node))
+        # test delete where node is none
+        self.assertIsNone(long_dll.delete(None))
+        self.assertEqual(long_dll.delete(long_dll.tail), 7)
+        self.assertEqual(long_dll.tail.value, 6)
+        self.assertEqual(len(long_dll), 6)
+
+        self.assertEqual(len(self.dll), 1)
+        val_returned = self.dll.delete(self.dll.head)
+        self.assertIsNone(self.dll.head)
+        self.assertIsNone(self.dll.tail)
+        self.assertEqual(len(self.dll), 0)
+
+        self.dll.add_to_tail(1)
+        self.dll.add_to_head(9)
+        self.dll.add_to_tail(6)
+
+        self.dll.delete(self.dll.head.next)
+        self.assertEqual(self.dll.head.value, 9)
+        self.assertEqual(self.dll.head.next, self.dll.tail)
+        self.assertEqual(self.dll.tail.value, 6)
+
+        self.dll.delete(self.dll.head)
+        self.assertEqual(self.dll.head.value, 6)
+        self.assertEqual(self.dll.tail.value, 6)
+        self.assertEqual(len(self.dll), 1)
+
+        self.dll.delete(self.dll.head)
+        self.assertIsNone(self.dll.head)
+        self.assertIsNone(self.dll.tail)
+        self.assertEqual(len(self.dll), 0)
+
+    def test_list_delete_clears_links(self):
+        long_dll = self.list_class([1, 2, 3, 4])
+        old_head = long_dll.head
+        long_dll.delete(old_head)
+        self.assertIsNone(long_dll.head.prev)
+        self.assertIsNone(old_head.next)
+
+        old_tail = long_dll.tail
+        long_dll.delete(old_tail)
+        self.assertIsNone(long_dll.tail.next)
+        self.assertIsNone(old_tail.prev)
+        self.assertEqual(long_dll.__repr__(), "DLL=[Node(2) -> Node(3)]")
+
+        # deleting a node twice does nothing the second time
+        self.assertIsNone(long_dll.delete(old_tail))
+        self.assertEqual(len(long_dll), 2)
+
+    def test_list_insert_after(self):
+        self.dll.insert_after(self.dll.head, 3)
+        self.assertEqual(self.dll.tail.value, 3)
+        self.assertEqual(self.dll.tail.prev.value, 1)
+        self.assertEqual(len(self.dll), 2)
+
+        self.dll.insert_after(self.dll.head, 2)
+        self.assertEqual(self.dll.head.next.value, 2)
+        self.assertEqual(self.dll.head.next.prev, self.dll.head)
+        self.assertEqual(self.dll.tail.prev.value, 2)
+        self.assertEqual(len(self.dll), 3)
+        self.assertEqual(self.dll.__repr__(), "DLL=[Node(1) -> Node(2) -> Node(3)]")
+
+    def assertListValues(self, dll, values):
+        # walk both directions so broken prev or next pointers are caught
+        forward, backward = [], []
+        current_node = dll.head
+        for _ in range(len(dll)):
+            forward.append(current_node.value)
+            current_node = current_node.next
+        current_node = dll.tail
+        for _ in range(len(dll)):
+            backward.append(current_node.value)
+            current_node = current_node.prev
+        self.assertEqual(forward, values)
+        self.assertEqual(backward, values[::-1])
+        self.assertEqual(len(dll), len(values))
+
+    def test_reverse(self):
+        empty_dll = self.list_class()
+        empty_dll.reverse()
+        self.assertIsNone(empty_dll.head)
+
+        long_dll = self.list_class([1, 2, 3, 4])
+        long_dll.reverse()
+        self.assertListValues(long_dll, [4, 3, 2, 1])
+        long_dll.add_to_tail(0)
+        self.assertListValues(long_dll, [4, 3, 2, 1, 0])
+
+    def test_rotate(self):
+        self.dll.rotate(3)
+        self.assertListValues(self.dll, [1])
+
+        long_dll = self.list_class([1, 2, 3, 4, 5])
+        long_dll.rotate(1)
+        self.assertListValues(long_dll, [5, 1, 2, 3, 4])
+        long_dll.rotate(3)  # split node found from the head
+        self.assertListValues(long_dll, [2, 3, 4, 5, 1])
+        long_dll.rotate(-1)
+        self.assertListValues(long_dll, [3, 4, 5, 1, 2])
+        long_dll.rotate(5)
+        self.assertListValues(long_dll, [3, 4, 5, 1, 2])
+        long_dll.add_to_head(0)
+        self.assertListValues(long_dll, [0, 3, 4, 5, 1, 2])
+
+    def test_remove_if(self):
+        long_dll = self.list_class([2, 1, 4, 3, 6])
+        self.assertEqual(long_dll.remove_if(lambda value: value % 2 == 0), 3)
+        self.assertListValues(long_dll, [1, 3])
+
+        self.assertEqual(long_dll.remove_if(lambda value: True), 2)
+        self.assertIsNone(long_dll.head)
+        self.assertIsNone(long_dll.tail)
+
+    def test_dedupe(self):
+        long_dll = self.list_class([1, 2, 1, 3, 2, 2])
+        self.assertEqual(long_dll.dedupe(), 3)
+        self.assertListValues(long_dll, [1, 2, 3])
+        self.assertEqual(long_dll.dedupe(), 0)
+
+    def test_add_many(self):
+        empty_dll = self.list_class()
+        empty_dll.add_many_to_tail([])
+        empty_dll.add_many_to_head(iter([]))
+        self.assertIsNone(empty_dll.head)
+
+        empty_dll.add_many_to_tail(iter([3, 4]))
+        self.assertListValues(empty_dll, [3, 4])
+        empty_dll.add_many_to_head([2, 1])
+        self.assertListValues(empty_dll, [1, 2, 3, 4])
+        empty_dll.add_many_to_tail([5])
+        self.assertListValues(empty_dll, [1, 2, 3, 4, 5])
+
+        head_dll = self.list_class()
+        head_dll.add_many_to_head([1, 2])
+        self.assertListValues(head_dll, [2, 1])
+
+    def test_remove_many(self):
+        long_dll = self.list_class([1, 2, 3, 4, 5, 6])
+        self.assertEqual(long_dll.remove_many_from_head(0), [])
+        self.assertEqual(long_dll.remove_many_from_head(2), [1, 2])
+        self.assertListValues(long_dll, [3, 4, 5, 6])
+        self.assertEqual(long_dll.remove_many_from_tail(2), [6, 5])
+        self.assertListValues(long_dll, [3, 4])
+        self.assertEqual(long_dll.remove_many_from_tail(5), [4, 3])
+        self.assertIsNone(long_dll.head)
+        self.assertIsNone(long_dll.tail)
+        self.assertEqual(long_dll.remove_many_from_head(1), [])
+
+        long_dll.add_many_to_tail([1, 2])
+        self.assertEqual(long_dll.remove_many_from_head(9), [1, 2])
+        self.assertEqual(len(long_dll), 0)
+
+    def test_iter(self):
+        self.assertEqual(list(self.list_class()), [])
+        self.assertEqual(list(self.list_class([1, 2, 3])), [1, 2, 3])
+
+    def test_pickle_long_list(self):
+        # long enough that pickling node by node would hit the recursion limit
+        long_dll = self.list_class(range(50000))
+        copied = pickle.loads(pickle.dumps(long_dll))
+        self.assertIsInstance(copied, self.list_class)
+        self.assertEqual(len(copied), 50000)
+        self.assertEqual(list(copied), list(range(50000)))
+        self.assertEqual(copied.tail.prev.value, 49998)
+
+    def test_deepcopy(self):
+        shared = [1]
+        dll = self.list_class([shared, shared, [2]])
+        copied = copy.deepcopy(dll)
+        self.assertEqual(list(copied), [[1], [1], [2]])
+        self.assertIsNot(copied.head.value, shared)
+        # values that were shared stay shared in the copy
+        self.assertIs(copied.head.value, copied.head.next.value)
+
+        long_dll = self.list_class(range(50000))
+        self.assertEqual(list(copy.deepcopy(long_dll)), list(range(50000)))
+        self.assertEqual(list(copy.copy(long_dll)), list(range(50000)))
+
+    def test_clear(self):
+        dll = self.list_class([1, 2, 3])
+        middle = weakref.ref(dll.head.next)
+
+        gc.disable()
+        try:
+            dll.clear()
+            self.assertIsNone(dll.head)
+            self.assertIsNone(dll.tail)
+            self.assertEqual(len(dll), 0)
+            # freed by reference counting alone, without the cyclic garbage collector
+            self.assertIsNone(middle())
+        finally:
+            gc.enable()
+
+        dll.add_to_tail(4)
+        self.assertListValues(dll, [4])
+
+    def test_get_max_01(self):
+        self.assertEqual(self.dll.get_max(), 1)
+        self.dll.add_to_tail(100)
+        self.assertEqual(self.dll.get_max(), 100)
+        self.dll.add_to_tail(55)
+        self.assertEqual(self.dll.get_max(), 100)
+        self.dll.add_to_tail(101)
+        self.assertEqual(self.dll.get_max(), 101)
+
+    def test_get_max_at_head(self):
+        new_dll = self.list_class([9, 1, 2, 3, 4, 5])
+        self.assertEqual(new_dll.head.value, 9)
+        self.assertEqual(new_dll.get_max(), 9)
+
+    def test_get_max_at_tail(self):
+        new_dll = self.list_class([1, 2, 3, 4, 5, 6, 7, 8, 9])
+        self.assertEqual(new_dll.tail.value, 9)
+        self.assertEqual(new_dll.get_max(), 9)
+
+    def test_get_max_of_empty_list_raises(self):
+        with self.assertRaises(AttributeError):
+            self.list_class().get_max()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+import copy
+import pickle
+import unittest
+from src.linked_lists.doubly_linked_list.doubly_linked_list import Node
+from src.linked_lists.doubly_linked_list.lazy_doubly_linked_list import LazyDoublyLinkedList
+
+
+class LazyDoublyLinkedListTests(unittest.TestCase):
+    def setUp(self):
+        # threshold of 1 means mark_deleted never compacts on its own
+        self.dll = LazyDoublyLinkedList([1, 2, 3, 4, 5], compact_threshold=1)
+
+    def nodes(self):
+        nodes = []
+        current_node = self.dll.head
+        while current_node is not None:
+            nodes.append(current_node)
+            current_node = current_node.next
+        return nodes
+
+    def test_mark_deleted_keeps_links(self):
+        second = self.dll.head.next
+        self.assertEqual(self.dll.mark_deleted(second), 2)
+        self.assertEqual(self.dll.size, 5)
+        self.assertEqual(len(self.dll), 4)
+        self.assertIs(self.dll.head.next, second)
+        self.assertEqual(list(self.dll), [1, 3, 4, 5])
+
+        # marking twice, None, or a node not in any list does nothing
+        self.assertIsNone(self.dll.mark_deleted(second))
+        self.assertIsNone(self.dll.mark_deleted(None))
+        self.assertIsNone(self.dll.mark_deleted(Node(9)))
+        self.assertEqual(len(self.dll), 4)
+
+    def test_compact_is_bounded(self):
+        for node in self.nodes()[:4]:
+            self.dll.mark_deleted(node)
+
+        self.assertEqual(self.dll.compact(2), 2)
+        self.assertEqual(self.dll.size, 3)
+        self.assertEqual(self.dll.compact(2), 2)
+        self.assertEqual(self.dll.size, 1)
+        self.assertEqual(self.dll.compact(), 0)
+        self.assertEqual(self.dll.head.value, 5)
+        self.assertIsNone(self.dll.head.prev)
+        self.assertIs(self.dll.head, self.dll.tail)
+        self.assertEqual(list(self.dll), [5])
+
+    def test_threshold_triggers_compaction(self):
+        dll = LazyDoublyLinkedList(range(10), compact_threshold=0.25, compact_step=100)
+        nodes = []
+        current_node = dll.head
+        while current_node is not None:
+            nodes.append(current_node)
+            current_node = current_node.next
+
+        dll.mark_deleted(nodes[0])
+        dll.mark_deleted(nodes[1])
+        self.assertEqual(dll.size, 10)
+        dll.mark_deleted(nodes[2])  # 3 of 10 dead is over 25%
+        self.assertEqual(dll.size, 7)
+        self.assertEqual(dll.dead, 0)
+        self.assertEqual(list(dll), list(range(3, 10)))
+
+    def test_iterator_survives_compaction(self):
+        third = self.dll.head.next.next
+        iterator = iter(self.dll)
+        self.assertEqual(next(iterator), 1)
+        self.assertEqual(next(iterator), 2)  # iterator now stands on node 2
+
+        self.dll.mark_deleted(self.dll.head.next)
+        self.dll.mark_deleted(third)
+        self.dll.compact()
+        self.assertEqual(list(iterator), [4, 5])
+
+    def test_remove_skips_tombstones(self):
+        self.dll.mark_deleted(self.dll.head)
+        self.dll.mark_deleted(self.dll.tail)
+        self.assertEqual(self.dll.remove_head(), 2)
+        self.assertEqual(self.dll.remove_tail(), 4)
+        self.assertEqual(len(self.dll), 1)
+        self.assertEqual(self.dll.size, 1)
+        self.assertEqual(self.dll.get_max(), 3)
+
+    def test_other_operations_ignore_tombstones(self):
+        second = self.dll.head.next
+        self.dll.mark_deleted(second)
+        self.assertIsNone(self.dll.delete(second))
+        self.dll.move_to_front(second)
+        self.dll.move_to_end(second)
+        self.assertIs(self.dll.head.next, second)
+
+        self.assertEqual(self.dll.remove_if(lambda value: value < 4), 2)
+        self.assertEqual(list(self.dll), [4, 5])
+        self.assertEqual(self.dll.remove_many_from_tail(5), [5, 4])
+        self.assertEqual(len(self.dll), 0)
+
+    def test_pickle_and_deepcopy_keep_settings(self):
+        dll = LazyDoublyLinkedList([1, 2, 3], compact_threshold=0.9, compact_step=5)
+        dll.mark_deleted(dll.head)
+
+        for copied in [pickle.loads(pickle.dumps(dll)), copy.deepcopy(dll)]:
+            self.assertIsInstance(copied, LazyDoublyLinkedList)
+            self.assertEqual(list(copied), [2, 3])
+            self.assertEqual(copied.compact_threshold, 0.9)
+            self.assertEqual(copied.compact_step, 5)
+
+    def test_repr_skips_tombstones(self):
+        self.dll.mark_deleted(self.dll.head.next)
+        self.assertEqual(repr(self.dll), "DLL=[Node(1) -> Node(3) -> Node(4) -> Node(5)]")
+        self.dll.clear()
+        self.assertEqual(repr(self.dll), "DLL=[]")
+
+    def test_reverse_and_rotate_ignore_tombstones(self):
+        self.dll.mark_deleted(self.dll.tail)
+        self.dll.rotate(1)
+        self.assertEqual(list(self.dll), [4, 1, 2, 3])
+        self.assertEqual(self.dll.dead, 0)
+
+        self.dll.mark_deleted(self.dll.head)
+        self.dll.reverse()
+        self.assertEqual(list(self.dll), [3, 2, 1])
+        self.assertIsNone(self.dll.head.prev)
+        self.assertIsNone(self.dll.tail.next)
+
+    def test_unlimited_compact_starts_at_head(self):
+        dll = LazyDoublyLinkedList(range(6), compact_threshold=0.9)
+        dll.compact(4)  # parks the cursor on node 4
+        dll.mark_deleted(dll.head.next.next.next)
+
+        # the tombstone is behind the cursor, but rotate still has to compact it away
+        dll.rotate(3)
+        self.assertEqual(list(dll), [2, 4, 5, 0, 1])
+        self.assertEqual(dll.dead, 0)
+
+    def test_insert_after_a_tombstone_is_rejected(self):
+        dll = LazyDoublyLinkedList([1, 2, 3], compact_threshold=0.0)
+        middle = dll.head.next
+        dll.mark_deleted(middle)  # compacted right away
+        with self.assertRaises(ValueError):
+            dll.insert_after(middle, 99)
+
+        linked_tombstone = self.dll.head.next
+        self.dll.mark_deleted(linked_tombstone)  # threshold of 1 leaves it linked
+        with self.assertRaises(ValueError):
+            self.dll.insert_after(linked_tombstone, 99)
+
+        self.dll.insert_after(self.dll.head, 99)
+        self.assertEqual(list(self.dll), [1, 99, 3, 4, 5])
+        self.assertEqual(len(dll), 2)
+        self.assertEqual(list(dll), [1, 3])
+
+    def test_add_many_next_to_tombstones(self):
+        self.dll.mark_deleted(self.dll.head)
+        self.dll.mark_deleted(self.dll.tail)
+        self.dll.add_many_to_head([0, -1])
+        self.dll.add_many_to_tail([6, 7])
+        self.assertEqual(list(self.dll), [-1, 0, 2, 3, 4, 6, 7])
+        self.assertEqual(len(self.dll), 7)
+
+        self.dll.compact()
+        self.assertEqual([node.value for node in self.nodes()], [-1, 0, 2, 3, 4, 6, 7])
+        self.assertEqual(self.dll.size, 7)
+
+    def test_clear(self):
+        self.dll.mark_deleted(self.dll.head)
+        self.dll.clear()
+        self.assertEqual(len(self.dll), 0)
+        self.assertEqual(self.dll.dead, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+from src.linked_lists.doubly_linked_list.lfu_cache import LFUCache
+
+
+class LFUCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache = LFUCache(2)
+
+    def test_get_missing_key(self):
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.hit_ratio(), 0.0)
+
+    def test_put_and_get(self):
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertEqual(self.cache.get("b"), 2)
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.frequency("a"), 2)
+        self.assertEqual(self.cache.hits, 2)
+
+    def test_evicts_least_frequently_used(self):
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.cache.get("a")
+        self.cache.put("c", 3)  # b has been used the least
+
+        self.assertNotIn("b", self.cache)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertEqual(self.cache.get("c"), 3)
+        self.assertEqual(self.cache.evictions, 1)
+
+    def test_ties_evict_least_recently_used(self):
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.cache.get("a")
+        self.cache.get("b")
+        self.cache.put("c", 3)  # a and b both used twice, a used longest ago
+
+        self.assertNotIn("a", self.cache)
+        self.assertIn("b", self.cache)
+
+    def test_put_existing_key_updates_value(self):
+        self.cache.put("a", 1)
+        self.cache.put("a", 10)
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.frequency("a"), 2)
+        self.assertEqual(self.cache.get("a"), 10)
+
+    def test_evict_empty_cache(self):
+        self.assertIsNone(self.cache.evict())
+        self.cache.put("a", 1)
+        self.assertEqual(self.cache.evict(), "a")
+        self.assertEqual(len(self.cache), 0)
+        self.assertIsNone(self.cache.buckets.head)
+
+    def test_zero_capacity(self):
+        cache = LFUCache(0)
+        cache.put("a", 1)
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get("a"))
+
+    def test_age_halves_frequencies(self):
+        cache = LFUCache(3)
+        cache.put("a", 1)
+        for _ in range(5):
+            cache.get("a")
+        cache.put("b", 2)
+        cache.get("b")
+
+        cache.age()
+        self.assertEqual(cache.frequency("a"), 3)
+        self.assertEqual(cache.frequency("b"), 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.frequency("a"), 4)
+
+    def test_aging_interval_lets_old_keys_go(self):
+        cache = LFUCache(2, aging_interval=4)
+        cache.put("old", 1)  # 1 call
+        cache.get("old")  # 2 calls
+        cache.get("old")  # 3 calls, frequency 3
+        cache.put("new", 2)  # 4 calls, ages: old -> 1, new -> 1
+
+        self.assertEqual(cache.frequency("old"), 1)
+        cache.get("new")
+        cache.put("newer", 3)
+        self.assertNotIn("old", cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from src.linked_lists.doubly_linked_list.doubly_linked_list import DoublyLinkedList
+from src.linked_lists.doubly_linked_list.parallel_reduce import (iter_chunks, parallel_count_if, parallel_map_reduce,
+                                                                 parallel_max, parallel_min, parallel_sum)
+
+
+class ParallelReduceTests(unittest.TestCase):
+    def setUp(self):
+        self.values = [(i * 7919) % 1000 - 500 for i in range(1000)]
+        self.dll = DoublyLinkedList(self.values)
+
+    def test_iter_chunks(self):
+        chunks = list(iter_chunks(DoublyLinkedList([1, 2, 3, 4, 5]), chunk_size=2))
+        self.assertEqual(chunks, [[1, 2], [3, 4], [5]])
+        self.assertEqual(list(iter_chunks(DoublyLinkedList())), [])
+
+    def test_empty_list(self):
+        empty_dll = DoublyLinkedList()
+        self.assertIsNone(parallel_max(empty_dll))
+        self.assertIsNone(parallel_min(empty_dll))
+        self.assertEqual(parallel_sum(empty_dll), 0)
+        self.assertEqual(parallel_count_if(empty_dll, bool), 0)
+
+    def test_single_process(self):
+        self.assertEqual(parallel_max(self.dll, processes=1, chunk_size=64), max(self.values))
+        self.assertEqual(parallel_min(self.dll, processes=1, chunk_size=64), min(self.values))
+        self.assertEqual(parallel_sum(self.dll, processes=1, chunk_size=64), sum(self.values))
+
+    def test_process_pool(self):
+        self.assertEqual(parallel_max(self.dll, processes=2, chunk_size=64), self.dll.get_max())
+        self.assertEqual(parallel_min(self.dll, processes=2, chunk_size=64), min(self.values))
+        self.assertEqual(parallel_sum(self.dll, processes=2, chunk_size=64), sum(self.values))
+        # bool counts the non-zero values
+        self.assertEqual(parallel_count_if(self.dll, bool, processes=2, chunk_size=64),
+                         sum(1 for value in self.values if value))
+
+    def test_custom_map_reduce(self):
+        result = parallel_map_reduce(self.dll, len, max, processes=2, chunk_size=300)
+        self.assertEqual(result, 300)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from src.linked_lists.doubly_linked_list.sentinel_doubly_linked_list import SentinelDoublyLinkedList
+from src.linked_lists.doubly_linked_list.test_doubly_linked_list import DoublyLinkedListTests
+
+
+class SentinelDoublyLinkedListTests(DoublyLinkedListTests):
+    """Runs every DoublyLinkedList test against SentinelDoublyLinkedList"""
+
+    list_class = SentinelDoublyLinkedList
+
+    def test_list_delete_clears_links(self):
+        # the ends of the list point at the sentinel instead of None
+        long_dll = self.list_class([1, 2, 3, 4])
+        old_head = long_dll.head
+        long_dll.delete(old_head)
+        self.assertIs(long_dll.head.prev, long_dll.sentinel)
+        self.assertIsNone(old_head.next)
+
+        old_tail = long_dll.tail
+        long_dll.delete(old_tail)
+        self.assertIs(long_dll.tail.next, long_dll.sentinel)
+        self.assertIsNone(old_tail.prev)
+        self.assertEqual(long_dll.__repr__(), "DLL=[Node(2) -> Node(3)]")
+
+        # deleting a node twice does nothing the second time
+        self.assertIsNone(long_dll.delete(old_tail))
+        self.assertEqual(len(long_dll), 2)
+
+    def test_empty_list_is_sentinel_loop(self):
+        empty_dll = self.list_class([1])
+        empty_dll.remove_head()
+        self.assertIs(empty_dll.sentinel.next, empty_dll.sentinel)
+        self.assertIs(empty_dll.sentinel.prev, empty_dll.sentinel)
+
+
+# keep unittest/pytest from running the DoublyLinkedList tests a second time from this module
+del DoublyLinkedListTests
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import random
+import threading
+import unittest
+from src.linked_lists.doubly_linked_list.snapshot_doubly_linked_list import SnapshotDoublyLinkedList
+
+
+class SnapshotDoublyLinkedListTests(unittest.TestCase):
+    def setUp(self):
+        self.dll = SnapshotDoublyLinkedList([1, 2, 3, 4])
+
+    def test_writes(self):
+        self.dll.add_to_head(0)
+        self.dll.add_to_tail(5)
+        self.assertEqual(list(self.dll), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(self.dll.remove_head(), 0)
+        self.assertEqual(self.dll.remove_tail(), 5)
+        self.dll.move_to_front(self.dll.tail)
+        self.dll.move_to_end(self.dll.head.next)
+        self.assertEqual(list(self.dll), [4, 2, 3, 1])
+        self.assertEqual(self.dll.delete(self.dll.head.next), 2)
+        self.assertEqual(list(self.dll), [4, 3, 1])
+        self.assertEqual(len(self.dll), 3)
+
+    def test_snapshot_is_isolated(self):
+        with self.dll.snapshot() as before:
+            self.dll.move_to_front(self.dll.tail)
+            self.dll.delete(self.dll.head.next)
+            self.dll.add_to_tail(9)
+            self.dll.remove_head()
+
+            self.assertEqual(list(before), [1, 2, 3, 4])
+            self.assertEqual(list(self.dll), [2, 3, 9])
+            # a snapshot can be iterated again and still sees the same version
+            self.assertEqual(list(before), [1, 2, 3, 4])
+
+        with self.assertRaises(ValueError):
+            list(before)
+        self.assertEqual(self.dll.active_readers, {})
+
+    def test_history_is_pruned(self):
+        node = self.dll.head
+        for _ in range(100):
+            self.dll.move_to_end(node)
+            self.dll.move_to_front(node)
+
+        self.assertLessEqual(len(node.next_versions), 2)
+        self.assertLessEqual(len(self.dll.head_versions), 2)
+
+    def test_readers_see_consistent_versions_while_writers_run(self):
+        values = list(range(50))
+        dll = SnapshotDoublyLinkedList(values)
+        stop = threading.Event()
+        failures = []
+
+        # writers only move nodes around, so every node stays in the list
+        nodes = []
+        node = dll.head
+        while node is not None:
+            nodes.append(node)
+            node = node.next
+
+        def writer():
+            rng = random.Random(1)
+            while not stop.is_set():
+                node = rng.choice(nodes)
+                if rng.random() < 0.5:
+                    dll.move_to_front(node)
+                else:
+                    dll.move_to_end(node)
+
+        def reader():
+            for _ in range(200):
+                seen = list(dll)
+                # every snapshot is some ordering of exactly the same values
+                if sorted(seen) != values:
+                    failures.append(seen)
+
+        writers = [threading.Thread(target=writer) for _ in range(2)]
+        readers = [threading.Thread(target=reader) for _ in range(3)]
+        for thread in writers + readers:
+            thread.start()
+        for thread in readers:
+            thread.join()
+        stop.set()
+        for thread in writers:
+            thread.join()
+
+        self.assertEqual(failures, [])
+        self.assertEqual(sorted(dll), values)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import asyncio
+import random
+import unittest
+from src.linked_lists.doubly_linked_list.timer_wheel import TimerWheel
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TimerWheelTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        # small wheel (4 ** 3 = 64 ticks) so tests cross every level
+        self.wheel = TimerWheel(tick=1, slots=4, levels=3, clock=self.clock)
+        self.fired = []
+
+    def test_schedule_and_advance(self):
+        self.wheel.schedule(3, self.fired.append, "a")
+        self.assertEqual(len(self.wheel), 1)
+        self.assertEqual(self.wheel.advance(2), 0)
+        self.assertEqual(self.fired, [])
+        self.assertEqual(self.wheel.advance(3), 1)
+        self.assertEqual(self.fired, ["a"])
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_zero_delay_fires_on_next_tick(self):
+        self.wheel.schedule(0, self.fired.append, "a")
+        self.wheel.advance(0)
+        self.assertEqual(self.fired, [])
+        self.wheel.advance(1)
+        self.assertEqual(self.fired, ["a"])
+
+    def test_cancel(self):
+        handle = self.wheel.schedule(5, self.fired.append, "a")
+        self.wheel.schedule(5, self.fired.append, "b")
+        self.assertTrue(handle.pending())
+        self.assertTrue(self.wheel.cancel(handle))
+        self.assertFalse(handle.pending())
+        self.assertFalse(self.wheel.cancel(handle))
+        self.assertEqual(len(self.wheel), 1)
+
+        self.wheel.advance(10)
+        self.assertEqual(self.fired, ["b"])
+        self.assertFalse(self.wheel.cancel(None))
+
+    def test_fires_in_deadline_order_across_levels(self):
+        delays = list(range(1, 200))
+        random.Random(7).shuffle(delays)
+        for delay in delays:
+            self.wheel.schedule(delay, lambda d=delay: self.fired.append((d, self.wheel.current_tick)))
+
+        self.wheel.advance(100)
+        self.assertEqual(len(self.fired), 100)
+        self.wheel.advance(250)
+        # every timer fired on exactly its deadline tick, in order
+        self.assertEqual(self.fired, [(d, d) for d in range(1, 200)])
+
+    def test_callbacks_can_reschedule(self):
+        def repeat():
+            self.fired.append(self.wheel.current_tick)
+            if len(self.fired) < 3:
+                self.wheel.schedule(2, repeat)
+
+        self.wheel.schedule(2, repeat)
+        self.wheel.advance(20)
+        self.assertEqual(self.fired, [2, 4, 6])
+
+    def test_asyncio_run(self):
+        async def main():
+            wheel = TimerWheel(tick=0.001)
+            stop = asyncio.Event()
+            wheel.schedule(0.005, stop.set)
+            await asyncio.wait_for(wheel.run(stop), timeout=5)
+            return len(wheel)
+
+        self.assertEqual(asyncio.run(main()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
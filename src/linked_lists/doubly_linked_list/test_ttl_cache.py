@@ -0,0 +1,77 @@
+import unittest
+from src.linked_lists.doubly_linked_list.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TTLCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = TTLCache(10, clock=self.clock)
+
+    def test_put_and_get(self):
+        self.cache.put("a", 1)
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertIn("a", self.cache)
+        self.assertEqual(len(self.cache), 1)
+        self.assertIsNone(self.cache.get("b"))
+
+    def test_get_expires_lazily(self):
+        self.cache.put("a", 1)
+        self.clock.now = 10
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(len(self.cache), 0)
+        self.assertIsNone(self.cache.expiry_list.head)
+
+    def test_put_keeps_list_ordered_by_expiry(self):
+        self.cache.put("a", 1)
+        self.clock.now = 1
+        self.cache.put("b", 2)
+        self.clock.now = 2
+        self.cache.put("a", 3)
+
+        self.assertEqual(self.cache.expiry_list.head.value.key, "b")
+        self.assertEqual(self.cache.expiry_list.tail.value.key, "a")
+        self.clock.now = 11
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("a"), 3)
+
+    def test_refresh(self):
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        self.clock.now = 5
+        self.assertTrue(self.cache.refresh("a"))
+        self.assertEqual(self.cache.expiry_list.tail.value.key, "a")
+        self.clock.now = 12
+        self.assertFalse(self.cache.refresh("b"))
+        self.assertEqual(self.cache.get("a"), 1)
+
+    def test_delete(self):
+        self.cache.put("a", 1)
+        self.assertEqual(self.cache.delete("a"), 1)
+        self.assertIsNone(self.cache.delete("a"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_sweep_is_bounded(self):
+        for i in range(5):
+            self.cache.put(i, i)
+        self.clock.now = 1
+        self.cache.put("live", True)
+
+        self.clock.now = 10
+        self.assertEqual(self.cache.sweep(max_items=2), 2)
+        self.assertEqual(len(self.cache), 4)
+        self.assertEqual(self.cache.sweep(), 3)
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.sweep(), 0)
+        self.assertTrue(self.cache.get("live"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+A hierarchical timer wheel schedules callbacks to run after a delay.
+
+Time is cut into ticks. Level 0 of the wheel is a ring of `slots` buckets, one per
+tick, like the second hand of a clock. Level 1 is another ring where each bucket
+covers `slots` ticks (the minute hand), level 2 covers `slots * slots` ticks, etc.
+
+Each bucket is a DoublyLinkedList of TimerHandles, so:
+
+    * schedule() is an add_to_tail on the right bucket: O(1)
+    * cancel() is a delete(node) on the bucket the handle remembers: O(1)
+
+Every time level 0 wraps around, the next bucket of level 1 is "cascaded": its
+timers are re-placed into level 0 (or another level), now that they are closer.
+"""
+import math
+import time
+
+from src.linked_lists.doubly_linked_list.doubly_linked_list import DoublyLinkedList
+
+
+class TimerHandle:
+    """Returned by TimerWheel.schedule, and passed to TimerWheel.cancel"""
+
+    def __init__(self, deadline, callback, args):
+        self.deadline = deadline  # the tick this timer should fire on
+        self.callback = callback
+        self.args = args
+        self.node = None  # the node holding this handle in its bucket
+        self.bucket = None  # the DoublyLinkedList that node lives in (None once fired or cancelled)
+
+    def __repr__(self):
+        return f"TimerHandle({self.deadline}, {self.callback!r})"
+
+    def pending(self):
+        """returns True if this timer has neither fired nor been cancelled"""
+
+        return self.bucket is not None
+
+
+class TimerWheel:
+    def __init__(self, tick=0.001, slots=256, levels=4, clock=time.monotonic):
+        """
+        Constructs an empty TimerWheel
+
+        :param tick: the length of one tick in seconds
+        :param slots: number of buckets in each level of the wheel
+        :param levels: number of levels. Delays longer than tick * slots ** levels
+        still work, they just get cascaded more than once.
+        :param clock: a function returning the current time in seconds
+        (defaults to time.monotonic)
+        """
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        self.clock = clock
+        self.start = clock()
+        self.current_tick = 0
+        self.size = 0  # number of pending timers
+
+        self.wheels = [[DoublyLinkedList() for _ in range(slots)] for _ in range(levels)]
+
+    def __len__(self):
+        return self.size
+
+    def schedule(self, delay, callback, *args):
+        """
+        Runs callback(*args) once at least `delay` seconds have been advanced past
+
+        Timers always fire on a later tick than the current one, even with a delay of 0,
+        so a callback that schedules itself again can't loop forever inside advance().
+
+        :return: a TimerHandle that can be given to cancel()
+        """
+
+        ticks = max(1, math.ceil(delay / self.tick))
+        handle = TimerHandle(self.current_tick + ticks, callback, args)
+        self._place(handle)
+        self.size += 1
+        return handle
+
+    def cancel(self, handle):
+        """
+        Stops a pending timer from firing
+
+        :return: True if the timer was cancelled, False if it already fired or was cancelled
+        """
+
+        if handle is None or handle.bucket is None:
+            return False
+
+        handle.bucket.delete(handle.node)
+        handle.bucket = handle.node = None
+        self.size -= 1
+        return True
+
+    def advance(self, now=None):
+        """
+        Moves the wheel forward to the given time, firing every timer that is due
+
+        :param now: the time to advance to (defaults to clock())
+        :return: the number of timers fired
+        """
+
+        if now is None:
+            now = self.clock()
+
+        target_tick = int((now - self.start) / self.tick)
+        fired = 0
+
+        while self.current_tick < target_tick:
+            self.current_tick += 1
+
+            # if lower levels just wrapped around, pull the next bucket of the level above down
+            span = self.slots
+            for level in range(1, self.levels):
+                if self.current_tick % span != 0:
+                    break
+                self._cascade(level, (self.current_tick // span) % self.slots)
+                span *= self.slots
+
+            bucket = self.wheels[0][self.current_tick % self.slots]
+            while bucket.head is not None:
+                handle = bucket.remove_head()
+                handle.bucket = handle.node = None
+                self.size -= 1
+                fired += 1
+                handle.callback(*handle.args)
+
+        return fired
+
+    async def run(self, stop_event=None):
+        """
+        Advances the wheel once per tick from inside an asyncio event loop
+
+        :param stop_event: optional asyncio.Event; run returns once it is set
+        """
+        import asyncio  # imported here so programs that never use asyncio don't pay for it
+
+        while stop_event is None or not stop_event.is_set():
+            await asyncio.sleep(self.tick)
+            self.advance()
+
+    def _place(self, handle):
+        """adds handle to the bucket matching how far away its deadline is"""
+
+        ticks_left = handle.deadline - self.current_tick
+        deadline = handle.deadline
+        span = 1
+
+        for level in range(self.levels):
+            if ticks_left < span * self.slots:
+                break
+            # only move up a level if there is one
+            if level < self.levels - 1:
+                span *= self.slots
+        else:
+            # too far away for even the top level;
+            # park it in the furthest top-level bucket and let cascading bring it back
+            deadline = self.current_tick + span * self.slots - 1
+            level = self.levels - 1
+
+        bucket = self.wheels[level][(deadline // span) % self.slots]
+        bucket.add_to_tail(handle)
+        handle.node = bucket.tail
+        handle.bucket = bucket
+
+    def _cascade(self, level, index):
+        """re-places every timer in the given bucket now that they are closer"""
+
+        bucket = self.wheels[level][index]
+        while bucket.head is not None:
+            self._place(bucket.remove_head())
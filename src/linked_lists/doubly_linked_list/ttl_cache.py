@@ -0,0 +1,141 @@
+"""
+A TTL (time-to-live) cache forgets each key a fixed amount of time after it was last written.
+
+Every key lives in a DoublyLinkedList ordered by expiry time. Because every key
+gets the same ttl, writing (or refreshing) a key always makes it the LAST to
+expire, so we just move its node to the end of the list. That keeps the list
+sorted without ever comparing expiry times, and the stalest key is always at head.
+
+Expired keys are dropped in two ways:
+
+    1. lazily, when get() finds one
+    2. by sweep(), which only looks at the head of the list and can be told to stop
+       after a fixed amount of work, so background cleanup never stalls a caller
+"""
+import time
+from typing import Optional
+
+from src.linked_lists.doubly_linked_list.doubly_linked_list import DoublyLinkedList
+
+
+class TTLEntry:
+    """The value stored in each node of the expiry list"""
+
+    def __init__(self, key, value, expires_at):
+        self.key = key
+        self.value = value
+        self.expires_at = expires_at
+
+    def __repr__(self):
+        return f"TTLEntry({self.key!r}, {self.value!r}, {self.expires_at})"
+
+
+class TTLCache:
+    def __init__(self, ttl: float, clock=time.monotonic):
+        """
+        Constructs an empty TTLCache
+
+        :param ttl: how many seconds a key lives after it was last written
+        :param clock: a function returning the current time in seconds
+        (defaults to time.monotonic)
+        """
+        self.ttl = ttl
+        self.clock = clock
+        self.storage = {}  # key -> node in expiry list
+        self.expiry_list = DoublyLinkedList()  # soonest to expire at head
+
+    def __len__(self):
+        """returns the number of keys held, including expired keys not yet swept"""
+
+        return len(self.storage)
+
+    def __contains__(self, key):
+        return self._live_node(key) is not None
+
+    def put(self, key, value):
+        """stores value under key, (re)starting its time to live"""
+
+        expires_at = self.clock() + self.ttl
+        node = self.storage.get(key)
+
+        # if key is new, it goes at the end of the list (it expires last)
+        if node is None:
+            self.expiry_list.add_to_tail(TTLEntry(key, value, expires_at))
+            self.storage[key] = self.expiry_list.tail
+            return
+
+        # else, update the entry and move it to the end of the list
+        node.value.value = value
+        node.value.expires_at = expires_at
+        self.expiry_list.move_to_end(node)
+
+    def get(self, key):
+        """returns the value for key, or None if it is missing or expired"""
+
+        node = self._live_node(key)
+        if node is None:
+            return None
+
+        return node.value.value
+
+    def refresh(self, key):
+        """
+        Restarts the time to live for key without changing its value
+
+        :return: True if key was refreshed, False if it is missing or expired
+        """
+
+        node = self._live_node(key)
+        if node is None:
+            return False
+
+        node.value.expires_at = self.clock() + self.ttl
+        self.expiry_list.move_to_end(node)
+        return True
+
+    def delete(self, key):
+        """removes key from the cache and returns its value (or None)"""
+
+        node = self.storage.pop(key, None)
+        if node is None:
+            return None
+
+        self.expiry_list.delete(node)
+        return node.value.value
+
+    def sweep(self, max_items: Optional[int] = None):
+        """
+        Removes expired keys, starting with the stalest
+
+        :param max_items: optional limit on how many keys to remove in this call.
+        Call sweep again later to continue where this one stopped.
+        :return: the number of keys removed
+        """
+
+        now = self.clock()
+        removed = 0
+
+        # the list is sorted by expiry, so we can stop at the first live key
+        while self.expiry_list.head is not None and self.expiry_list.head.value.expires_at <= now:
+            if max_items is not None and removed >= max_items:
+                break
+
+            entry = self.expiry_list.remove_head()
+            del self.storage[entry.key]
+            removed += 1
+
+        return removed
+
+    def _live_node(self, key):
+        """returns the node for key, dropping it first if it has expired"""
+
+        node = self.storage.get(key)
+        if node is None:
+            return None
+
+        if node.value.expires_at <= self.clock():
+            del self.storage[key]
+            self.expiry_list.delete(node)
+            return None
+
+        return node
@@ -0,0 +1,186 @@
+"""
+A delay queue only hands out an item once its delay has passed, which is handy
+for retries and backoff: instead of re-enqueueing a failed job and polling,
+enqueue it with a delay and it comes back out when it's due.
+
+Items live in a binary heap (heapq) ordered by deadline, so:
+
+    * enqueue is O(log n)
+    * dequeue is O(log n), and only looks at the front of the heap
+    * finding how long until the next item is ready is O(1)
+
+Items with the same deadline come out in the order they were enqueued.
+
+dequeue() never waits. dequeue_wait() blocks the calling thread, and
+dequeue_async() suspends the calling coroutine, until an item is ready (waking
+early if an item with an earlier deadline is enqueued meanwhile). Deadlines and
+timeouts are both measured with the queue's clock, but the waiting itself sleeps
+in real seconds, so a clock used with the waiting methods has to keep real time.
+"""
+import heapq
+import threading
+import time
+
+
+class DelayQueue:
+    def __init__(self, clock=time.monotonic):
+        """
+        Constructs an empty DelayQueue
+
+        :param clock: a function returning the current time in seconds
+        (defaults to time.monotonic); dequeue_wait and dequeue_async sleep for real,
+        so with them the clock has to tick in real seconds
+        """
+        self.clock = clock
+        self.storage = []  # heap of (deadline, sequence, value)
+        self.next_sequence = 0  # keeps equal deadlines in FIFO order
+        self.not_empty = threading.Condition()
+        self.async_waiters = []  # (event loop, future) of every waiting coroutine
+
+    def __len__(self):
+        """returns the number of items in the queue, ready or not"""
+
+        return len(self.storage)
+
+    def enqueue(self, value, delay=0):
+        """adds value to the queue, to be handed out `delay` seconds from now"""
+
+        with self.not_empty:
+            self._push(value, delay)
+            self._wake_waiters()
+
+    def enqueue_many(self, values, delay=0):
+        """adds every value with the same delay, waking waiters once for the whole batch"""
+
+        with self.not_empty:
+            for value in values:
+                self._push(value, delay)
+            self._wake_waiters()
+
+    def dequeue(self):
+        """removes and returns the next ready value, or None if no item is ready yet"""
+
+        with self.not_empty:
+            if not self.storage or self.storage[0][0] > self.clock():
+                return None  # nothing ready, nothing to return
+
+            return heapq.heappop(self.storage)[2]
+
+    def dequeue_many(self, n):
+        """removes and returns up to n ready values, soonest deadline first"""
+
+        values = []
+        with self.not_empty:
+            now = self.clock()
+            while len(values) < n and self.storage and self.storage[0][0] <= now:
+                values.append(heapq.heappop(self.storage)[2])
+
+        return values
+
+    def peek(self):
+        """returns the next ready value without removing it, or None if no item is ready yet"""
+
+        with self.not_empty:
+            if not self.storage or self.storage[0][0] > self.clock():
+                return None
+
+            return self.storage[0][2]
+
+    def peek_many(self, n):
+        """returns up to n ready values, soonest deadline first, without removing them"""
+
+        with self.not_empty:
+            now = self.clock()
+            return [value for deadline, _, value in heapq.nsmallest(max(n, 0), self.storage)
+                    if deadline <= now]
+
+    def next_delay(self):
+        """returns how many seconds until the next item is ready (0 if one is), or None if empty"""
+
+        with self.not_empty:
+            return self._time_to_next()
+
+    def dequeue_wait(self, timeout=None):
+        """
+        Removes and returns the next value, blocking until one is ready
+
+        :param timeout: optional number of seconds to wait at most
+        :return: the value, or None if timeout passed first
+        """
+
+        end = None if timeout is None else self.clock() + timeout
+
+        with self.not_empty:
+            while True:
+                wait = self._time_to_next()
+                if wait == 0:
+                    return heapq.heappop(self.storage)[2]
+
+                if end is not None:
+                    remaining = end - self.clock()
+                    if remaining <= 0:
+                        return None
+                    wait = remaining if wait is None else min(wait, remaining)
+
+                # woken early by enqueue, so an earlier deadline is noticed right away
+                self.not_empty.wait(wait)
+
+    async def dequeue_async(self, timeout=None):
+        """
+        Removes and returns the next value, suspending the coroutine until one is ready
+
+        :param timeout: optional number of seconds to wait at most
+        :return: the value, or None if timeout passed first
+        """
+        import asyncio  # imported here so programs that never use asyncio don't pay for it
+
+        loop = asyncio.get_running_loop()
+        end = None if timeout is None else self.clock() + timeout
+
+        while True:
+            with self.not_empty:
+                wait = self._time_to_next()
+                if wait == 0:
+                    return heapq.heappop(self.storage)[2]
+
+                if end is not None:
+                    remaining = end - self.clock()
+                    if remaining <= 0:
+                        return None
+                    wait = remaining if wait is None else min(wait, remaining)
+
+                waiter = (loop, loop.create_future())
+                self.async_waiters.append(waiter)
+
+            try:
+                await asyncio.wait([waiter[1]], timeout=wait)
+            finally:
+                with self.not_empty:
+                    if waiter in self.async_waiters:
+                        self.async_waiters.remove(waiter)
+
+    def _push(self, value, delay):
+        heapq.heappush(self.storage, (self.clock() + delay, self.next_sequence, value))
+        self.next_sequence += 1
+
+    def _time_to_next(self):
+        """seconds until the front item is ready (0 if it is), or None if empty; call with the lock held"""
+
+        if not self.storage:
+            return None
+
+        return max(0.0, self.storage[0][0] - self.clock())
+
+    def _wake_waiters(self):
+        """wakes every blocked thread and coroutine so they can look at the new front; call with the lock held"""
+
+        self.not_empty.notify_all()
+
+        for loop, future in self.async_waiters:
+            loop.call_soon_threadsafe(_resolve, future)
+        self.async_waiters.clear()
+
+
+def _resolve(future):
+    if not future.done():
+        future.set_result(None)
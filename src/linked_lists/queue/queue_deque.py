@@ -4,6 +4,7 @@ If you're coding on the GCA, my personal recommendation for
 implementing a queue would look like this.
 """
 from collections import deque
+from itertools import islice
 
 
 class Queue:
@@ -22,6 +23,22 @@ class Queue:
 
         return self.storage.pop()  # _remove from tail
 
+    def enqueue_many(self, values):
+        self.storage.extendleft(values)  # add each to head, in order
+
+    def dequeue_many(self, n):
+        pop = self.storage.pop
+        return [pop() for _ in range(min(n, len(self.storage)))]  # _remove from tail
+
+    def peek(self):
+        if len(self.storage) == 0:
+            return None
+
+        return self.storage[-1]
+
+    def peek_many(self, n):
+        return list(islice(reversed(self.storage), max(n, 0)))
+
 
 # or, more likely, you'll have some problem to solve that will use a queue
 def use_queue():
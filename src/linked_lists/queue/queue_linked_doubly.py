@@ -34,3 +34,30 @@ class Queue:
 
         self.size -= 1
         return self.storage.remove_tail()  # _remove from tail
+
+    def enqueue_many(self, values):
+        values = list(values)
+        self.size += len(values)
+        self.storage.add_many_to_head(values)  # add to head
+
+    def dequeue_many(self, n):
+        dequeued = self.storage.remove_many_from_tail(n)  # _remove from tail
+        self.size -= len(dequeued)
+        return dequeued
+
+    def peek(self):
+        if self.size == 0:
+            return None
+
+        return self.storage.tail.value
+
+    def peek_many(self, n):
+        values = []
+        current_node = self.storage.tail
+
+        # walk back from the tail (the next item to dequeue)
+        while current_node is not None and len(values) < n:
+            values.append(current_node.value)
+            current_node = current_node.prev
+
+        return values
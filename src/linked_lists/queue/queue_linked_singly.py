@@ -13,12 +13,16 @@ return elements in First In First Out order.
 Stretch: What if you could only use instances of your Stack class to implement the Queue?
          What would that look like? How many Stacks would you need? Try it!
 """
+from itertools import islice
+
 from src.linked_lists.singly_linked_list.singly_linked_list import LinkedList
 
 
 class Queue:
     def __init__(self):
         self.size = 0
+        # items join at the tail and leave from the head: a singly linked list can
+        # only remove its tail by walking the whole list, but removing its head is O(1)
         self.storage = LinkedList()
 
     def __len__(self):
@@ -26,11 +30,30 @@ class Queue:
 
     def enqueue(self, value):
         self.size += 1
-        self.storage.add_to_head(value)  # add to head
+        self.storage.add_to_tail(value)  # add to tail
 
     def dequeue(self):
         if self.size == 0:
             return None  # nothing to _remove, nothing to return
 
         self.size -= 1
-        return self.storage.remove_tail()  # _remove from tail
+        return self.storage.remove_head()  # _remove from head
+
+    def enqueue_many(self, values):
+        values = list(values)
+        self.size += len(values)
+        self.storage.add_many_to_tail(values)  # add to tail
+
+    def dequeue_many(self, n):
+        dequeued = self.storage.remove_many_from_head(n)  # _remove from head
+        self.size -= len(dequeued)
+        return dequeued
+
+    def peek(self):
+        if self.size == 0:
+            return None
+
+        return self.storage.head.value
+
+    def peek_many(self, n):
+        return list(islice(self.storage, max(n, 0)))  # next n items, in dequeue order
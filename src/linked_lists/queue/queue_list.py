@@ -0,0 +1,57 @@
+class Queue:
+    def __init__(self):
+        # items are appended to the end of the list and read from `front` onwards.
+        # inserting at (or deleting from) the start of a list shifts every item, so
+        # instead of deleting dequeued items one at a time, the front index just moves
+        # forward and the dead slots are cut off in one go once they're half the list.
+        self.storage = []
+        self.front = 0
+
+    def __len__(self):
+        return len(self.storage) - self.front
+
+    def enqueue(self, value):
+        self.storage.append(value)  # add to tail
+
+    def dequeue(self):
+        if self.front == len(self.storage):
+            return None  # nothing to _remove, nothing to return
+
+        value = self.storage[self.front]  # _remove from front
+        self.storage[self.front] = None  # don't keep the dequeued item alive
+        self.front += 1
+        self._compact()
+        return value
+
+    def enqueue_many(self, values):
+        self.storage.extend(values)  # add to tail
+
+    def dequeue_many(self, n):
+        if n <= 0:
+            return []
+
+        end = min(self.front + n, len(self.storage))
+        dequeued = self.storage[self.front:end]  # _remove from front
+        self.storage[self.front:end] = [None] * (end - self.front)
+        self.front = end
+        self._compact()
+        return dequeued
+
+    def peek(self):
+        if self.front == len(self.storage):
+            return None
+
+        return self.storage[self.front]
+
+    def peek_many(self, n):
+        if n <= 0:
+            return []
+
+        return self.storage[self.front:self.front + n]  # next n items, in dequeue order
+
+    def _compact(self):
+        """drops the dequeued slots once they make up half the list (amortized O(1) per dequeue)"""
+
+        if self.front * 2 >= len(self.storage):
+            del self.storage[:self.front]
+            self.front = 0
@@ -0,0 +1,150 @@
+"""
+A multi-level queue keeps one Queue per priority level. Level 0 is the highest priority.
+
+Finding the highest non-empty level doesn't scan the levels: an int bitmap has bit
+i set whenever level i has items, and `bitmap & -bitmap` isolates the lowest set bit
+(the highest priority non-empty level) in one step.
+
+Two things keep low levels from starving:
+
+    * quotas: a level with a quota of q serves at most q items in a round while lower
+      levels are waiting. Then the next waiting level below gets its turn (its quota,
+      or one item if it has none), and so on down; a new round starts once no waiting
+      level has a turn left.
+    * aging: an item that has waited aging_interval dequeues at its level moves up one
+      level. Each level is FIFO, so only the front of each level has to be checked.
+
+Every level is an instance of queue_class, so any Queue in this package with
+enqueue, dequeue, peek and __len__ can be plugged in.
+"""
+from typing import Optional
+
+from src.linked_lists.queue.queue_deque import Queue
+
+
+class MultiLevelQueue:
+    def __init__(self, levels=8, queue_class=Queue, quotas: Optional[list] = None,
+                 aging_interval: Optional[int] = None):
+        """
+        Constructs an empty MultiLevelQueue
+
+        :param levels: number of priority levels
+        :param queue_class: the Queue backend used for every level
+        :param quotas: optional list with the most items each level may serve in a row
+        while lower levels wait (None in the list means no limit for that level)
+        :param aging_interval: optional number of dequeues after which a waiting item
+        is promoted one level
+        """
+        if quotas is not None and len(quotas) != levels:
+            raise ValueError(f"expected one quota per level ({levels}), got {len(quotas)}")
+
+        self.levels = [queue_class() for _ in range(levels)]
+        self.quotas = quotas or [None] * levels
+        self.aging_interval = aging_interval
+
+        self.bitmap = 0  # bit i is set when level i is non-empty
+        self.exhausted = 0  # bit i is set when level i has had its turn this round
+        self.served = [0] * levels  # items served by each level this round
+        self.size = 0
+        self.ticks = 0  # number of dequeues so far, used to age items
+
+    def __len__(self):
+        return self.size
+
+    def enqueue(self, value, level=0):
+        """adds value to the back of the given level"""
+
+        # items are stored with the tick they (last) arrived at their level
+        self.levels[level].enqueue((self.ticks, value))
+        self.bitmap |= 1 << level
+        self.size += 1
+
+    def dequeue(self):
+        """removes and returns the next value, or None if the queue is empty"""
+
+        item = self.dequeue_with_level()
+        return None if item is None else item[1]
+
+    def dequeue_with_level(self):
+        """
+        Removes the next value and returns (level, value), or None if the queue is empty
+
+        Knowing the level lets a scheduler re-enqueue a job one level lower if it used
+        its whole time slice (the "feedback" in multi-level feedback queue).
+        """
+
+        if self.size == 0:
+            return None  # nothing to _remove, nothing to return
+
+        self.ticks += 1
+        if self.aging_interval is not None:
+            self.age()
+
+        eligible = self.bitmap & ~self.exhausted
+        # every waiting level used its quota, so start a new round
+        if eligible == 0:
+            self._new_round()
+            eligible = self.bitmap
+
+        level = (eligible & -eligible).bit_length() - 1  # lowest set bit
+        queue = self.levels[level]
+        _, value = queue.dequeue()
+
+        if len(queue) == 0:
+            self.bitmap &= ~(1 << level)
+
+        quota = self.quotas[level]
+        if quota is not None:
+            self.served[level] += 1
+            if self.served[level] >= quota:
+                self.exhausted |= 1 << level
+
+        # a level without a quota only gets through when a higher level used up its quota;
+        # one item is its turn, so the levels below it get theirs before a new round starts
+        if quota is None and self.exhausted & ((1 << level) - 1):
+            self.exhausted |= 1 << level
+
+        self.size -= 1
+        return level, value
+
+    def _new_round(self):
+        self.exhausted = 0
+        self.served = [0] * len(self.levels)
+
+    def peek_level(self):
+        """returns the highest priority non-empty level, or None if the queue is empty"""
+
+        if self.bitmap == 0:
+            return None
+
+        return (self.bitmap & -self.bitmap).bit_length() - 1
+
+    def age(self):
+        """
+        Promotes every item that has waited aging_interval dequeues one level up
+
+        :return: the number of items promoted
+        """
+
+        if self.aging_interval is None:
+            return 0
+
+        promoted = 0
+        waiting = self.bitmap & ~1  # level 0 has nowhere to go
+
+        while waiting:
+            level = (waiting & -waiting).bit_length() - 1
+            waiting &= waiting - 1  # clear that bit
+            queue = self.levels[level]
+
+            # the level is FIFO, so the longest waiting items are at the front
+            while len(queue) > 0 and self.ticks - queue.peek()[0] >= self.aging_interval:
+                _, value = queue.dequeue()
+                self.levels[level - 1].enqueue((self.ticks, value))
+                self.bitmap |= 1 << (level - 1)
+                promoted += 1
+
+            if len(queue) == 0:
+                self.bitmap &= ~(1 << level)
+
+        return promoted
@@ -0,0 +1,286 @@
+"""
+A queue that survives the process crashing, by writing every item to disk first.
+
+Items are appended to a write-ahead log split into segment files, each named after
+the sequence number of its first item:
+
+    00000000000000000000.log
+    00000000000000001873.log   <- writer appends here
+
+Each record is a small header (payload length and CRC32) followed by the pickled
+item. A separate "head" file remembers how far the reader has got: the segment it is
+reading, the sequence number of the next item and the byte offset into that segment.
+Segments the reader has moved past are deleted by the next commit, once the head
+file no longer points into them (compaction).
+
+Durability is batched ("group commit"): the log and head file are flushed, and
+fsync'ed if fsync is True, once every `sync_every` enqueues/dequeues, or whenever
+commit() is called. A crash can lose enqueues since the last commit, and replay
+dequeues since the last commit (so items are delivered at least once).
+
+Recovery only reads the head file and scans the LAST segment (to find where to
+keep writing, and to cut off a record that was half-written during a crash), so
+reopening a big queue doesn't mean reading all of it.
+"""
+import os
+import pickle
+import struct
+import zlib
+
+HEADER = struct.Struct(">II")  # payload length, CRC32 of payload
+SEGMENT_SUFFIX = ".log"
+HEAD_FILE = "head"
+
+
+class Queue:
+    def __init__(self, directory, segment_bytes=16 * 1024 * 1024, sync_every=1, fsync=True):
+        """
+        Opens (or creates) a persistent queue stored in the given directory
+
+        :param directory: where segment files and the head file live
+        :param segment_bytes: a new segment is started once the current one is this big
+        :param sync_every: commit after this many enqueues/dequeues (1 commits every call)
+        :param fsync: whether commit waits for the OS to put the data on disk.
+        Without it, committed data survives the process crashing but not the machine.
+        """
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.sync_every = sync_every
+        self.fsync = fsync
+        self.uncommitted = 0  # enqueues/dequeues since last commit
+
+        os.makedirs(directory, exist_ok=True)
+        self._recover()
+
+    def __len__(self):
+        return self.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def enqueue(self, value):
+        self._append(value)
+        self._count_operations(1)
+
+    def dequeue(self):
+        if self.size == 0:
+            return None  # nothing to _remove, nothing to return
+
+        value = self._read_next()
+        self._count_operations(1)
+        return value
+
+    def enqueue_many(self, values):
+        """enqueues every value, committing (at most) once for the whole batch"""
+
+        count = 0
+        for value in values:
+            self._append(value)
+            count += 1
+
+        self._count_operations(count)
+
+    def dequeue_many(self, n):
+        """dequeues up to n values, committing (at most) once for the whole batch"""
+
+        values = [self._read_next() for _ in range(min(n, self.size))]
+        self._count_operations(len(values))
+        return values
+
+    def peek(self):
+        values = self.peek_many(1)
+        return values[0] if values else None
+
+    def peek_many(self, n):
+        """returns the next n values without dequeuing them"""
+
+        values = []
+        if n <= 0 or self.size == 0:
+            return values
+
+        self.writer.flush()
+        offset = self.read_offset
+
+        # read ahead with separate file handles, so the reader's position doesn't move
+        for first_sequence in self.segments:
+            with open(self._segment_path(first_sequence), "rb") as segment:
+                segment.seek(offset)
+                while len(values) < n:
+                    header = segment.read(HEADER.size)
+                    if len(header) < HEADER.size:
+                        break
+                    length, _ = HEADER.unpack(header)
+                    values.append(pickle.loads(segment.read(length)))
+
+            if len(values) == n:
+                break
+            offset = 0  # every segment after the first is read from the start
+
+        return values
+
+    def commit(self):
+        """makes every enqueue and dequeue so far durable"""
+
+        self.writer.flush()
+        if self.fsync:
+            os.fsync(self.writer.fileno())
+
+        # write the head to a temporary file first, so a crash can't leave half a head file
+        head_path = os.path.join(self.directory, HEAD_FILE)
+        temporary_path = head_path + ".tmp"
+        with open(temporary_path, "w") as head_file:
+            head_file.write(f"{self.segments[0]} {self.read_sequence} {self.read_offset}")
+            head_file.flush()
+            if self.fsync:
+                os.fsync(head_file.fileno())
+        os.replace(temporary_path, head_path)
+
+        # the saved head is past the finished segments now, so a crash can't need them anymore
+        for first_sequence in self.finished_segments:
+            os.remove(self._segment_path(first_sequence))
+        self.finished_segments = []
+
+        self.uncommitted = 0
+
+    def close(self):
+        """commits and closes the underlying files"""
+
+        if self.writer.closed:
+            return
+
+        self.commit()
+        self.writer.close()
+        self.reader.close()
+
+    def _segment_path(self, first_sequence):
+        return os.path.join(self.directory, f"{first_sequence:020d}{SEGMENT_SUFFIX}")
+
+    def _count_operations(self, count):
+        self.uncommitted += count
+        if self.uncommitted >= self.sync_every:
+            self.commit()
+
+    def _append(self, value):
+        """writes value to the end of the log"""
+
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        # start a new segment if this record would make the current one too big
+        if self.write_offset > 0 and self.write_offset + HEADER.size + len(payload) > self.segment_bytes:
+            self._roll_segment()
+
+        self.writer.write(HEADER.pack(len(payload), zlib.crc32(payload)))
+        self.writer.write(payload)
+        self.write_offset += HEADER.size + len(payload)
+        self.write_sequence += 1
+        self.size += 1
+
+    def _read_next(self):
+        """reads the value at the head of the log (the queue must not be empty)"""
+
+        # if the reader is in the segment being written, make sure the writes are readable
+        if self.segments[0] == self.segments[-1]:
+            self.writer.flush()
+
+        header = self.reader.read(HEADER.size)
+
+        # end of this segment; everything in it has been read, so move to the next one
+        if len(header) < HEADER.size:
+            self._advance_segment()
+            header = self.reader.read(HEADER.size)
+
+        length, _ = HEADER.unpack(header)
+        value = pickle.loads(self.reader.read(length))
+
+        self.read_sequence += 1
+        self.read_offset += HEADER.size + length
+        self.size -= 1
+        return value
+
+    def _roll_segment(self):
+        """finishes the current segment and starts writing a new one"""
+
+        self.writer.flush()
+        if self.fsync:
+            os.fsync(self.writer.fileno())
+        self.writer.close()
+
+        self.segments.append(self.write_sequence)
+        self.writer = open(self._segment_path(self.write_sequence), "ab")
+        self.write_offset = 0
+
+    def _advance_segment(self):
+        """moves the reader to the next segment; the one it just finished is deleted by the next commit"""
+
+        self.reader.close()
+        # until the head is committed, a crash replays from the finished segment, so keep it for now
+        self.finished_segments.append(self.segments.pop(0))
+
+        self.reader = open(self._segment_path(self.segments[0]), "rb")
+        self.read_offset = 0
+
+        # the next segment might be the one still being written
+        if self.segments[0] == self.segments[-1]:
+            self.writer.flush()
+
+    def _recover(self):
+        """rebuilds the reader and writer positions from what is on disk"""
+
+        self.segments = sorted(int(name[:-len(SEGMENT_SUFFIX)]) for name in os.listdir(self.directory)
+                               if name.endswith(SEGMENT_SUFFIX))
+
+        self.finished_segments = []  # segments the reader is done with, deleted by the next commit
+        read_segment = self.read_sequence = self.read_offset = 0
+        head_path = os.path.join(self.directory, HEAD_FILE)
+        if os.path.exists(head_path):
+            with open(head_path) as head_file:
+                read_segment, self.read_sequence, self.read_offset = map(int, head_file.read().split())
+
+        if not self.segments:
+            self.segments = [self.read_sequence]
+            open(self._segment_path(self.read_sequence), "ab").close()
+
+        # the offset only means something inside the segment it was saved with; if that
+        # segment is gone, start the first segment left from the top
+        if read_segment not in self.segments:
+            read_segment = self.read_sequence = self.segments[0]
+            self.read_offset = 0
+
+        # delete segments the committed head had already moved past (a crash kept commit from deleting them)
+        while self.segments[0] < read_segment:
+            os.remove(self._segment_path(self.segments.pop(0)))
+
+        # scan the last segment to find where writing left off
+        last_path = self._segment_path(self.segments[-1])
+        records, valid_bytes = 0, 0
+        with open(last_path, "rb") as segment:
+            while True:
+                header = segment.read(HEADER.size)
+                if len(header) < HEADER.size:
+                    break
+                length, checksum = HEADER.unpack(header)
+                payload = segment.read(length)
+                if len(payload) < length or zlib.crc32(payload) != checksum:
+                    break  # a record that was only partly written when we crashed
+                records += 1
+                valid_bytes += HEADER.size + length
+
+        # cut off anything after the last complete record
+        if valid_bytes != os.path.getsize(last_path):
+            os.truncate(last_path, valid_bytes)
+
+        self.write_sequence = self.segments[-1] + records
+        self.write_offset = valid_bytes
+        self.size = self.write_sequence - self.read_sequence
+
+        # the head can't be past the end of the log; if it is, the queue is empty
+        if self.size < 0:
+            self.read_sequence, self.read_offset = self.write_sequence, valid_bytes
+            self.size = 0
+
+        self.writer = open(last_path, "ab")
+        self.reader = open(self._segment_path(self.segments[0]), "rb")
+        self.reader.seek(self.read_offset)
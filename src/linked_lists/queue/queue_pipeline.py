@@ -0,0 +1,332 @@
+"""
+A small streaming pipeline: stages connected by bounded queues.
+
+    pipeline = Pipeline([
+        Stage("read", read_lines),                      # source: read_lines() yields items
+        Stage("parse", parse, kind="process", workers=4),  # parse(item) runs in worker processes
+        Stage("enrich", enrich, kind="async"),          # async generator over the items
+        Stage("count", count_words, batch_size=256),    # generator over the items
+    ], queue_size=1024)
+    results = pipeline.run()
+
+How each kind of stage is called:
+
+    * "thread": function(inputs) is a generator taking an iterator over the previous
+      stage's output. The first stage is called as function() instead.
+    * "async": the same, but function is an async generator and inputs is an async
+      iterator. It runs in its own event loop, on its own thread.
+    * "process": function(item) is called once per item, in a pool of `workers`
+      processes, and returns one output per item, in order. It must be picklable
+      (a module level function) and can't be the first stage.
+
+Every stage runs at the same time, and every pair of neighbouring stages shares a
+BoundedQueue. A stage that gets ahead blocks when its output queue is full, which
+is backpressure: a fast producer can't pile up unbounded work in front of a slow
+consumer. Items move between stages in lists of up to batch_size, so the queue's
+lock is taken once per batch instead of once per item.
+
+Whatever the last stage yields is collected and returned by run(). If any stage
+raises, every queue is aborted so the other stages stop, and run() re-raises it.
+"""
+import os
+import threading
+import time
+from concurrent import futures
+from typing import Optional
+
+from src.linked_lists.queue.queue_deque import Queue
+
+
+class BoundedQueue:
+    """A thread-safe Queue that blocks producers once it holds max_size items"""
+
+    def __init__(self, max_size=1024, queue_class=Queue):
+        """
+        Constructs an empty BoundedQueue
+
+        :param max_size: the most items the queue holds before put_many blocks
+        :param queue_class: the Queue backend that stores the items
+        """
+        self.max_size = max_size
+        self.storage = queue_class()
+        self.lock = threading.Lock()
+        self.not_full = threading.Condition(self.lock)
+        self.not_empty = threading.Condition(self.lock)
+        self.closed = False  # the producer is done; consumers drain what's left
+        self.aborted = False  # something failed; everyone stops right away
+        self.max_depth = 0  # the most items the queue has held at once
+
+    def __len__(self):
+        return len(self.storage)
+
+    def put_many(self, values):
+        """
+        Adds every value, blocking while the queue is full
+
+        :return: False if the queue was aborted (so the caller should stop), else True
+        """
+
+        index = 0
+        with self.lock:
+            while index < len(values):
+                while not self.aborted and len(self.storage) >= self.max_size:
+                    self.not_full.wait()
+                if self.aborted:
+                    return False
+
+                # put in as many as fit, then wake the consumers
+                room = self.max_size - len(self.storage)
+                self.storage.enqueue_many(values[index:index + room])
+                index += room
+                self.max_depth = max(self.max_depth, len(self.storage))
+                self.not_empty.notify_all()
+
+        return True
+
+    def get_many(self, n):
+        """
+        Removes and returns up to n values, blocking until there is at least one
+
+        :return: a list of values, or an empty list once the queue is closed and drained
+        (or aborted)
+        """
+
+        with self.lock:
+            while not self.aborted and not self.closed and len(self.storage) == 0:
+                self.not_empty.wait()
+            if self.aborted:
+                return []
+
+            values = self.storage.dequeue_many(n)
+            self.not_full.notify_all()
+            return values
+
+    def close(self):
+        """tells consumers no more values are coming"""
+
+        with self.lock:
+            self.closed = True
+            self.not_empty.notify_all()
+
+    def abort(self):
+        """stops every producer and consumer blocked on (or later using) this queue"""
+
+        with self.lock:
+            self.aborted = True
+            self.not_empty.notify_all()
+            self.not_full.notify_all()
+
+
+class Stage:
+    KINDS = ("thread", "async", "process")
+
+    def __init__(self, name, function, kind="thread", batch_size=1, workers: Optional[int] = None):
+        """
+        Describes one step of a Pipeline
+
+        :param name: used in stats
+        :param function: what the stage runs (see the module docstring for each kind)
+        :param kind: "thread", "async" or "process"
+        :param batch_size: most items this stage takes from its input queue, and puts
+        on its output queue, at once
+        :param workers: number of worker processes for a "process" stage
+        (defaults to the number of CPUs)
+        """
+        if kind not in self.KINDS:
+            raise ValueError(f"kind must be one of {self.KINDS}, not {kind!r}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.name = name
+        self.function = function
+        self.kind = kind
+        self.batch_size = batch_size
+        self.workers = workers
+
+
+class StageStats:
+    """What one stage did during Pipeline.run"""
+
+    def __init__(self, name):
+        self.name = name
+        self.items_in = 0
+        self.items_out = 0
+        self.seconds = 0.0  # wall time from the stage starting to it finishing
+        self.input_stall = 0.0  # time spent waiting for input
+        self.output_stall = 0.0  # time spent blocked on a full output queue (backpressure)
+        self.queue_depth = 0  # items left in the output queue when the stage finished
+        self.max_queue_depth = 0  # the most items its output queue held at once
+
+    def __repr__(self):
+        return (f"StageStats({self.name!r}, in={self.items_in}, out={self.items_out}, "
+                f"{self.throughput:.0f} items/s, stalled {self.input_stall:.3f}s in / "
+                f"{self.output_stall:.3f}s out, max depth {self.max_queue_depth})")
+
+    @property
+    def throughput(self):
+        """items produced per second"""
+
+        return self.items_out / self.seconds if self.seconds > 0 else 0.0
+
+
+class Pipeline:
+    def __init__(self, stages, queue_size=1024, queue_class=Queue):
+        """
+        Constructs a Pipeline
+
+        :param stages: a list of Stage, from source to sink
+        :param queue_size: the most items each queue between two stages holds
+        :param queue_class: the Queue backend used by every BoundedQueue
+        """
+        if not stages:
+            raise ValueError("a pipeline needs at least one stage")
+        if stages[0].kind == "process":
+            raise ValueError("the first stage can't be a process stage, it has no items to map over")
+
+        self.stages = stages
+        self.queue_size = queue_size
+        self.queue_class = queue_class
+        self.stats = [StageStats(stage.name) for stage in stages]
+
+    def run(self):
+        """
+        Runs every stage until the source is exhausted and everything has flowed through
+
+        :return: a list of everything the last stage yielded
+        """
+
+        self.stats = [StageStats(stage.name) for stage in self.stages]
+        # queues[i] sits between stage i - 1 and stage i; the last stage's output is collected
+        queues = [None] + [BoundedQueue(self.queue_size, self.queue_class) for _ in self.stages[1:]]
+        results = []
+        errors = []
+
+        def run_stage(index):
+            stage, stats = self.stages[index], self.stats[index]
+            inputs = queues[index]
+            outputs = queues[index + 1] if index + 1 < len(queues) else None
+
+            start = time.perf_counter()
+            try:
+                if stage.kind == "async":
+                    import asyncio  # imported here so pipelines without async stages don't pay for it
+                    asyncio.run(self._run_async(stage, stats, inputs, outputs, results))
+                elif stage.kind == "process":
+                    self._run_process(stage, stats, inputs, outputs, results)
+                else:
+                    self._run_thread(stage, stats, inputs, outputs, results)
+            except BaseException as error:
+                errors.append(error)
+                for queue in queues[1:]:
+                    queue.abort()
+            finally:
+                stats.seconds = time.perf_counter() - start
+                # nothing reads this stage's input anymore (it may have stopped early),
+                # so don't let the stage before it block on a full queue
+                if inputs is not None:
+                    inputs.abort()
+                if outputs is not None:
+                    outputs.close()
+                    stats.queue_depth = len(outputs)
+                    stats.max_queue_depth = outputs.max_depth
+
+        threads = [threading.Thread(target=run_stage, args=(index,), name=f"pipeline-{stage.name}")
+                   for index, stage in enumerate(self.stages)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+
+        return results
+
+    @staticmethod
+    def _take(stage, stats, inputs):
+        """gets the next batch from inputs, timing how long it waited"""
+
+        start = time.perf_counter()
+        batch = inputs.get_many(stage.batch_size)
+        stats.input_stall += time.perf_counter() - start
+        stats.items_in += len(batch)
+        return batch
+
+    @staticmethod
+    def _give(stats, outputs, results, batch):
+        """
+        Passes a batch on to the next stage (or into results), timing how long it was blocked
+
+        :return: False if the pipeline was aborted
+        """
+
+        stats.items_out += len(batch)
+        if outputs is None:
+            results.extend(batch)
+            return True
+
+        start = time.perf_counter()
+        delivered = outputs.put_many(batch)
+        stats.output_stall += time.perf_counter() - start
+        return delivered
+
+    def _inputs(self, stage, stats, inputs):
+        """yields every item from the input queue"""
+
+        while True:
+            batch = self._take(stage, stats, inputs)
+            if not batch:
+                return
+            yield from batch
+
+    def _run_thread(self, stage, stats, inputs, outputs, results):
+        produced = stage.function() if inputs is None else stage.function(self._inputs(stage, stats, inputs))
+
+        batch = []
+        for value in produced:
+            batch.append(value)
+            if len(batch) >= stage.batch_size:
+                if not self._give(stats, outputs, results, batch):
+                    return
+                batch = []
+
+        if batch:
+            self._give(stats, outputs, results, batch)
+
+    def _run_process(self, stage, stats, inputs, outputs, results):
+        workers = stage.workers or os.cpu_count() or 1
+        with futures.ProcessPoolExecutor(workers) as executor:
+            while True:
+                batch = self._take(stage, stats, inputs)
+                if not batch:
+                    return
+                # spread a batch over the workers in chunks, so each process gets several items at once
+                chunk_size = max(1, len(batch) // (4 * workers))
+                mapped = list(executor.map(stage.function, batch, chunksize=chunk_size))
+                if not self._give(stats, outputs, results, mapped):
+                    return
+
+    async def _run_async(self, stage, stats, inputs, outputs, results):
+        import asyncio
+
+        async def async_inputs():
+            while True:
+                # the queue blocks, so wait on it in a worker thread and keep the event loop free
+                batch = await asyncio.to_thread(self._take, stage, stats, inputs)
+                if not batch:
+                    return
+                for value in batch:
+                    yield value
+
+        produced = stage.function() if inputs is None else stage.function(async_inputs())
+
+        batch = []
+        async for value in produced:
+            batch.append(value)
+            if len(batch) >= stage.batch_size:
+                if not await asyncio.to_thread(self._give, stats, outputs, results, batch):
+                    return
+                batch = []
+
+        if batch:
+            await asyncio.to_thread(self._give, stats, outputs, results, batch)
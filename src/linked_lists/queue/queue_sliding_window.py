@@ -0,0 +1,113 @@
+"""
+A sliding window is a queue that can also answer "what is the largest
+(or smallest) value currently in the window?" without rescanning it.
+
+Alongside the window itself we keep two monotonic deques:
+
+    * the max deque holds values in decreasing order
+    * the min deque holds values in increasing order
+
+When a value is pushed, every value at the back of the max deque that is
+smaller than it can never be the maximum again (the new value is both larger
+AND will stay in the window longer), so those entries are dropped. The front
+of the max deque is therefore always the window maximum. The min deque works
+the same way, just flipped.
+
+Each value enters and leaves each deque at most once, so push, pop_left,
+window_max and window_min are all O(1) amortized.
+"""
+from collections import deque
+from typing import Optional
+
+
+class SlidingWindow:
+    def __init__(self, max_size: Optional[int] = None):
+        """
+        Constructs an empty SlidingWindow
+
+        :param max_size: optional number of items to keep. When given, pushing onto
+        a full window evicts the oldest item first.
+        """
+        self.max_size = max_size
+        self.storage = deque()  # (sequence, timestamp, value), oldest on the left
+        self.max_storage = deque()  # (sequence, value), decreasing values
+        self.min_storage = deque()  # (sequence, value), increasing values
+        self.next_sequence = 0  # lets us tell equal values apart when evicting
+
+    def __len__(self):
+        return len(self.storage)
+
+    def push(self, value, timestamp=None):
+        """
+        Adds a value to the right side of the window
+
+        :param value: the value to add (must be comparable with the others in window)
+        :param timestamp: optional timestamp used by evict_older_than
+        """
+
+        # if window is full, make room by dropping the oldest item
+        if self.max_size is not None and len(self.storage) >= self.max_size:
+            self.pop_left()
+
+        sequence = self.next_sequence
+        self.next_sequence += 1
+        self.storage.append((sequence, timestamp, value))
+
+        # anything smaller than value can never be the max again
+        while self.max_storage and self.max_storage[-1][1] < value:
+            self.max_storage.pop()
+        self.max_storage.append((sequence, value))
+
+        # anything larger than value can never be the min again
+        while self.min_storage and self.min_storage[-1][1] > value:
+            self.min_storage.pop()
+        self.min_storage.append((sequence, value))
+
+    def pop_left(self):
+        """Removes the oldest value from the window and returns it"""
+
+        if len(self.storage) == 0:
+            return None  # nothing to _remove, nothing to return
+
+        sequence, _, value = self.storage.popleft()
+
+        # the evicted item can only ever be at the front of either monotonic deque
+        if self.max_storage[0][0] == sequence:
+            self.max_storage.popleft()
+        if self.min_storage[0][0] == sequence:
+            self.min_storage.popleft()
+
+        return value
+
+    def evict_older_than(self, timestamp):
+        """
+        Removes every value pushed with a timestamp strictly older than the given one
+
+        :param timestamp: the oldest timestamp to keep in the window
+        :return: the number of values evicted
+        """
+
+        evicted = 0
+
+        # items without a timestamp are never considered stale
+        while self.storage and self.storage[0][1] is not None and self.storage[0][1] < timestamp:
+            self.pop_left()
+            evicted += 1
+
+        return evicted
+
+    def window_max(self):
+        """returns the largest value currently in the window"""
+
+        if len(self.max_storage) == 0:
+            return None
+
+        return self.max_storage[0][1]
+
+    def window_min(self):
+        """returns the smallest value currently in the window"""
+
+        if len(self.min_storage) == 0:
+            return None
+
+        return self.min_storage[0][1]
@@ -0,0 +1,226 @@
+"""
+A queue that keeps memory use bounded by spilling to disk when it grows too big.
+
+The queue is kept in three parts, oldest to newest:
+
+    head (in memory)  ->  spilled segments (on disk)  ->  tail (in memory)
+
+enqueue appends to the tail and dequeue takes from the head, so both ends stay
+in memory and are O(1). Whenever the in-memory part goes over budget (max_items,
+or max_bytes as estimated by sys.getsizeof) and the tail holds at least
+`spill_batch` items, the oldest `spill_batch` items of the tail are written to a
+new segment file. Only the tail can be spilled, so waiting for a full batch keeps
+a nearly full head from causing a tiny segment on every enqueue. Everything in the
+tail is newer than everything already spilled, so appending segments keeps FIFO
+order.
+
+When the head runs dry, the next segment is memory-mapped, read back into the
+head in one go and deleted. Once nothing is spilled, the tail simply becomes the
+new head.
+
+Segments use the same record format as the persistent queue (a length and CRC32
+header, then the pickled item), but unlike it this queue is not durable: spilled
+segments only exist to save memory and are deleted by close().
+
+The budget is soft: the tail can fill up to a whole spill_batch before it is
+spilled, and a segment read back into the head takes up to spill_batch items too.
+"""
+import mmap
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import zlib
+from collections import deque
+from typing import Optional
+
+from src.linked_lists.queue.queue_persistent import HEADER, SEGMENT_SUFFIX
+
+
+class Queue:
+    def __init__(self, max_items: Optional[int] = 100_000, max_bytes: Optional[int] = None,
+                 spill_batch: Optional[int] = None, directory: Optional[str] = None):
+        """
+        Constructs an empty spilling queue
+
+        :param max_items: optional number of items to keep in memory before spilling
+        :param max_bytes: optional (estimated) number of bytes to keep in memory before spilling
+        :param spill_batch: number of items written per segment
+        (defaults to a quarter of max_items, or 1024 without max_items)
+        :param directory: where segment files go (defaults to a new temporary directory,
+        removed again by close())
+        """
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        if spill_batch is None:
+            spill_batch = max(1, max_items // 4) if max_items is not None else 1024
+        self.spill_batch = spill_batch
+
+        self.owns_directory = directory is None
+        self.directory = tempfile.mkdtemp(prefix="spill-queue-") if directory is None else directory
+        os.makedirs(self.directory, exist_ok=True)
+
+        self.head = deque()  # oldest items, dequeued from the left
+        self.tail = deque()  # newest items, enqueued on the right
+        self.segments = deque()  # (path, number of items) of every spilled segment, oldest first
+        self.next_segment = 0
+        self.spilled = 0  # number of items on disk
+        self.memory_bytes = 0  # estimated size of the items in head and tail
+        self.tail_bytes = 0  # estimated size of the items in tail alone
+
+    def __len__(self):
+        return len(self.head) + self.spilled + len(self.tail)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def enqueue(self, value):
+        self.tail.append(value)
+        if self.max_bytes is not None:
+            size = sys.getsizeof(value)
+            self.memory_bytes += size
+            self.tail_bytes += size
+
+        if self._over_budget():
+            self._spill()
+
+    def dequeue(self):
+        if not self.head and not self._refill_head():
+            return None  # nothing to _remove, nothing to return
+
+        value = self.head.popleft()
+        if self.max_bytes is not None:
+            self.memory_bytes -= sys.getsizeof(value)
+        return value
+
+    def enqueue_many(self, values):
+        for value in values:
+            self.enqueue(value)
+
+    def dequeue_many(self, n):
+        values = []
+        while len(values) < n:
+            if not self.head and not self._refill_head():
+                break
+            values.append(self.dequeue())
+        return values
+
+    def peek(self):
+        values = self.peek_many(1)
+        return values[0] if values else None
+
+    def peek_many(self, n):
+        """returns the next n values without dequeuing them (reading spilled segments if needed)"""
+
+        values = []
+        for value in self._iter_all():
+            if len(values) >= n:
+                break
+            values.append(value)
+        return values
+
+    def close(self):
+        """deletes every spilled segment (and the directory, if the queue created it)"""
+
+        for path, _ in self.segments:
+            if os.path.exists(path):
+                os.remove(path)
+        self.segments.clear()
+        self.spilled = 0
+
+        if self.owns_directory and os.path.isdir(self.directory):
+            shutil.rmtree(self.directory)
+
+    def _over_budget(self):
+        if self.max_items is not None and len(self.head) + len(self.tail) > self.max_items:
+            return True
+        return self.max_bytes is not None and self.memory_bytes > self.max_bytes
+
+    def _should_spill(self):
+        """True once the queue is over budget and the tail has a whole batch to write"""
+
+        if not self._over_budget():
+            return False
+        if len(self.tail) >= self.spill_batch:
+            return True
+
+        # the tail alone is over budget (only possible with a large spill_batch), so it has to go
+        if self.max_items is not None and len(self.tail) > self.max_items:
+            return True
+        return self.max_bytes is not None and self.tail_bytes > self.max_bytes
+
+    def _iter_all(self):
+        yield from self.head
+        for path, _ in self.segments:
+            yield from self._read_segment(path)
+        yield from self.tail
+
+    def _spill(self):
+        """writes the oldest items of the tail to new segments, a batch at a time, until back under budget"""
+
+        while self.tail and self._should_spill():
+            path = os.path.join(self.directory, f"{self.next_segment:020d}{SEGMENT_SUFFIX}")
+            self.next_segment += 1
+
+            count = 0
+            with open(path, "wb") as segment:
+                while self.tail and count < self.spill_batch:
+                    value = self.tail.popleft()
+                    if self.max_bytes is not None:
+                        size = sys.getsizeof(value)
+                        self.memory_bytes -= size
+                        self.tail_bytes -= size
+                    payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+                    segment.write(HEADER.pack(len(payload), zlib.crc32(payload)))
+                    segment.write(payload)
+                    count += 1
+
+            self.segments.append((path, count))
+            self.spilled += count
+
+    def _refill_head(self):
+        """
+        Moves the next oldest items into the (empty) head
+
+        :return: False if the queue is empty
+        """
+
+        if self.segments:
+            path, count = self.segments.popleft()
+            self.head.extend(self._read_segment(path))
+            os.remove(path)
+            self.spilled -= count
+            if self.max_bytes is not None:
+                self.memory_bytes += sum(sys.getsizeof(value) for value in self.head)
+        else:
+            # nothing on disk, so the tail holds the next items; swap instead of copying
+            self.head, self.tail = self.tail, self.head
+            self.tail_bytes = 0
+
+        return len(self.head) > 0
+
+    @staticmethod
+    def _read_segment(path):
+        """returns every value in a segment, read through a memory map"""
+
+        values = []
+        with open(path, "rb") as segment:
+            if os.fstat(segment.fileno()).st_size == 0:
+                return values
+
+            with mmap.mmap(segment.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                offset = 0
+                while offset < len(mapped):
+                    length, checksum = HEADER.unpack_from(mapped, offset)
+                    offset += HEADER.size
+                    payload = mapped[offset:offset + length]
+                    if zlib.crc32(payload) != checksum:
+                        raise ValueError(f"corrupt record in spilled segment {path}")
+                    values.append(pickle.loads(payload))
+                    offset += length
+
+        return values
@@ -0,0 +1,96 @@
+import unittest
+# from src.linked_lists.queue.queue_list import Queue
+# from src.linked_lists.queue.queue_linked_doubly import Queue
+# from src.linked_lists.queue.queue_linked_singly import Queue
+from src.linked_lists.queue.queue_deque import Queue
+from src.linked_lists.queue import queue_deque, queue_list, queue_linked_singly, queue_linked_doubly
+
+
+class QueueTests(unittest.TestCase):
+    def setUp(self):
+        self.q = Queue()
+
+    def test_len_returns_0_for_empty_queue(self):
+        self.assertEqual(len(self.q), 0)
+
+    def test_len_returns_correct_length_after_enqueue(self):
+        self.assertEqual(len(self.q), 0)
+        self.q.enqueue(2)
+        self.assertEqual(len(self.q), 1)
+        self.q.enqueue(4)
+        self.assertEqual(len(self.q), 2)
+        self.q.enqueue(6)
+        self.q.enqueue(8)
+        self.q.enqueue(10)
+        self.q.enqueue(12)
+        self.q.enqueue(14)
+        self.q.enqueue(16)
+        self.q.enqueue(18)
+        self.assertEqual(len(self.q), 9)
+
+    def test_empty_dequeue(self):
+        self.assertIsNone(self.q.dequeue())
+        self.assertEqual(len(self.q), 0)
+
+    def test_dequeue_respects_order(self):
+        self.q.enqueue(100)
+        self.q.enqueue(101)
+        self.q.enqueue(105)
+        self.assertEqual(self.q.dequeue(), 100)
+        self.assertEqual(len(self.q), 2)
+        self.assertEqual(self.q.dequeue(), 101)
+        self.assertEqual(len(self.q), 1)
+        self.assertEqual(self.q.dequeue(), 105)
+        self.assertEqual(len(self.q), 0)
+        self.assertIsNone(self.q.dequeue())
+        self.assertEqual(len(self.q), 0)
+
+
+class QueueBatchTests(unittest.TestCase):
+    backends = [queue_deque, queue_list, queue_linked_singly, queue_linked_doubly]
+
+    def test_enqueue_many_then_dequeue(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend.__name__):
+                q = backend.Queue()
+                q.enqueue(0)
+                q.enqueue_many(iter([1, 2, 3]))
+                q.enqueue_many([])
+                self.assertEqual(len(q), 4)
+                self.assertEqual(q.dequeue(), 0)
+                self.assertEqual(q.dequeue(), 1)
+                q.enqueue(4)
+                self.assertEqual(len(q), 3)
+                self.assertEqual([q.dequeue(), q.dequeue(), q.dequeue()], [2, 3, 4])
+
+    def test_dequeue_many(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend.__name__):
+                q = backend.Queue()
+                self.assertEqual(q.dequeue_many(3), [])
+                q.enqueue_many(range(6))
+                self.assertEqual(q.dequeue_many(0), [])
+                self.assertEqual(q.dequeue_many(2), [0, 1])
+                self.assertEqual(len(q), 4)
+                self.assertEqual(q.dequeue_many(10), [2, 3, 4, 5])
+                self.assertEqual(len(q), 0)
+                self.assertIsNone(q.dequeue())
+                q.enqueue(7)
+                self.assertEqual(q.dequeue(), 7)
+
+    def test_peek(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend.__name__):
+                q = backend.Queue()
+                self.assertIsNone(q.peek())
+                self.assertEqual(q.peek_many(2), [])
+                q.enqueue_many([1, 2, 3])
+                self.assertEqual(q.peek(), 1)
+                self.assertEqual(q.peek_many(0), [])
+                self.assertEqual(q.peek_many(2), [1, 2])
+                self.assertEqual(q.peek_many(5), [1, 2, 3])
+                self.assertEqual(len(q), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
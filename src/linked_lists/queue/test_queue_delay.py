@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+import unittest
+from src.linked_lists.queue.queue_delay import DelayQueue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class DelayQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.q = DelayQueue(clock=self.clock)
+
+    def test_empty(self):
+        self.assertIsNone(self.q.dequeue())
+        self.assertIsNone(self.q.peek())
+        self.assertIsNone(self.q.next_delay())
+        self.assertEqual(self.q.dequeue_many(3), [])
+        self.assertEqual(len(self.q), 0)
+
+    def test_only_ready_items_come_out(self):
+        self.q.enqueue("later", 5)
+        self.q.enqueue("now")
+        self.q.enqueue("soon", 2)
+        self.assertEqual(len(self.q), 3)
+
+        self.assertEqual(self.q.peek(), "now")
+        self.assertEqual(self.q.dequeue(), "now")
+        self.assertIsNone(self.q.dequeue())
+        self.assertEqual(self.q.next_delay(), 2)
+
+        self.clock.now = 2
+        self.assertEqual(self.q.dequeue(), "soon")
+        self.assertIsNone(self.q.dequeue())
+
+        self.clock.now = 10
+        self.assertEqual(self.q.next_delay(), 0)
+        self.assertEqual(self.q.dequeue(), "later")
+        self.assertEqual(len(self.q), 0)
+
+    def test_batches_keep_deadline_then_fifo_order(self):
+        self.q.enqueue_many(["b1", "b2", "b3"], delay=3)
+        self.q.enqueue_many(["a1", "a2"], delay=1)
+        self.q.enqueue("c", 9)
+
+        self.clock.now = 3
+        self.assertEqual(self.q.peek_many(10), ["a1", "a2", "b1", "b2", "b3"])
+        self.assertEqual(self.q.dequeue_many(4), ["a1", "a2", "b1", "b2"])
+        self.assertEqual(self.q.dequeue_many(4), ["b3"])
+        self.assertEqual(len(self.q), 1)
+
+    def test_dequeue_wait(self):
+        q = DelayQueue()
+        self.assertIsNone(q.dequeue_wait(timeout=0.01))
+
+        q.enqueue("late", 10)
+        start = time.monotonic()
+        threading.Timer(0.02, q.enqueue, args=("early", 0.02)).start()
+        self.assertEqual(q.dequeue_wait(timeout=5), "early")
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_dequeue_async(self):
+        q = DelayQueue()
+
+        async def main():
+            self.assertIsNone(await q.dequeue_async(timeout=0.01))
+            q.enqueue("late", 10)
+            asyncio.get_running_loop().call_later(0.02, q.enqueue, "early", 0.02)
+            return await asyncio.wait_for(q.dequeue_async(), timeout=5)
+
+        self.assertEqual(asyncio.run(main()), "early")
+        self.assertEqual(q.async_waiters, [])
+
+    def test_timeouts_use_the_queue_clock(self):
+        # a clock that jumps 10 seconds per reading runs past a 5 second timeout at once
+        readings = iter(range(0, 1000, 10))
+        q = DelayQueue(clock=lambda: next(readings))
+        q.enqueue("never", 100)
+
+        start = time.monotonic()
+        self.assertIsNone(q.dequeue_wait(timeout=5))
+        self.assertIsNone(asyncio.run(q.dequeue_async(timeout=5)))
+        self.assertLess(time.monotonic() - start, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
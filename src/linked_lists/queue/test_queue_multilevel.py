@@ -0,0 +1,86 @@
+import unittest
+from src.linked_lists.queue import queue_deque, queue_list, queue_linked_singly, queue_linked_doubly
+from src.linked_lists.queue.queue_multilevel import MultiLevelQueue
+
+
+class MultiLevelQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.q = MultiLevelQueue(levels=3)
+
+    def test_empty_dequeue(self):
+        self.assertIsNone(self.q.dequeue())
+        self.assertIsNone(self.q.dequeue_with_level())
+        self.assertIsNone(self.q.peek_level())
+        self.assertEqual(len(self.q), 0)
+
+    def test_highest_level_first(self):
+        self.q.enqueue("low", level=2)
+        self.q.enqueue("high-1", level=0)
+        self.q.enqueue("mid", level=1)
+        self.q.enqueue("high-2", level=0)
+        self.assertEqual(self.q.peek_level(), 0)
+        self.assertEqual(len(self.q), 4)
+
+        self.assertEqual(self.q.dequeue(), "high-1")
+        self.assertEqual(self.q.dequeue(), "high-2")
+        self.assertEqual(self.q.dequeue_with_level(), (1, "mid"))
+        self.assertEqual(self.q.peek_level(), 2)
+        self.assertEqual(self.q.dequeue(), "low")
+        self.assertEqual(self.q.bitmap, 0)
+        self.assertIsNone(self.q.dequeue())
+
+    def test_quotas_share_between_levels(self):
+        q = MultiLevelQueue(levels=2, quotas=[2, None])
+        for i in range(5):
+            q.enqueue(f"a{i}", level=0)
+        for i in range(2):
+            q.enqueue(f"b{i}", level=1)
+
+        order = [q.dequeue() for _ in range(7)]
+        self.assertEqual(order, ["a0", "a1", "b0", "a2", "a3", "b1", "a4"])
+
+    def test_quotas_reach_every_level(self):
+        q = MultiLevelQueue(levels=3, quotas=[2, 2, None])
+        for name in "abc":
+            for i in range(10):
+                q.enqueue(f"{name}{i}", level="abc".index(name))
+
+        order = [q.dequeue() for _ in range(10)]
+        self.assertEqual(order, ["a0", "a1", "b0", "b1", "c0", "a2", "a3", "b2", "b3", "c1"])
+
+    def test_quotas_must_match_levels(self):
+        with self.assertRaises(ValueError):
+            MultiLevelQueue(levels=3, quotas=[2])
+
+    def test_aging_promotes_waiting_items(self):
+        q = MultiLevelQueue(levels=3, aging_interval=2)
+        q.enqueue("old", level=2)
+        for i in range(6):
+            q.enqueue(i, level=0)
+
+        order = [q.dequeue() for _ in range(7)]
+        # "old" moves up a level every 2 dequeues, then waits its turn at level 0
+        self.assertEqual(order, [0, 1, 2, 3, 4, 5, "old"])
+
+        # level 0 never runs dry, but "starved" still gets out once it reaches level 0
+        q.enqueue("starved", level=1)
+        q.enqueue(0, level=0)
+        order = []
+        for i in range(1, 10):
+            q.enqueue(i, level=0)
+            order.append(q.dequeue())
+        self.assertIn("starved", order)
+
+    def test_backends(self):
+        for backend in [queue_deque, queue_list, queue_linked_singly, queue_linked_doubly]:
+            with self.subTest(backend=backend.__name__):
+                q = MultiLevelQueue(levels=2, queue_class=backend.Queue, aging_interval=3)
+                q.enqueue("b", level=1)
+                q.enqueue("a", level=0)
+                q.enqueue("c", level=1)
+                self.assertEqual([q.dequeue(), q.dequeue(), q.dequeue()], ["a", "b", "c"])
+                self.assertEqual(len(q), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+import os
+import tempfile
+import unittest
+from src.linked_lists.queue.queue_persistent import Queue
+
+
+class PersistentQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = self.temporary_directory.name
+        self.q = Queue(self.directory, fsync=False)
+
+    def tearDown(self):
+        self.q.close()
+        self.temporary_directory.cleanup()
+
+    def segment_files(self):
+        return sorted(name for name in os.listdir(self.directory) if name.endswith(".log"))
+
+    def reopen(self, **kwargs):
+        self.q.close()
+        self.q = Queue(self.directory, fsync=False, **kwargs)
+
+    def crash(self, **kwargs):
+        """drops the queue without committing, then reopens it"""
+
+        self.q.writer.close()
+        self.q.reader.close()
+        self.q = Queue(self.directory, fsync=False, **kwargs)
+
+    def test_empty_dequeue(self):
+        self.assertIsNone(self.q.dequeue())
+        self.assertEqual(len(self.q), 0)
+
+    def test_dequeue_respects_order(self):
+        self.q.enqueue(100)
+        self.q.enqueue({"a": [1, 2]})
+        self.q.enqueue("c")
+        self.assertEqual(len(self.q), 3)
+        self.assertEqual(self.q.dequeue(), 100)
+        self.assertEqual(self.q.dequeue(), {"a": [1, 2]})
+        self.assertEqual(self.q.dequeue(), "c")
+        self.assertIsNone(self.q.dequeue())
+
+    def test_survives_reopen(self):
+        for i in range(10):
+            self.q.enqueue(i)
+        self.assertEqual(self.q.dequeue(), 0)
+        self.assertEqual(self.q.dequeue(), 1)
+
+        self.reopen()
+        self.assertEqual(len(self.q), 8)
+        self.assertEqual(self.q.dequeue(), 2)
+        self.q.enqueue(10)
+        self.assertEqual([self.q.dequeue() for _ in range(8)], list(range(3, 11)))
+        self.assertEqual(len(self.q), 0)
+
+    def test_segments_roll_and_compact(self):
+        self.reopen(segment_bytes=64)
+        for i in range(20):
+            self.q.enqueue(i)
+        self.assertGreater(len(self.segment_files()), 3)
+
+        self.assertEqual([self.q.dequeue() for _ in range(20)], list(range(20)))
+        # only the segment being written is left
+        self.assertEqual(len(self.segment_files()), 1)
+
+        self.reopen(segment_bytes=64)
+        self.assertEqual(len(self.q), 0)
+        self.q.enqueue("after")
+        self.assertEqual(self.q.dequeue(), "after")
+
+    def test_reopen_after_finishing_a_segment(self):
+        self.reopen(segment_bytes=64)
+        for i in range(20):
+            self.q.enqueue(i)
+        # read exactly to the end of the first segment
+        first_segment_items = int(self.segment_files()[1][:-4])
+        for _ in range(first_segment_items):
+            self.q.dequeue()
+
+        self.reopen(segment_bytes=64)
+        self.assertEqual(self.q.dequeue(), first_segment_items)
+
+    def test_torn_write_is_truncated(self):
+        self.q.enqueue("kept")
+        self.q.close()
+
+        # simulate a crash halfway through writing a record
+        with open(os.path.join(self.directory, self.segment_files()[-1]), "ab") as segment:
+            segment.write(b"\x00\x00\x00\x10\x00")
+
+        self.q = Queue(self.directory, fsync=False)
+        self.assertEqual(len(self.q), 1)
+        self.q.enqueue("next")
+        self.assertEqual(self.q.dequeue(), "kept")
+        self.assertEqual(self.q.dequeue(), "next")
+
+    def test_group_commit(self):
+        self.reopen(sync_every=100)
+        self.q.enqueue(1)
+        self.q.enqueue(2)
+        self.q.commit()
+        self.assertEqual(self.q.dequeue(), 1)
+
+        self.crash()
+        # uncommitted dequeues are delivered again
+        self.assertEqual(len(self.q), 2)
+        self.assertEqual(self.q.dequeue(), 1)
+
+    def test_crash_before_committing_a_segment_change(self):
+        self.reopen(segment_bytes=64, sync_every=1000)
+        self.q.enqueue_many(range(20))
+        first_segment_items = int(self.segment_files()[1][:-4])
+        self.q.dequeue_many(first_segment_items)
+        self.q.commit()
+
+        # crash right after the dequeue that moves the reader into the next segment
+        self.assertEqual(self.q.dequeue(), first_segment_items)
+        self.crash(segment_bytes=64, sync_every=1000)
+
+        self.assertEqual(len(self.q), 20 - first_segment_items)
+        self.assertEqual(self.q.dequeue_many(100), list(range(first_segment_items, 20)))
+        self.q.commit()
+        self.assertEqual(len(self.segment_files()), 1)
+
+    def test_uncommitted_dequeues_across_segments_are_replayed(self):
+        self.reopen(segment_bytes=64, sync_every=100)
+        self.q.enqueue_many(range(8))
+        self.q.commit()
+        self.assertGreater(len(self.segment_files()), 1)
+
+        self.assertEqual(self.q.dequeue_many(8), list(range(8)))
+        self.crash(segment_bytes=64)
+        self.assertEqual(self.q.dequeue_many(100), list(range(8)))
+
+        # once the head is committed past them, finished segments are deleted
+        self.q.commit()
+        self.assertEqual(len(self.segment_files()), 1)
+
+    def test_batches(self):
+        self.reopen(segment_bytes=64, sync_every=1000)
+        self.q.enqueue_many(range(20))
+        self.assertEqual(len(self.q), 20)
+        self.assertEqual(self.q.peek(), 0)
+        # peeking reads across segments without moving the reader
+        self.assertEqual(self.q.peek_many(15), list(range(15)))
+        self.assertEqual(self.q.dequeue_many(5), [0, 1, 2, 3, 4])
+        self.assertEqual(self.q.peek_many(3), [5, 6, 7])
+
+        self.reopen(segment_bytes=64)
+        self.assertEqual(self.q.dequeue_many(100), list(range(5, 20)))
+        self.assertIsNone(self.q.peek())
+        self.assertEqual(self.q.peek_many(3), [])
+
+    def test_fsync(self):
+        q = Queue(os.path.join(self.directory, "synced"), fsync=True)
+        q.enqueue(1)
+        self.assertEqual(q.dequeue(), 1)
+        q.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
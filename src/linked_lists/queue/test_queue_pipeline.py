@@ -0,0 +1,130 @@
+import threading
+import time
+import unittest
+from src.linked_lists.queue import queue_linked_doubly
+from src.linked_lists.queue.queue_pipeline import BoundedQueue, Pipeline, Stage
+
+
+def square(value):
+    # module level, so worker processes can unpickle it
+    return value * value
+
+
+def numbers():
+    yield from range(200)
+
+
+def add_one(values):
+    for value in values:
+        yield value + 1
+
+
+async def double(values):
+    async for value in values:
+        yield value * 2
+
+
+class BoundedQueueTests(unittest.TestCase):
+    def test_put_blocks_when_full(self):
+        q = BoundedQueue(max_size=2)
+        done = threading.Event()
+
+        def producer():
+            q.put_many([1, 2, 3, 4])
+            done.set()
+
+        thread = threading.Thread(target=producer)
+        thread.start()
+        self.assertFalse(done.wait(0.05))  # stuck waiting for room
+        self.assertEqual(len(q), 2)
+
+        self.assertEqual(q.get_many(10), [1, 2])
+        thread.join(5)
+        self.assertTrue(done.is_set())
+        self.assertEqual(q.get_many(10), [3, 4])
+        self.assertEqual(q.max_depth, 2)
+
+    def test_close_and_abort(self):
+        q = BoundedQueue(max_size=4)
+        q.put_many([1])
+        q.close()
+        self.assertEqual(q.get_many(10), [1])
+        self.assertEqual(q.get_many(10), [])
+
+        q = BoundedQueue(max_size=1)
+        q.put_many([1])
+        threading.Timer(0.02, q.abort).start()
+        self.assertFalse(q.put_many([2]))
+        self.assertEqual(q.get_many(1), [])
+
+
+class PipelineTests(unittest.TestCase):
+    def test_end_to_end(self):
+        pipeline = Pipeline([
+            Stage("source", numbers, batch_size=16),
+            Stage("square", square, kind="process", workers=2, batch_size=32),
+            Stage("add one", add_one, batch_size=8),
+            Stage("double", double, kind="async", batch_size=4),
+        ], queue_size=10, queue_class=queue_linked_doubly.Queue)
+
+        self.assertEqual(pipeline.run(), [(i * i + 1) * 2 for i in range(200)])
+
+        for stats in pipeline.stats:
+            self.assertEqual(stats.items_out, 200, stats.name)
+            self.assertGreater(stats.seconds, 0)
+        self.assertEqual(pipeline.stats[0].items_in, 0)
+        self.assertEqual(pipeline.stats[-1].items_in, 200)
+        for stats in pipeline.stats[:-1]:
+            self.assertLessEqual(stats.max_queue_depth, 10)
+
+    def test_backpressure(self):
+        def slow_sink(values):
+            for value in values:
+                time.sleep(0.001)
+                yield value
+
+        pipeline = Pipeline([Stage("source", numbers), Stage("sink", slow_sink)], queue_size=5)
+        self.assertEqual(pipeline.run(), list(range(200)))
+
+        source = pipeline.stats[0]
+        self.assertEqual(source.max_queue_depth, 5)
+        self.assertGreater(source.output_stall, 0.05)  # spent most of its time waiting for room
+        self.assertGreater(source.throughput, 0)
+
+    def test_sink_stopping_early_stops_the_source(self):
+        def first_ten(values):
+            for value, _ in zip(values, range(10)):
+                yield value
+
+        def endless():
+            while True:
+                yield 1
+
+        pipeline = Pipeline([Stage("source", endless), Stage("sink", first_ten)], queue_size=4)
+        self.assertEqual(pipeline.run(), [1] * 10)
+
+    def test_errors_are_raised(self):
+        def broken(values):
+            for value in values:
+                if value == 50:
+                    raise RuntimeError("bad value")
+                yield value
+
+        pipeline = Pipeline([Stage("source", numbers), Stage("broken", broken), Stage("sink", add_one)],
+                            queue_size=4)
+        with self.assertRaises(RuntimeError):
+            pipeline.run()
+
+    def test_invalid_stages(self):
+        with self.assertRaises(ValueError):
+            Pipeline([])
+        with self.assertRaises(ValueError):
+            Pipeline([Stage("source", square, kind="process")])
+        with self.assertRaises(ValueError):
+            Stage("source", numbers, kind="fiber")
+        with self.assertRaises(ValueError):
+            Stage("source", numbers, batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from src.linked_lists.queue.queue_sliding_window import SlidingWindow
+
+
+class SlidingWindowTests(unittest.TestCase):
+    def setUp(self):
+        self.window = SlidingWindow()
+
+    def test_empty_window(self):
+        self.assertEqual(len(self.window), 0)
+        self.assertIsNone(self.window.window_max())
+        self.assertIsNone(self.window.window_min())
+        self.assertIsNone(self.window.pop_left())
+
+    def test_max_and_min_follow_pushes(self):
+        self.window.push(5)
+        self.assertEqual(self.window.window_max(), 5)
+        self.assertEqual(self.window.window_min(), 5)
+        self.window.push(3)
+        self.window.push(8)
+        self.assertEqual(self.window.window_max(), 8)
+        self.assertEqual(self.window.window_min(), 3)
+        self.assertEqual(len(self.window), 3)
+
+    def test_pop_left_respects_order(self):
+        for value in [4, 9, 1, 9, 2]:
+            self.window.push(value)
+
+        self.assertEqual(self.window.pop_left(), 4)
+        self.assertEqual(self.window.window_max(), 9)
+        self.assertEqual(self.window.window_min(), 1)
+        self.assertEqual(self.window.pop_left(), 9)
+        # the second 9 is still in the window
+        self.assertEqual(self.window.window_max(), 9)
+        self.assertEqual(self.window.pop_left(), 1)
+        self.assertEqual(self.window.window_min(), 2)
+        self.assertEqual(self.window.pop_left(), 9)
+        self.assertEqual(self.window.window_max(), 2)
+        self.assertEqual(len(self.window), 1)
+
+    def test_max_size_evicts_oldest(self):
+        window = SlidingWindow(max_size=3)
+        values = [1, 3, -1, -3, 5, 3, 6, 7]
+        maxes = []
+        for value in values:
+            window.push(value)
+            maxes.append(window.window_max())
+
+        self.assertEqual(maxes, [1, 3, 3, 3, 5, 5, 6, 7])
+        self.assertEqual(len(window), 3)
+        self.assertEqual(window.window_min(), 3)
+
+    def test_evict_older_than(self):
+        self.window.push(10, timestamp=1)
+        self.window.push(2, timestamp=2)
+        self.window.push(7, timestamp=3)
+
+        self.assertEqual(self.window.evict_older_than(2), 1)
+        self.assertEqual(self.window.window_max(), 7)
+        self.assertEqual(self.window.window_min(), 2)
+        self.assertEqual(self.window.evict_older_than(10), 2)
+        self.assertEqual(len(self.window), 0)
+        self.assertIsNone(self.window.window_max())
+
+
+if __name__ == '__main__':
+    unittest.main()
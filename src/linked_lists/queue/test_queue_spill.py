@@ -0,0 +1,89 @@
+import os
+import sys
+import tempfile
+import unittest
+from src.linked_lists.queue.queue_spill import Queue
+
+
+class SpillQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.q = Queue(max_items=10, spill_batch=4)
+
+    def tearDown(self):
+        self.q.close()
+
+    def test_empty_dequeue(self):
+        self.assertIsNone(self.q.dequeue())
+        self.assertIsNone(self.q.peek())
+        self.assertEqual(self.q.dequeue_many(3), [])
+        self.assertEqual(len(self.q), 0)
+
+    def test_spills_and_keeps_fifo_order(self):
+        for i in range(100):
+            self.q.enqueue(i)
+            self.assertLessEqual(len(self.q.head) + len(self.q.tail), 10)
+
+        self.assertEqual(len(self.q), 100)
+        self.assertEqual(self.q.spilled, 92)
+        self.assertEqual(self.q.peek_many(3), [0, 1, 2])
+
+        values = []
+        for i in range(100, 150):
+            values.append(self.q.dequeue())
+            self.q.enqueue(i)
+        values += self.q.dequeue_many(200)
+
+        self.assertEqual(values, list(range(150)))
+        self.assertEqual(self.q.spilled, 0)
+        self.assertIsNone(self.q.dequeue())
+        self.assertEqual(os.listdir(self.q.directory), [])
+
+    def test_segments_stay_full_after_a_refill(self):
+        q = Queue(max_items=1000)
+        try:
+            q.enqueue_many(range(1000))
+            self.assertEqual(q.dequeue(), 0)  # the whole tail becomes the head
+
+            q.enqueue_many(range(1000, 11_000))
+            self.assertEqual([count for _, count in q.segments], [250] * len(q.segments))
+            self.assertLessEqual(len(q.head) + len(q.tail), 1000 + 250)
+
+            self.assertEqual(q.dequeue(), 1)
+            q.enqueue_many(range(11_000, 12_000))
+            self.assertTrue(all(count == 250 for _, count in q.segments))
+            self.assertEqual(q.dequeue_many(20_000), list(range(2, 12_000)))
+        finally:
+            q.close()
+
+    def test_peek_many_reads_every_part(self):
+        self.q.enqueue_many(range(30))
+        self.assertEqual(self.q.dequeue(), 0)
+        self.assertEqual(self.q.peek(), 1)
+        self.assertEqual(self.q.peek_many(100), list(range(1, 30)))
+        self.assertEqual(len(self.q), 29)
+
+    def test_byte_budget(self):
+        with tempfile.TemporaryDirectory() as directory:
+            q = Queue(max_items=None, max_bytes=10_000, spill_batch=8, directory=directory)
+            q.enqueue_many(b"x" * 1000 for _ in range(50))
+            # the tail can hold up to one more batch before it is spilled
+            self.assertLessEqual(q.memory_bytes, 10_000 + 8 * sys.getsizeof(b"x" * 1000))
+            self.assertTrue(all(count == 8 for _, count in q.segments))
+            self.assertGreater(q.spilled, 0)
+            self.assertEqual(q.dequeue_many(50), [b"x" * 1000] * 50)
+            self.assertEqual(q.memory_bytes, 0)
+
+            q.enqueue_many(range(20))
+            q.close()
+            # the given directory is left in place, only the segments are removed
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_close_removes_temporary_directory(self):
+        self.q.enqueue_many(range(50))
+        directory = self.q.directory
+        self.q.close()
+        self.assertFalse(os.path.exists(directory))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,465 @@
+import copy
+from typing import Optional
+
+from src.linked_lists.doubly_linked_list.doubly_linked_list import seen_before
+
+
+class Node:
+    """
+    Class representation of a DoublyLinkedList Node.
+
+    Each Node will store a new_value and a reference
+    to the next_node Node in list.
+    """
+
+    def __init__(self, value=None):
+        """
+        Constructor for a Node instance
+
+        :param value: the new_value to store within this node.
+        Defaults to None if no new_value given
+        """
+
+        # the new_value to store in this Node (can be of any type)
+        self.value = value
+
+        # a reference to the next_node node (only None if Node is last in list)
+        self.next = None
+
+    def __repr__(self):
+        """
+        A string representation of any node instance.
+
+         Used in place of __str__ if __str__ is not defined, otherwise
+         used mostly internally.
+        """
+
+        return f"Node({repr(self.value)}"
+
+
+class LinkedList:
+    """
+    A class representation of a singly-linked-list.
+
+    Stores a reference to both the head (first node in list)
+    and the tail (last node in list). Each item in list will be of
+    class Node (defined above) and will store a new_value and a reference
+    to the next_node Node in list.
+    """
+
+    def __init__(self, node_list: Optional[list] = None):
+        """
+        Constructor method for a LinkedList instance
+
+        :param node_list: an optional list of values to initialize the LinkedList with.
+        If no list is given, our list will start as empty
+        """
+
+        self.head = None
+        self.tail = None
+
+        # if given node_list exists, add each new_value in it to tail
+        if node_list is not None:
+            for value in node_list:
+                self.add_to_tail(value)
+
+    def __iter__(self):
+        """yields each new_value in the list, from head to tail"""
+
+        current_node = self.head
+        while current_node is not None:
+            yield current_node.value
+            current_node = current_node.next
+
+    def __reduce__(self):
+        """
+        Tells pickle (and copy) to store this list as a flat list of values
+
+        The default would pickle Node by Node, recursing once per node,
+        which blows past the recursion limit on long lists.
+        """
+
+        return self.__class__, (list(self),)
+
+    def __deepcopy__(self, memo):
+        """copies the list one node at a time, instead of recursing through the nodes"""
+
+        copied = self.__class__()
+        memo[id(self)] = copied
+
+        for value in self:
+            copied.add_to_tail(copy.deepcopy(value, memo))
+
+        return copied
+
+    def clear(self):
+        """
+        Removes every item from the list
+
+        Nodes are unlinked one at a time, so each one is freed as soon as
+        we move past it instead of all at once in a long chain.
+
+        :return: None
+        """
+
+        current_node = self.head
+        self.head = self.tail = None
+
+        while current_node is not None:
+            next_node = current_node.next
+            current_node.next = None
+            current_node = next_node
+
+    def add_to_head(self, value):
+        """
+        Adds an item to the beginning of the list
+
+        :param value: the new_value to store at the beginning of the list
+        :return: None
+        """
+
+        # initialize a Node with the given new_value
+        new_node = Node(value)
+
+        # if there are no items in list
+        if self.head is None:
+            # then new_node will be only item in list
+            # therefore it will be the head and tail!
+            self.head = self.tail = new_node
+            # self.tail = new_node
+            return
+
+        # else, there is at least one item in list
+        #
+        # the new_node will come before size head
+        # thus, the new_node.next_node should point at size head
+        new_node.next = self.head
+
+        # assign new_node as the size head
+        self.head = new_node
+
+    def add_to_tail(self, value):
+        """
+        Adds an item to the end of the list
+        :param value: the new_value to store at the end of the list
+        :return: None
+        """
+
+        # initialize a Node with the new_value to store
+        new_node = Node(value)
+
+        # if there are no items in list
+        if self.head is None:
+            # then new_node will be only item in list
+            # therefore it will be the head and tail!
+            self.head = self.tail = new_node
+            # self.tail = new_node
+            return  # return out to end method
+
+        # else, there is at least one item in list
+        #
+        # size tail should point to new_node, as new_node will
+        # the element AFTER the size tail
+        self.tail.next = new_node
+
+        # assign new_node as the new tail
+        self.tail = new_node
+
+    def remove_head(self):
+        """
+        Remove the item at the beginning of the list
+        :return: The new_value of the item being removed
+        """
+
+        # if there are no items in list
+        if self.head is None:
+            # then there is nothing to _remove (and nothing to return)!
+            return
+
+        # make a copy of the old head new_value before we delete it
+        old_head_value = self.head.value
+
+        # if only one item in list
+        if self.head.next is None:
+            # then _remove the tail's reference to our only Node
+            # instead, point self.tail at None
+            self.tail = None
+
+        # most important part of method below
+        # notice that this happens with one item in list or more
+        #
+        # assign our self.head to point at the next_node Node,
+        # effectively removing self.head from the list entirely
+        self.head = self.head.next
+
+        # return the old head's new_value
+        return old_head_value
+
+    def remove_tail(self):
+        """
+        Remove the item at the end of the list
+        :return: The new_value of the item being removed
+        """
+
+        # if zero items in the list
+        if self.head is None:
+            # then there's nothing to delete (or return)!
+            return
+
+        # copy the old tail's new_value before we delete it
+        old_tail_value = self.tail.value
+
+        # if only one item in list
+        if self.head.next is None:
+            # then we can assign head and tail to point at None!
+            self.head = self.tail = None
+            # return old new_value
+            return old_tail_value
+
+        # else, there are at least 2 nodes in list (or more)
+        #
+        # loop through entire list until we hit the Node BEFORE self.tail
+
+        current_node = self.head  # start at very beginning
+        # if current_node.next_node IS self.tail, then we have the node before tail!
+        # otherwise, loop again
+        while current_node.next is not self.tail:
+            # reassign our current_node pointer to its next_node new_value
+            current_node = current_node.next
+
+        # reassign current_node.next_node to point at None rather
+        # than the node that is at self.tail
+        current_node.next = None
+        # then, reassign current_node as the new tail!
+        self.tail = current_node
+
+        # return old tail's new_value
+        return old_tail_value
+
+    def add_many_to_head(self, values):
+        """
+        Adds each of the given values to the beginning of the list, in order
+
+        Ends up the same as calling add_to_head once per new_value (so the last one
+        becomes the head), but the new nodes are chained together first and then
+        spliced onto the list in one go.
+
+        :param values: an iterable of values to add
+        :return: None
+        """
+
+        first = last = None
+
+        for value in values:
+            # each new node goes in front of the one before it
+            new_node = Node(value)
+            new_node.next = first
+            if first is None:
+                last = new_node
+            first = new_node
+
+        if first is None:  # nothing to add
+            return
+
+        if self.head is None:
+            self.tail = last
+        else:
+            last.next = self.head
+
+        self.head = first
+
+    def add_many_to_tail(self, values):
+        """
+        Adds each of the given values to the end of the list, in order
+
+        :param values: an iterable of values to add
+        :return: None
+        """
+
+        first = last = None
+
+        for value in values:
+            new_node = Node(value)
+            if last is None:
+                first = new_node
+            else:
+                last.next = new_node
+            last = new_node
+
+        if first is None:  # nothing to add
+            return
+
+        if self.head is None:
+            self.head = first
+        else:
+            self.tail.next = first
+
+        self.tail = last
+
+    def remove_many_from_head(self, n):
+        """
+        Removes up to n items from the beginning of the list
+
+        :param n: the number of items to remove
+        :return: a list of the removed values, in the order they were removed
+        """
+
+        values = []
+        current_node = self.head
+
+        while current_node is not None and len(values) < n:
+            values.append(current_node.value)
+            current_node = current_node.next
+
+        # current_node is the first node we kept (or None if we removed everything)
+        self.head = current_node
+        if current_node is None:
+            self.tail = None
+
+        return values
+
+    def remove_many_from_tail(self, n):
+        """
+        Removes up to n items from the end of the list
+
+        Without prev pointers, removing from the tail means walking from the head.
+        remove_tail does that walk once per item; this does it once in total.
+
+        :param n: the number of items to remove
+        :return: a list of the removed values, in the order they were removed
+        """
+
+        # count the nodes (we don't keep a size)
+        size = 0
+        current_node = self.head
+        while current_node is not None:
+            size += 1
+            current_node = current_node.next
+
+        if n <= 0 or size == 0:
+            return []
+
+        # if we're removing everything, the whole list goes
+        if n >= size:
+            values = list(self)
+            self.head = self.tail = None
+            return values[::-1]
+
+        # walk to the node that will be the new tail
+        new_tail = self.head
+        for _ in range(size - n - 1):
+            new_tail = new_tail.next
+
+        values = []
+        current_node = new_tail.next
+        while current_node is not None:
+            values.append(current_node.value)
+            current_node = current_node.next
+
+        new_tail.next = None
+        self.tail = new_tail
+
+        return values[::-1]
+
+    def reverse(self):
+        """
+        Reverses the order of the list in place, without creating any new nodes
+
+        :return: None
+        """
+
+        previous_node = None
+        current_node = self.head
+
+        # point every node back at the one before it
+        while current_node is not None:
+            next_node = current_node.next
+            current_node.next = previous_node
+            previous_node = current_node
+            current_node = next_node
+
+        # the old head is now the tail, and the old tail is now the head
+        self.head, self.tail = self.tail, self.head
+
+    def rotate(self, k=1):
+        """
+        Rotates the list k steps to the right in place (like collections.deque.rotate)
+
+        rotate(1) on [1, 2, 3] gives [3, 1, 2]. A negative k rotates to the left.
+
+        :param k: the number of steps to rotate
+        :return: None
+        """
+
+        # count the nodes (we don't keep a size)
+        size = 0
+        current_node = self.head
+        while current_node is not None:
+            size += 1
+            current_node = current_node.next
+
+        # a list of 0 or 1 nodes looks the same however you rotate it
+        if size < 2:
+            return
+
+        k %= size
+        if k == 0:
+            return
+
+        # the new tail is the node right before the last k nodes
+        new_tail = self.head
+        for _ in range(size - k - 1):
+            new_tail = new_tail.next
+
+        # join the old tail to the old head, then cut right after new_tail
+        self.tail.next = self.head
+        self.head = new_tail.next
+        new_tail.next = None
+        self.tail = new_tail
+
+    def remove_if(self, predicate):
+        """
+        Removes every node whose new_value makes predicate(new_value) truthy, in one pass
+
+        :param predicate: a function that takes a new_value and returns True to remove it
+        :return: the number of nodes removed
+        """
+
+        removed = 0
+        previous_node = None
+        current_node = self.head
+
+        while current_node is not None:
+            next_node = current_node.next
+
+            if predicate(current_node.value):
+                # sew the node before current_node to the node after it
+                if previous_node is None:
+                    self.head = next_node
+                else:
+                    previous_node.next = next_node
+
+                # if we removed the tail, the node before it is the new tail
+                if current_node is self.tail:
+                    self.tail = previous_node
+
+                current_node.next = None
+                removed += 1
+
+            else:
+                previous_node = current_node
+
+            current_node = next_node
+
+        return removed
+
+    def dedupe(self):
+        """
+        Removes every node whose new_value already appeared earlier in the list, in one pass
+
+        Values must be hashable.
+
+        :return: the number of nodes removed
+        """
+
+        return self.remove_if(seen_before())
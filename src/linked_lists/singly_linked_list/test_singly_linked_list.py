@@ -0,0 +1,168 @@
+import copy
+import pickle
+import unittest
+from src.linked_lists.singly_linked_list.singly_linked_list import LinkedList
+
+
+class LinkedListTests(unittest.TestCase):
+    def setUp(self):
+        self.list = LinkedList()
+
+    def test_add_to_head(self):
+        self.list.add_to_head(1)
+        self.assertEqual(self.list.head.value, 1)
+        self.assertEqual(self.list.tail.value, 1)
+        self.list.add_to_head(2)
+        self.assertEqual(self.list.head.value, 2)
+        self.assertEqual(self.list.tail.value, 1)
+        self.list.add_to_head(3)
+        self.assertEqual(self.list.head.value, 3)
+        self.assertEqual(self.list.tail.value, 1)
+
+    def test_add_to_tail(self):
+        self.list.add_to_tail(1)
+        self.assertEqual(self.list.tail.value, 1)
+        self.assertEqual(self.list.head.value, 1)
+        self.list.add_to_tail(2)
+        self.assertEqual(self.list.tail.value, 2)
+        self.assertEqual(self.list.head.value, 1)
+
+    def test_remove_head(self):
+        self.list.add_to_tail(10)
+        self.list.add_to_tail(20)
+        self.assertEqual(self.list.remove_head(), 10)
+        self.assertEqual(self.list.remove_head(), 20)
+
+        self.list.add_to_tail(10)
+        self.assertEqual(self.list.remove_head(), 10)
+        self.assertIsNone(self.list.head)
+        self.assertIsNone(self.list.tail)
+        self.assertIsNone(self.list.remove_head())
+
+    def test_remove_tail(self):
+        self.list.add_to_tail(30)
+        self.list.add_to_tail(40)
+        self.assertEqual(self.list.remove_tail(), 40)
+        self.assertEqual(self.list.remove_tail(), 30)
+
+        self.list.add_to_tail(100)
+        self.assertEqual(self.list.remove_tail(), 100)
+        self.assertIsNone(self.list.head)
+        self.assertIsNone(self.list.tail)
+        self.assertIsNone(self.list.remove_tail())
+
+        long_sll = LinkedList()
+        long_sll.add_to_tail(1)
+        long_sll.add_to_tail(2)
+        long_sll.add_to_tail(3)
+        long_sll.add_to_tail(4)
+        long_sll.add_to_tail(5)
+        self.assertEqual(long_sll.remove_tail(), 5)
+
+    def fill(self, values):
+        for value in values:
+            self.list.add_to_tail(value)
+
+    def values(self):
+        values = []
+        current_node = self.list.head
+        while current_node is not None:
+            values.append(current_node.value)
+            current_node = current_node.next
+        return values
+
+    def test_add_many(self):
+        self.list.add_many_to_tail([])
+        self.list.add_many_to_head([])
+        self.assertIsNone(self.list.head)
+
+        self.list.add_many_to_head(iter([2, 1]))
+        self.assertEqual(self.values(), [1, 2])
+        self.list.add_many_to_tail([3, 4])
+        self.assertEqual(self.values(), [1, 2, 3, 4])
+        self.list.add_many_to_head([0])
+        self.assertEqual(self.list.tail.value, 4)
+        self.assertEqual(self.values(), [0, 1, 2, 3, 4])
+
+    def test_remove_many(self):
+        self.fill([1, 2, 3, 4, 5, 6])
+        self.assertEqual(self.list.remove_many_from_head(2), [1, 2])
+        self.assertEqual(self.list.remove_many_from_tail(0), [])
+        self.assertEqual(self.list.remove_many_from_tail(2), [6, 5])
+        self.assertEqual(self.values(), [3, 4])
+        self.assertEqual(self.list.tail.value, 4)
+        self.assertEqual(self.list.remove_many_from_tail(5), [4, 3])
+        self.assertIsNone(self.list.head)
+        self.assertIsNone(self.list.tail)
+
+        self.fill([1, 2])
+        self.assertEqual(self.list.remove_many_from_head(5), [1, 2])
+        self.assertIsNone(self.list.tail)
+        self.assertEqual(self.list.remove_many_from_tail(1), [])
+
+    def test_reverse(self):
+        self.list.reverse()
+        self.assertIsNone(self.list.head)
+
+        self.fill([1, 2, 3, 4])
+        self.list.reverse()
+        self.assertEqual(self.values(), [4, 3, 2, 1])
+        self.assertEqual(self.list.tail.value, 1)
+        self.assertIsNone(self.list.tail.next)
+
+    def test_rotate(self):
+        self.list.rotate(3)
+        self.assertIsNone(self.list.head)
+
+        self.fill([1, 2, 3, 4, 5])
+        self.list.rotate(2)
+        self.assertEqual(self.values(), [4, 5, 1, 2, 3])
+        self.assertEqual(self.list.tail.value, 3)
+        self.list.rotate(-2)
+        self.assertEqual(self.values(), [1, 2, 3, 4, 5])
+        self.list.rotate(10)
+        self.assertEqual(self.values(), [1, 2, 3, 4, 5])
+        self.list.add_to_tail(6)
+        self.assertEqual(self.values(), [1, 2, 3, 4, 5, 6])
+
+    def test_remove_if(self):
+        self.fill([2, 1, 4, 3, 6])
+        self.assertEqual(self.list.remove_if(lambda value: value % 2 == 0), 3)
+        self.assertEqual(self.values(), [1, 3])
+        self.assertEqual(self.list.head.value, 1)
+        self.assertEqual(self.list.tail.value, 3)
+
+        self.assertEqual(self.list.remove_if(lambda value: True), 2)
+        self.assertIsNone(self.list.head)
+        self.assertIsNone(self.list.tail)
+
+    def test_list_construction(self):
+        new_list = LinkedList([1, 2, 3])
+        self.assertEqual(new_list.head.value, 1)
+        self.assertEqual(new_list.tail.value, 3)
+        self.assertEqual(list(new_list), [1, 2, 3])
+
+    def test_pickle_and_deepcopy_long_list(self):
+        self.fill(range(50000))
+        self.assertEqual(list(pickle.loads(pickle.dumps(self.list))), list(range(50000)))
+        copied = copy.deepcopy(self.list)
+        self.assertEqual(list(copied), list(range(50000)))
+        self.assertEqual(copied.tail.value, 49999)
+
+    def test_clear(self):
+        self.fill([1, 2, 3])
+        self.list.clear()
+        self.assertIsNone(self.list.head)
+        self.assertIsNone(self.list.tail)
+        self.assertEqual(list(self.list), [])
+
+    def test_dedupe(self):
+        self.fill([1, 2, 1, 3, 2, 2])
+        self.assertEqual(self.list.dedupe(), 3)
+        self.assertEqual(self.values(), [1, 2, 3])
+        self.assertEqual(self.list.tail.value, 3)
+        self.assertEqual(self.list.dedupe(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+from collections import deque
+from itertools import islice
+
+
+class Stack:
+    def __init__(self):
+        self.storage = deque()
+
+    def __len__(self):
+        return len(self.storage)
+
+    def push(self, value):
+        self.storage.append(value)
+
+    def pop(self):
+        # if deque is empty,
+        if len(self.storage) == 0:
+            # then attempting to pop below would throw an error
+            return
+
+        return self.storage.pop()
+
+    def push_many(self, values):
+        self.storage.extend(values)
+
+    def pop_many(self, n):
+        # deque can't slice, but pop is O(1) on the right end
+        pop = self.storage.pop
+        return [pop() for _ in range(min(n, len(self.storage)))]
+
+    def peek(self):
+        if len(self.storage) == 0:
+            return
+
+        return self.storage[-1]
+
+    def peek_many(self, n):
+        return list(islice(reversed(self.storage), max(n, 0)))
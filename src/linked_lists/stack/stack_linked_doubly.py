@@ -0,0 +1,38 @@
+from src.linked_lists.doubly_linked_list.doubly_linked_list import DoublyLinkedList
+
+
+class Stack:
+    def __init__(self):
+        self.storage = DoublyLinkedList()
+
+    def __len__(self):
+        return len(self.storage)
+
+    def push(self, value):
+        self.storage.add_to_tail(value)
+
+    def pop(self):
+        return self.storage.remove_tail()
+
+    def push_many(self, values):
+        self.storage.add_many_to_tail(values)
+
+    def pop_many(self, n):
+        return self.storage.remove_many_from_tail(n)
+
+    def peek(self):
+        if self.storage.tail is None:
+            return
+
+        return self.storage.tail.value
+
+    def peek_many(self, n):
+        values = []
+        current_node = self.storage.tail
+
+        # walk down from the top of the stack
+        while current_node is not None and len(values) < n:
+            values.append(current_node.value)
+            current_node = current_node.prev
+
+        return values
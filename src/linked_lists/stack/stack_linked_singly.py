@@ -0,0 +1,44 @@
+from itertools import islice
+
+from src.linked_lists.singly_linked_list.singly_linked_list import LinkedList
+
+
+class Stack:
+    def __init__(self):
+        self.size = 0
+        # the top of the stack is the head: a singly linked list can only
+        # remove its tail by walking the whole list, but removing its head is O(1)
+        self.storage = LinkedList()
+
+    def __len__(self):
+        return self.size
+
+    def push(self, value):
+        self.size += 1
+        self.storage.add_to_head(value)
+
+    def pop(self):
+        removed_item = self.storage.remove_head()
+        if removed_item is not None:
+            self.size -= 1
+
+        return removed_item
+
+    def push_many(self, values):
+        values = list(values)
+        self.size += len(values)
+        self.storage.add_many_to_head(values)  # the last value ends up on top
+
+    def pop_many(self, n):
+        removed_items = self.storage.remove_many_from_head(n)
+        self.size -= len(removed_items)
+        return removed_items
+
+    def peek(self):
+        if self.storage.head is None:
+            return
+
+        return self.storage.head.value
+
+    def peek_many(self, n):
+        return list(islice(self.storage, max(n, 0)))  # top n items, top first
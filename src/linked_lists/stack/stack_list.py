@@ -0,0 +1,43 @@
+class Stack:
+    def __init__(self):
+        self.storage = []
+
+    def __len__(self):
+        return len(self.storage)
+
+    def push(self, value):
+        self.storage.append(value)
+
+    def pop(self):
+        # if self.storage list is empty
+        if len(self.storage) == 0:
+            # then return out, the pop() below would throw an error
+            return
+
+        return self.storage.pop()
+
+    def push_many(self, values):
+        self.storage.extend(values)
+
+    def pop_many(self, n):
+        # storage[-0:] would be the WHOLE list, so handle n <= 0 first
+        if n <= 0:
+            return []
+
+        # slice off the top n items in one go, then put them in pop order
+        popped = self.storage[-n:]
+        del self.storage[-n:]
+        popped.reverse()
+        return popped
+
+    def peek(self):
+        if len(self.storage) == 0:
+            return
+
+        return self.storage[-1]
+
+    def peek_many(self, n):
+        if n <= 0:
+            return []
+
+        return self.storage[:-n - 1:-1]  # top n items, top first
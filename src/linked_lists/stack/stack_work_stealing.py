@@ -0,0 +1,189 @@
+"""
+A work-stealing deque is a stack for its owner and a queue for everyone else.
+
+The owner thread pushes and pops tasks at the right end (LIFO), which keeps the
+task it just created (and the data that task touches) hot. Idle threads "steal"
+from the left end (FIFO), where the oldest and usually biggest tasks are.
+
+collections.deque's append, pop and popleft are each atomic, so both ends can be
+used from different threads without a lock.
+
+WorkStealingExecutor gives each worker thread one of these deques.
+"""
+import os
+import random
+import threading
+from collections import deque
+from concurrent import futures
+
+
+class WorkStealingDeque:
+    def __init__(self):
+        self.storage = deque()
+
+    def __len__(self):
+        return len(self.storage)
+
+    def push(self, value):
+        """adds value to the owner's end"""
+
+        self.storage.append(value)
+
+    def pop(self):
+        """removes and returns the newest value (owner side)"""
+
+        # another thread can empty the deque between a length check and the pop,
+        # so just try it
+        try:
+            return self.storage.pop()
+        except IndexError:
+            return None
+
+    def steal(self):
+        """removes and returns the oldest value (thief side)"""
+
+        try:
+            return self.storage.popleft()
+        except IndexError:
+            return None
+
+
+class WorkStealingExecutor:
+    """
+    A thread pool where each worker runs tasks from its own WorkStealingDeque
+
+    Tasks submitted from outside the pool go to a shared FIFO queue. Tasks submitted
+    from a worker (e.g. the subtasks of a fork/join task) go onto that worker's deque,
+    and idle workers steal them. Use join() instead of future.result() to wait on a
+    subtask from inside a task: it keeps running other tasks while it waits, so
+    recursive workloads can't use up every thread just waiting.
+    """
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.deques = [WorkStealingDeque() for _ in range(self.max_workers)]
+        self.injector = WorkStealingDeque()  # tasks submitted from outside the pool
+        self.local = threading.local()  # .index is set on this pool's worker threads
+        self.work_available = threading.Semaphore(0)
+        self.shutting_down = False
+        # held while submitting and while shutting down, so no task slips in after shutdown
+        self.shutdown_lock = threading.Lock()
+
+        self.threads = []
+        for index in range(self.max_workers):
+            thread = threading.Thread(target=self._worker, args=(index,), daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown(wait=True)
+
+    def submit(self, fn, *args, **kwargs):
+        """schedules fn(*args, **kwargs) and returns a concurrent.futures.Future"""
+
+        with self.shutdown_lock:
+            if self.shutting_down:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+
+            future = futures.Future()
+            task = (future, fn, args, kwargs)
+
+            index = getattr(self.local, "index", None)
+            if index is None:
+                self.injector.push(task)
+            else:
+                self.deques[index].push(task)
+
+            self.work_available.release()
+            return future
+
+    def join(self, future):
+        """
+        Waits for future and returns its result
+
+        From a worker thread, other tasks are run while waiting instead of blocking.
+        """
+
+        index = getattr(self.local, "index", None)
+        if index is None:
+            return future.result()
+
+        while not future.done():
+            task = self._find_task(index)
+            if task is None:
+                futures.wait([future], timeout=0.001)
+            else:
+                self._run(task)
+
+        return future.result()
+
+    def shutdown(self, wait=True):
+        """stops accepting tasks; workers exit once every submitted task has run"""
+
+        with self.shutdown_lock:
+            self.shutting_down = True
+        for _ in self.threads:
+            self.work_available.release()
+
+        if wait:
+            for thread in self.threads:
+                thread.join()
+
+    def _find_task(self, index):
+        """returns the next task for the given worker, stealing one if it has to"""
+
+        task = self.deques[index].pop()
+        if task is not None:
+            return task
+
+        task = self.injector.steal()
+        if task is not None:
+            return task
+
+        # start at a random victim so thieves don't all pile onto the same deque
+        start = random.randrange(self.max_workers)
+        for offset in range(self.max_workers):
+            victim = (start + offset) % self.max_workers
+            if victim == index:
+                continue
+            task = self.deques[victim].steal()
+            if task is not None:
+                return task
+
+        return None
+
+    def _run(self, task):
+        future, fn, args, kwargs = task
+        if not future.set_running_or_notify_cancel():
+            return  # future was cancelled before it started
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def _worker(self, index):
+        self.local.index = index
+
+        while True:
+            task = self._find_task(index)
+            if task is not None:
+                self._run(task)
+                continue
+
+            if self.shutting_down:
+                # a task pushed just before shutdown may have landed after the search above
+                task = self._find_task(index)
+                if task is None:
+                    return
+                self._run(task)
+                continue
+
+            # a task can be taken by a helping join() without consuming a permit,
+            # so permits can outnumber tasks; the timeout covers the opposite race
+            self.work_available.acquire(timeout=0.05)
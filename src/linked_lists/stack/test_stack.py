@@ -0,0 +1,95 @@
+import unittest
+from src.linked_lists.stack import stack_deque, stack_list, stack_linked_singly, stack_linked_doubly
+
+
+class StackTests(unittest.TestCase):
+    def setUp(self):
+        # self.stack = stack_deque.Stack()
+        # self.stack = stack_list.Stack()
+        # self.stack = stack_linked_singly.Stack()
+        self.stack = stack_linked_doubly.Stack()
+
+    def test_len_returns_0_for_empty_stack(self):
+        self.assertEqual(len(self.stack), 0)
+
+    def test_len_returns_correct_length_after_push(self):
+        self.assertEqual(len(self.stack), 0)
+        self.stack.push(2)
+        self.assertEqual(len(self.stack), 1)
+        self.stack.push(4)
+        self.assertEqual(len(self.stack), 2)
+        self.stack.push(6)
+        self.stack.push(8)
+        self.stack.push(10)
+        self.stack.push(12)
+        self.stack.push(14)
+        self.stack.push(16)
+        self.stack.push(18)
+        self.assertEqual(len(self.stack), 9)
+
+    def test_empty_pop(self):
+        self.assertIsNone(self.stack.pop())
+        self.assertEqual(len(self.stack), 0)
+
+    def test_pop_respects_order(self):
+        self.stack.push(100)
+        self.stack.push(101)
+        self.stack.push(105)
+        self.assertEqual(self.stack.pop(), 105)
+        self.assertEqual(len(self.stack), 2)
+        self.assertEqual(self.stack.pop(), 101)
+        self.assertEqual(len(self.stack), 1)
+        self.assertEqual(self.stack.pop(), 100)
+        self.assertEqual(len(self.stack), 0)
+        self.assertIsNone(self.stack.pop())
+        self.assertEqual(len(self.stack), 0)
+
+
+class StackBatchTests(unittest.TestCase):
+    backends = [stack_deque, stack_list, stack_linked_singly, stack_linked_doubly]
+
+    def test_push_many_then_pop(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend.__name__):
+                stack = backend.Stack()
+                stack.push(0)
+                stack.push_many(iter([1, 2, 3]))
+                stack.push_many([])
+                self.assertEqual(len(stack), 4)
+                self.assertEqual(stack.pop(), 3)
+                self.assertEqual(stack.pop(), 2)
+                stack.push(4)
+                self.assertEqual(stack.pop(), 4)
+                self.assertEqual(len(stack), 2)
+
+    def test_pop_many(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend.__name__):
+                stack = backend.Stack()
+                self.assertEqual(stack.pop_many(3), [])
+                stack.push_many(range(6))
+                self.assertEqual(stack.pop_many(0), [])
+                self.assertEqual(stack.pop_many(2), [5, 4])
+                self.assertEqual(len(stack), 4)
+                self.assertEqual(stack.pop_many(10), [3, 2, 1, 0])
+                self.assertEqual(len(stack), 0)
+                self.assertIsNone(stack.pop())
+                stack.push(7)
+                self.assertEqual(stack.pop(), 7)
+
+    def test_peek(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend.__name__):
+                stack = backend.Stack()
+                self.assertIsNone(stack.peek())
+                self.assertEqual(stack.peek_many(2), [])
+                stack.push_many([1, 2, 3])
+                self.assertEqual(stack.peek(), 3)
+                self.assertEqual(stack.peek_many(0), [])
+                self.assertEqual(stack.peek_many(2), [3, 2])
+                self.assertEqual(stack.peek_many(5), [3, 2, 1])
+                self.assertEqual(len(stack), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import threading
+import unittest
+from src.linked_lists.stack.stack_work_stealing import WorkStealingDeque, WorkStealingExecutor
+
+
+class WorkStealingDequeTests(unittest.TestCase):
+    def setUp(self):
+        self.deque = WorkStealingDeque()
+
+    def test_empty_pop_and_steal(self):
+        self.assertIsNone(self.deque.pop())
+        self.assertIsNone(self.deque.steal())
+        self.assertEqual(len(self.deque), 0)
+
+    def test_owner_is_lifo_thief_is_fifo(self):
+        self.deque.push(1)
+        self.deque.push(2)
+        self.deque.push(3)
+        self.assertEqual(self.deque.pop(), 3)
+        self.assertEqual(self.deque.steal(), 1)
+        self.assertEqual(len(self.deque), 1)
+        self.assertEqual(self.deque.pop(), 2)
+
+    def test_concurrent_steals_take_each_item_once(self):
+        for i in range(10000):
+            self.deque.push(i)
+
+        taken = []
+
+        def thief():
+            while True:
+                value = self.deque.steal()
+                if value is None:
+                    return
+                taken.append(value)
+
+        threads = [threading.Thread(target=thief) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        while self.deque.pop() is not None:
+            pass
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(set(taken)), len(taken))
+
+
+class WorkStealingExecutorTests(unittest.TestCase):
+    def setUp(self):
+        self.executor = WorkStealingExecutor(max_workers=2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_submit_returns_result(self):
+        future = self.executor.submit(pow, 2, 10)
+        self.assertEqual(future.result(timeout=5), 1024)
+
+    def test_exceptions_reach_the_future(self):
+        future = self.executor.submit(int, "not a number")
+        with self.assertRaises(ValueError):
+            future.result(timeout=5)
+
+    def test_recursive_fork_join(self):
+        executor = self.executor
+
+        def fib(n):
+            if n < 2:
+                return n
+            left = executor.submit(fib, n - 1)
+            right = executor.submit(fib, n - 2)
+            return executor.join(left) + executor.join(right)
+
+        # many more nested joins than threads; helping joins keep this from deadlocking
+        self.assertEqual(executor.submit(fib, 15).result(timeout=30), 610)
+
+    def test_shutdown_runs_pending_tasks(self):
+        futures = [self.executor.submit(abs, -i) for i in range(100)]
+        self.executor.shutdown(wait=True)
+        self.assertEqual([f.result() for f in futures], list(range(100)))
+        with self.assertRaises(RuntimeError):
+            self.executor.submit(abs, 1)
+
+    def test_submits_racing_shutdown_run_or_are_refused(self):
+        accepted = []
+
+        def submit_until_refused():
+            while True:
+                try:
+                    accepted.append(self.executor.submit(abs, -1))
+                except RuntimeError:
+                    return
+
+        submitters = [threading.Thread(target=submit_until_refused) for _ in range(4)]
+        for thread in submitters:
+            thread.start()
+        self.executor.shutdown(wait=True)
+        for thread in submitters:
+            thread.join()
+
+        # every accepted task ran before the workers exited, none was stranded
+        self.assertTrue(all(future.done() for future in accepted))
+
+
+if __name__ == '__main__':
+    unittest.main()
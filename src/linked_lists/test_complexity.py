@@ -0,0 +1,264 @@
+"""
+Checks how the cost of each operation grows with the size of the structure.
+
+Correctness tests can't tell an O(1) pop from an O(n) one, so every case here
+builds its structure at a few geometrically growing sizes, times a fixed number of
+operations at each size (best of several runs, with the garbage collector off),
+and fits the scaling exponent k in time ~ n ** k with a least-squares line through
+log(time) against log(n).
+
+Other processes competing for the CPU can slow down any single run, so the runs
+for the different sizes are interleaved (a slow patch hits every size, not just
+one), and a case that misses its bound is measured again up to RETRIES times
+before it fails.
+
+    * O(1) and O(log n) operations must have k below MAX_SUBLINEAR_EXPONENT
+    * O(n) operations must have k above MIN_LINEAR_EXPONENT, which shows the suite
+      can still tell the difference on this machine
+
+Every operation leaves the structure at the same size (e.g. pop, then push the
+value back) so the size being measured doesn't drift while timing.
+"""
+import gc
+import math
+import time
+import unittest
+
+from src.linked_lists.doubly_linked_list.doubly_linked_list import DoublyLinkedList
+from src.linked_lists.doubly_linked_list.lazy_doubly_linked_list import LazyDoublyLinkedList
+from src.linked_lists.doubly_linked_list.lfu_cache import LFUCache
+from src.linked_lists.doubly_linked_list.sentinel_doubly_linked_list import SentinelDoublyLinkedList
+from src.linked_lists.doubly_linked_list.snapshot_doubly_linked_list import SnapshotDoublyLinkedList
+from src.linked_lists.doubly_linked_list.timer_wheel import TimerWheel
+from src.linked_lists.doubly_linked_list.ttl_cache import TTLCache
+from src.linked_lists.queue import queue_deque, queue_list, queue_linked_singly, queue_linked_doubly, queue_spill
+from src.linked_lists.queue.queue_delay import DelayQueue
+from src.linked_lists.queue.queue_multilevel import MultiLevelQueue
+from src.linked_lists.queue.queue_sliding_window import SlidingWindow
+from src.linked_lists.singly_linked_list.singly_linked_list import LinkedList
+from src.linked_lists.stack import stack_deque, stack_list, stack_linked_singly, stack_linked_doubly
+from src.linked_lists.stack.stack_work_stealing import WorkStealingDeque
+
+SIZES = (1_000, 8_000, 64_000)
+MAX_SUBLINEAR_EXPONENT = 0.5  # O(log n) over these sizes fits to roughly 0.1-0.2
+MIN_LINEAR_EXPONENT = 0.7
+REPEAT = 3
+RETRIES = 2
+
+STACKS = [stack_deque, stack_list, stack_linked_singly, stack_linked_doubly]
+QUEUES = [queue_deque, queue_list, queue_linked_singly, queue_linked_doubly]
+
+
+def scaling_exponent(build, operation, number):
+    """
+    Returns the fitted exponent k in time ~ n ** k for running operation `number` times
+
+    :param build: function taking a size n and returning a structure of that size
+    :param operation: function taking that structure, run once per timed operation
+    :param number: how many operations to time at each size
+    """
+
+    structures = [build(n) for n in SIZES]
+    best = [math.inf] * len(SIZES)
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(REPEAT):
+            for index, structure in enumerate(structures):
+                start = time.perf_counter()
+                for _ in range(number):
+                    operation(structure)
+                best[index] = min(best[index], time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+        # some structures (like the spilling queue) hold files that need cleaning up
+        for structure in structures:
+            if hasattr(structure, "close"):
+                structure.close()
+
+    points = [(math.log(n), math.log(max(seconds, 1e-9))) for n, seconds in zip(SIZES, best)]
+
+    # least-squares slope of log(time) against log(n)
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    return (sum((x - mean_x) * (y - mean_y) for x, y in points)
+            / sum((x - mean_x) ** 2 for x, _ in points))
+
+
+def fitted_exponent(build, operation, number, within_bound):
+    """
+    Returns the scaling exponent, measuring again (up to RETRIES times) while it misses its bound
+
+    A real regression misses the bound every time; a run slowed down by other
+    processes almost never does twice in a row.
+    """
+
+    for _ in range(RETRIES):
+        exponent = scaling_exponent(build, operation, number)
+        if within_bound(exponent):
+            return exponent
+
+    return scaling_exponent(build, operation, number)
+
+
+def filled(structure, add, n):
+    for i in range(n):
+        add(structure, i)
+    return structure
+
+
+def filled_stack(backend):
+    return lambda n: filled(backend.Stack(), backend.Stack.push, n)
+
+
+def filled_queue(backend):
+    return lambda n: filled(backend.Queue(), backend.Queue.enqueue, n)
+
+
+def filled_cache(cache_class, *args):
+    def build(n):
+        cache = cache_class(*args) if args else cache_class(n)
+        for key in range(n):
+            cache.put(key, key)
+        cache.next_key = 0  # lets operations walk the keys in a fixed order
+        return cache
+
+    return build
+
+
+def next_key(cache, n):
+    key = cache.next_key
+    cache.next_key = (key + 7919) % n  # a large prime step visits every key, out of order
+    return key
+
+
+def filled_timer_wheel(n):
+    wheel = TimerWheel(clock=lambda: 0)
+    for i in range(n):
+        wheel.schedule(0.001 * (i % 5000 + 1), print)
+    return wheel
+
+
+def schedule_and_cancel(wheel):
+    wheel.cancel(wheel.schedule(0.001 * (len(wheel) % 5000 + 1), print))
+
+
+def lazy_mark_deleted(dll):
+    # tombstones pile up until the threshold, then each mark_deleted compacts a few
+    dll.mark_deleted(dll.tail)
+    dll.add_to_tail(0)
+
+
+def snapshot_write(dll):
+    # an open reader keeps history alive until it closes, then writers prune it
+    with dll.snapshot():
+        dll.add_to_tail(dll.remove_head())
+
+
+def cycle_ttl_cache(cache):
+    key = next_key(cache, len(cache))
+    cache.get(key)
+    cache.put(key, key)
+
+
+def constant_time_cases():
+    """yields (name, build, operation) for every operation expected to be O(1) amortized"""
+
+    for backend in STACKS:
+        name = backend.__name__.rsplit(".", 1)[-1]
+        yield f"{name}.push+pop", filled_stack(backend), lambda s: s.push(s.pop())
+        yield f"{name}.peek", filled_stack(backend), lambda s: s.peek()
+        yield f"{name}.push_many+pop_many", filled_stack(backend), lambda s: s.push_many(s.pop_many(8))
+
+    for backend in QUEUES:
+        name = backend.__name__.rsplit(".", 1)[-1]
+        yield f"{name}.enqueue+dequeue", filled_queue(backend), lambda q: q.enqueue(q.dequeue())
+        yield f"{name}.peek", filled_queue(backend), lambda q: q.peek()
+        yield (f"{name}.enqueue_many+dequeue_many", filled_queue(backend),
+               lambda q: q.enqueue_many(q.dequeue_many(8)))
+
+    for list_class in [DoublyLinkedList, SentinelDoublyLinkedList]:
+        name = list_class.__name__
+        build = lambda n, list_class=list_class: list_class(range(n))
+        yield f"{name}.add_to_head+remove_tail", build, lambda dll: dll.add_to_head(dll.remove_tail())
+        yield f"{name}.add_to_tail+remove_head", build, lambda dll: dll.add_to_tail(dll.remove_head())
+        yield f"{name}.move_to_front", build, lambda dll: dll.move_to_front(dll.tail)
+        yield f"{name}.move_to_end", build, lambda dll: dll.move_to_end(dll.head)
+        yield f"{name}.delete+insert_after", build, lambda dll: dll.insert_after(dll.head, dll.delete(dll.tail))
+
+    yield "LinkedList.add_to_tail+remove_head", lambda n: LinkedList(list(range(n))), \
+        lambda ll: ll.add_to_tail(ll.remove_head())
+    yield "LinkedList.add_to_head+remove_head", lambda n: LinkedList(list(range(n))), \
+        lambda ll: ll.add_to_head(ll.remove_head())
+
+    yield "LFUCache.get", filled_cache(LFUCache), lambda cache: cache.get(next_key(cache, cache.capacity))
+    yield "LFUCache.put", filled_cache(LFUCache), \
+        lambda cache: cache.put(next_key(cache, cache.capacity), 0)
+    yield "TTLCache.get+put", filled_cache(TTLCache, 3600), cycle_ttl_cache
+
+    yield "MultiLevelQueue.enqueue+dequeue", \
+        lambda n: filled(MultiLevelQueue(levels=8), lambda q, i: q.enqueue(i, i % 8), n), \
+        lambda q: q.enqueue(q.dequeue(), 3)
+
+    yield "SlidingWindow.push+window_max", lambda n: filled(SlidingWindow(max_size=n), SlidingWindow.push, n), \
+        lambda window: (window.push(len(window) % 97), window.window_max(), window.window_min())
+
+    yield "TimerWheel.schedule+cancel", filled_timer_wheel, schedule_and_cancel
+
+    build = lambda n: filled(WorkStealingDeque(), WorkStealingDeque.push, n)
+    yield "WorkStealingDeque.push+pop", build, lambda deque: deque.push(deque.pop())
+    yield "WorkStealingDeque.push+steal", build, lambda deque: deque.push(deque.steal())
+
+    yield "LazyDoublyLinkedList.mark_deleted", lambda n: LazyDoublyLinkedList(range(n)), lazy_mark_deleted
+
+    build = lambda n: SnapshotDoublyLinkedList(range(n))
+    yield "SnapshotDoublyLinkedList.add_to_tail+remove_head", build, snapshot_write
+    yield "SnapshotDoublyLinkedList.move_to_front", build, \
+        lambda dll: dll.move_to_front(dll.tail)
+
+    # the in-memory budget stays the same, so bigger queues spill more of themselves to disk
+    build = lambda n: filled(queue_spill.Queue(max_items=512), queue_spill.Queue.enqueue, n)
+    yield "SpillQueue.enqueue+dequeue", build, lambda q: q.enqueue(q.dequeue())
+
+
+def logarithmic_time_cases():
+    """yields (name, build, operation) for every operation expected to be O(log n)"""
+
+    yield "DelayQueue.enqueue+dequeue", \
+        lambda n: filled(DelayQueue(clock=lambda: 0), lambda q, i: q.enqueue(i, -i), n), \
+        lambda q: q.enqueue(q.dequeue(), 0)
+
+
+def linear_time_cases():
+    """yields (name, build, operation) for operations that are O(n) by design"""
+
+    # a singly linked list has to walk to the node before its tail
+    yield "LinkedList.remove_tail", lambda n: LinkedList(list(range(n))), \
+        lambda ll: ll.add_to_tail(ll.remove_tail())
+    yield "DoublyLinkedList.get_max", lambda n: DoublyLinkedList(range(n)), lambda dll: dll.get_max()
+
+
+class ComplexityTests(unittest.TestCase):
+    def test_constant_time_operations(self):
+        for name, build, operation in constant_time_cases():
+            with self.subTest(operation=name):
+                exponent = fitted_exponent(build, operation, 5_000, lambda k: k < MAX_SUBLINEAR_EXPONENT)
+                self.assertLess(exponent, MAX_SUBLINEAR_EXPONENT)
+
+    def test_logarithmic_time_operations(self):
+        for name, build, operation in logarithmic_time_cases():
+            with self.subTest(operation=name):
+                exponent = fitted_exponent(build, operation, 5_000, lambda k: k < MAX_SUBLINEAR_EXPONENT)
+                self.assertLess(exponent, MAX_SUBLINEAR_EXPONENT)
+
+    def test_linear_time_operations(self):
+        for name, build, operation in linear_time_cases():
+            with self.subTest(operation=name):
+                exponent = fitted_exponent(build, operation, 20, lambda k: k > MIN_LINEAR_EXPONENT)
+                self.assertGreater(exponent, MIN_LINEAR_EXPONENT)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import src.linked_lists as linked_lists
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class PackageTests(unittest.TestCase):
+    def run_python(self, code):
+        """runs code in a fresh interpreter (so nothing is imported yet) and returns its stdout"""
+
+        result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True,
+                                check=True)
+        return result.stdout.strip()
+
+    def test_every_name_resolves(self):
+        for name in linked_lists.__all__:
+            self.assertIsNotNone(getattr(linked_lists, name))
+
+        self.assertIs(linked_lists.DoublyLinkedList,
+                      sys.modules["src.linked_lists.doubly_linked_list.doubly_linked_list"].DoublyLinkedList)
+        self.assertIn("DequeQueue", dir(linked_lists))
+
+    def test_backends_work(self):
+        for name in ["DequeStack", "ListStack", "SinglyLinkedStack", "DoublyLinkedStack"]:
+            stack = getattr(linked_lists, name)()
+            stack.push(1)
+            stack.push(2)
+            self.assertEqual(stack.pop(), 2, name)
+
+        for name in ["DequeQueue", "ListQueue", "SinglyLinkedQueue", "DoublyLinkedQueue"]:
+            queue = getattr(linked_lists, name)()
+            queue.enqueue(1)
+            queue.enqueue(2)
+            self.assertEqual(queue.dequeue(), 1, name)
+
+    def test_unknown_name(self):
+        with self.assertRaises(AttributeError):
+            linked_lists.NotAList
+
+    def test_import_is_lazy(self):
+        code = ("import sys, src.linked_lists; "
+                "print(sorted(m for m in sys.modules if m.startswith('src.linked_lists.')))")
+        self.assertEqual(self.run_python(code), "[]")
+
+        code = ("import sys, src.linked_lists; src.linked_lists.DequeQueue; "
+                "print(sorted(m for m in sys.modules if m.startswith('src.linked_lists.')))")
+        self.assertEqual(self.run_python(code), "['src.linked_lists.queue', 'src.linked_lists.queue.queue_deque']")
+
+    def test_import_time(self):
+        # generous bound so slow machines don't fail; on a laptop this is well under a millisecond
+        code = ("import time; start = time.perf_counter(); import src.linked_lists; "
+                "print(time.perf_counter() - start)")
+        self.assertLess(float(self.run_python(code)), 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()